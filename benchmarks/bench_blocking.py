@@ -0,0 +1,101 @@
+"""Bytes transferred and page-ready time per site, with and without request blocking.
+
+Every sample uses a fresh browser context (cold cache) so the two modes are
+comparable. "ready" is the time until the selector the scraper waits for is
+attached to the DOM; "items" counts the listing items rendered once the page
+settles, which must match between the two modes.
+
+    python benchmarks/bench_blocking.py --runs 3
+    python benchmarks/bench_blocking.py --site youtube --site detroit
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import async_playwright
+from orchestrator import CONTEXT_OPTIONS
+from scrapers.blocking import get_profile
+from scrapers.extract import count
+from scrapers.facebook import VIDEO_CARDS
+
+# site -> (listing URL, selector the scraper waits for, selector of the listing items)
+SITES = {
+    "detroit": ("http://detroit-vod.cablecast.tv/CablecastPublicSite/gallery/3?page=1&site=1", ".show-stub", ".show-stub"),
+    "lansdale": ("https://www.lansdale.org/CivicMedia?CID=2024-Council-Meetings-26", ".video", ".video"),
+    "youtube": ("https://www.youtube.com/@SLCLiveMeetings/streams", "ytd-rich-item-renderer", "ytd-rich-item-renderer"),
+    "regionalwebtv": ("https://www.regionalwebtv.com/fredcc", "iframe", "iframe"),
+    "facebook": ("https://www.facebook.com/DauphinCountyPA/videos", '[role="main"]', VIDEO_CARDS),
+}
+
+
+async def measure(browser, site, blocked):
+    url, ready_selector, item_selector = SITES[site]
+    context = await browser.new_context(**CONTEXT_OPTIONS)
+    if blocked:
+        await get_profile(site).apply(context)
+    page = await context.new_page()
+    transferred = 0
+    aborted = 0
+    pending = []
+
+    async def on_finished(request):
+        nonlocal transferred
+        try:
+            sizes = await request.sizes()
+            transferred += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+        except Exception:
+            pass
+
+    def on_failed(request):
+        nonlocal aborted
+        aborted += 1
+
+    page.on("requestfinished", lambda request: pending.append(asyncio.ensure_future(on_finished(request))))
+    page.on("requestfailed", on_failed)
+    started = time.perf_counter()
+    ready = None
+    items = None
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        await page.wait_for_selector(ready_selector, state="attached", timeout=30000)
+        ready = time.perf_counter() - started
+        # Let the page settle so late requests are counted in both modes
+        await page.wait_for_load_state("networkidle", timeout=15000)
+        items = await count(page, item_selector)
+    except Exception as e:
+        print(f"  [{site}] {'blocked' if blocked else 'full'}: {e}")
+    await asyncio.gather(*pending, return_exceptions=True)
+    await context.close()
+    return transferred, ready, aborted, items
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--site", action="append", choices=sorted(SITES), help="Limit to these sites")
+    args = parser.parse_args()
+    sites = args.site or list(SITES)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        print(f"{'site':14} {'mode':8} {'KiB':>10} {'ready s':>8} {'aborted':>8} {'items':>6}")
+        for site in sites:
+            for blocked in (False, True):
+                samples = [await measure(browser, site, blocked) for _ in range(args.runs)]
+                kib = statistics.median(s[0] for s in samples) / 1024
+                ready_times = [s[1] for s in samples if s[1] is not None]
+                ready = f"{statistics.median(ready_times):8.2f}" if ready_times else f"{'n/a':>8}"
+                aborted = statistics.median(s[2] for s in samples)
+                counts = [s[3] for s in samples if s[3] is not None]
+                items = f"{statistics.median(counts):6.0f}" if counts else f"{'n/a':>6}"
+                print(f"{site:14} {'blocked' if blocked else 'full':8} {kib:10.1f} {ready} {aborted:8.0f} {items}")
+        await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""Offline scraper benchmark against synthetic site fixtures (benchmarks/fixtures.py).
+
+Every scraper class runs against a local HTTP server instead of the live
+municipal sites, at one or more synthetic scales (items per site), and is
+measured for throughput, navigation/item latency and Python peak memory.
+
+    python benchmarks/bench_offline.py --scale 100 1000
+    python benchmarks/bench_offline.py --site detroit --scale 10000
+    python benchmarks/bench_offline.py --site winchester   # needs Chrome + chromedriver for Selenium
+
+`cablecast` is Detroit's gallery read through the Cablecast JSON API
+engine, without a browser; `lansdale-browser` pages Lansdale's listing by
+clicking the pager instead of replaying postbacks over HTTP. Facebook and RegionalWebTV have no fixtures; their markup is too volatile
+to fake usefully.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import FixtureServer
+from scrapers.metrics import METRICS, site_label
+
+# site -> (module, class, base_url path on the fixture server, needs Playwright, constructor options)
+SITES = {
+    "detroit": ("scrapers.detroit", "DetroitScraper", "/CablecastPublicSite", True, {"engine": "browser"}),
+    "cablecast": ("scrapers.detroit", "DetroitScraper", "/CablecastPublicSite", False, {"engine": "api"}),
+    "lansdale": ("scrapers.lansdale", "LansdaleScraper", "/CivicMedia?CID=2024-Council-Meetings-26", True, {"engine": "http"}),
+    "lansdale-browser": ("scrapers.lansdale", "LansdaleScraper", "/CivicMedia?CID=2024-Council-Meetings-26", True,
+                         {"engine": "browser"}),
+    "civicclerk": ("scrapers.civicclerk", "CharlestonCivicClerkScraper", "/", False, {}),
+    "youtube": ("scrapers.youtube", "YouTubeLiveMeetingsScraper", "/@SLCLiveMeetings/streams", True, {}),
+    "winchester": ("scrapers.winchester", "WinchesterVAScraper", "/portal/", False, {}),
+}
+# Selenium downloads chromedriver on first use, so it is opt-in
+DEFAULT_SITES = ["detroit", "cablecast", "lansdale", "civicclerk", "youtube"]
+
+
+def build_scraper(site, context, base_url, start_date, end_date):
+    import importlib
+    module, class_name, _, _, options = SITES[site]
+    cls = getattr(importlib.import_module(module), class_name)
+    if hasattr(cls, "from_base_url"):
+        return cls.from_base_url(context, base_url, start_date, end_date, **options)
+    return cls(context, base_url, start_date, end_date, **options)
+
+
+async def run_site(site, server, browser):
+    fixtures = server.fixtures
+    start_date, end_date = fixtures.first_date.isoformat(), fixtures.last_date.isoformat()
+    context = await browser.new_context() if browser is not None and SITES[site][3] else None
+    METRICS.reset()
+    requests_before = server.requests_served
+    tracemalloc.start()
+    started = time.perf_counter()
+    items = 0
+    error = None
+    try:
+        scraper = build_scraper(site, context, server.url(SITES[site][2]), start_date, end_date)
+        async for _ in scraper.scrape():
+            items += 1
+    except Exception as e:
+        error = e
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if context is not None:
+        await context.close()
+    stats = METRICS.to_json()["sites"].get(site_label(SITES[site][0], server.url(SITES[site][2])), {})
+    return {
+        "items": items,
+        "seconds": elapsed,
+        "items_per_s": items / elapsed if elapsed else 0,
+        "goto_avg": stats.get("goto_seconds", {}).get("avg", 0),
+        "item_avg": stats.get("item_extract_seconds", {}).get("avg", 0),
+        "requests": server.requests_served - requests_before,
+        "peak_mib": peak / 2 ** 20,
+        "error": error,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs="+", default=[100, 1000], help="Items per site")
+    parser.add_argument("--site", action="append", choices=sorted(SITES), help="Limit to these sites")
+    parser.add_argument("--quiet", action="store_true", help="Silence the scrapers' own progress output")
+    args = parser.parse_args()
+    sites = args.site or DEFAULT_SITES
+
+    browser = None
+    playwright = None
+    if any(SITES[site][3] for site in sites):
+        from playwright.async_api import async_playwright
+        playwright = await async_playwright().start()
+        browser = await playwright.chromium.launch(headless=True)
+
+    rows = []
+    try:
+        for scale in args.scale:
+            with FixtureServer(scale) as server:
+                for site in sites:
+                    print(f"[bench] {site} @ {scale} items ...", file=sys.stderr)
+                    if args.quiet:
+                        with open(os.devnull, "w") as devnull:
+                            stdout, sys.stdout = sys.stdout, devnull
+                            try:
+                                result = await run_site(site, server, browser)
+                            finally:
+                                sys.stdout = stdout
+                    else:
+                        result = await run_site(site, server, browser)
+                    rows.append((site, scale, result))
+    finally:
+        if browser is not None:
+            await browser.close()
+            await playwright.stop()
+
+    print(f"\n{'site':11} {'scale':>6} {'items':>6} {'seconds':>8} {'items/s':>8} "
+          f"{'goto ms':>8} {'item ms':>8} {'requests':>8} {'peak MiB':>8}")
+    for site, scale, r in rows:
+        print(f"{site:11} {scale:6d} {r['items']:6d} {r['seconds']:8.2f} {r['items_per_s']:8.1f} "
+              f"{r['goto_avg'] * 1000:8.1f} {r['item_avg'] * 1000:8.1f} {r['requests']:8d} {r['peak_mib']:8.1f}"
+              + (f"  error: {r['error']}" if r["error"] else ""))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""Startup benchmark: eager import of every scraper vs. lazy registry lookup.
+
+Each sample is a fresh interpreter (that is what cron pays for), so the
+numbers include interpreter start-up plus the imports under test.
+
+    python benchmarks/bench_startup.py --runs 20 --url https://charlestonwv.portal.civicclerk.com/
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    # What problem1.py used to do: import every site module up front
+    "eager (all scrapers)": (
+        "import scrapers.detroit, scrapers.lansdale, scrapers.facebook, scrapers.civicclerk, "
+        "scrapers.youtube, scrapers.regionalwebtv, scrapers.winchester"
+    ),
+    # What problem1.py does now: resolve the one URL and import only its module
+    "lazy (registry, single site)": (
+        "import sys\n"
+        "from scrapers.registry import resolve\n"
+        "resolve(sys.argv[1]).load()"
+    ),
+    "baseline (python -c pass)": "pass",
+}
+
+
+def time_scenario(code, url, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code, url], cwd=REPO_ROOT, check=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--url", default="https://charlestonwv.portal.civicclerk.com/")
+    args = parser.parse_args()
+
+    print(f"Startup time over {args.runs} runs for {args.url}")
+    print(f"{'scenario':32} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    for name, code in SCENARIOS.items():
+        samples = time_scenario(code, args.url, args.runs)
+        print(f"{name:32} {statistics.median(samples):10.1f} {min(samples):10.1f} {max(samples):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+"""Synthetic stand-ins for the municipal sites, served from a local HTTP server.
+
+Each site is generated at a given scale (number of meetings/videos) with one
+item per day going back from END_DATE, and is served under the same paths
+the real site uses, so a scraper only needs its base_url pointed here:
+
+    Detroit       /CablecastPublicSite/gallery/3?page=N&site=1,
+                  /cablecastapi/v1/shows/search/advanced, /cablecastapi/v1/shows?ids=...
+    Lansdale      /CivicMedia?CID=...  (ASP.NET postback pagination), /CivicMedia.aspx?VID=N
+    CivicClerk    /v1/Events  ($filter/$orderby/$top/$skip/$count)
+    Winchester    /Services/MeetingsService.svc/meetings, /Portal/MeetingInformation.aspx
+    YouTube       /@SLCLiveMeetings/streams  (infinite scroll), /watch?v=ID
+"""
+import base64
+import hashlib
+import html
+import json
+import re
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+END_DATE = date(2025, 6, 1)
+# "Now" of the generated pages: relative ages ("Streamed 3 weeks ago") are counted from it, not from
+# the day the benchmark runs, so every run serves the same bytes. Scraped later, the ages only
+# read newer than the items are, which never moves a date-aware stop.
+REFERENCE_DATE = END_DATE
+
+DETROIT_PAGE_SIZE = 20
+LANSDALE_PAGE_SIZE = 12
+YOUTUBE_BATCH = 30
+
+
+def _day(index):
+    return END_DATE - timedelta(days=index)
+
+
+def _video_id(index):
+    return base64.urlsafe_b64encode(hashlib.sha1(str(index).encode()).digest())[:11].decode()
+
+
+def _ago(day):
+    """YouTube's rounded relative age of a date, e.g. "3 weeks ago"."""
+    days = (REFERENCE_DATE - day).days
+    for unit, size in (("year", 365), ("month", 30), ("week", 7), ("day", 1)):
+        if days >= size:
+            amount = days // size
+            return f"{amount} {unit}{'s' if amount > 1 else ''} ago"
+    return "today"
+
+
+def _page(body, head=""):
+    return f"<!DOCTYPE html><html><head><meta charset=\"utf-8\">{head}</head><body>{body}</body></html>"
+
+
+class SiteFixtures:
+    """Deterministic content for every site at `scale` items."""
+
+    def __init__(self, scale):
+        self.scale = scale
+        self.first_date = _day(scale - 1)
+        self.last_date = END_DATE
+        # Roughly what a real DataPager page carries
+        self.viewstate = base64.b64encode(hashlib.sha256(b"viewstate").digest() * 64).decode()
+        self._events = None
+        self._video_index = None
+
+    # Detroit Cablecast gallery (newest first)
+    def detroit_gallery(self, page_number):
+        start = (page_number - 1) * DETROIT_PAGE_SIZE
+        stubs = []
+        for i in range(start, min(start + DETROIT_PAGE_SIZE, self.scale)):
+            stubs.append(
+                f'<div class="show-stub"><a href="/CablecastPublicSite/show/{100000 + i}?site=1">'
+                f'<h3>City Council Formal Session {_day(i).strftime("%m-%d-%Y")}</h3></a></div>')
+        return _page(f'<div class="gallery">{"".join(stubs)}</div>')
+
+    # Cablecast JSON API behind the same gallery: show i has VOD 200000 + i
+    def cablecast_search(self, payload):
+        filters = [f for group in payload["savedShowSearch"]["query"]["groups"] for f in group["filters"]]
+        ids = []
+        for i in range(self.scale):
+            event_date = f"{_day(i).isoformat()}T00:00:00"
+            keep = True
+            for f in filters:
+                if f["field"] == "eventDate":
+                    keep &= {
+                        "greaterThanOrEqual": event_date >= f["searchValue"],
+                        "lessThanOrEqual": event_date <= f["searchValue"],
+                    }.get(f["operator"], True)
+            if keep:
+                ids.append(100000 + i)
+        return {"savedShowSearch": {"results": ids}}
+
+    def cablecast_shows(self, show_ids, include_vods):
+        shows, vods = [], []
+        for show_id in show_ids:
+            i = show_id - 100000
+            if not 0 <= i < self.scale:
+                continue
+            shows.append({
+                "id": show_id,
+                "title": f"City Council Formal Session {_day(i).strftime('%m-%d-%Y')}",
+                "cgTitle": f"City Council Formal Session {_day(i).strftime('%m-%d-%Y')}",
+                "eventDate": f"{_day(i).isoformat()}T00:00:00",
+                "vods": [200000 + i],
+            })
+            if include_vods:
+                vods.append({"id": 200000 + i, "show": show_id, "url": f"/vod/{200000 + i}.mp4"})
+        return {"shows": shows, "vods": vods}
+
+    # Lansdale CivicMedia: WebForms page whose pager posts the form back
+    def lansdale_listing(self, page_number, path):
+        pages = max(1, -(-self.scale // LANSDALE_PAGE_SIZE))
+        start = (page_number - 1) * LANSDALE_PAGE_SIZE
+        cards = []
+        for i in range(start, min(start + LANSDALE_PAGE_SIZE, self.scale)):
+            cards.append(f'<div class="video"><a href="/CivicMedia.aspx?VID={5000 + i}">'
+                         f'<h3>Borough Council Meeting #{self.scale - i}</h3></a></div>')
+        # DataPager shows a sliding window of ten numbered links around the current page
+        first = max(1, page_number - 5)
+        pager = []
+        for n in range(first, min(pages, first + 9) + 1):
+            if n == page_number:
+                pager.append(f"<span>{n}</span>")
+            else:
+                target = f"ctl00$MainContent$dpgVideos$ctl{n:02d}"
+                pager.append(f"<a href=\"javascript:__doPostBack('{target}','')\">{n}</a>")
+        body = (
+            f'<form method="post" action="{html.escape(path)}" id="aspnetForm">'
+            f'<input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="">'
+            f'<input type="hidden" name="__EVENTARGUMENT" id="__EVENTARGUMENT" value="">'
+            f'<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{self.viewstate}|{page_number}">'
+            f'<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="ev{page_number}">'
+            f'<div class="videos">{"".join(cards)}</div>'
+            f'<span id="ctl00_MainContent_dpgVideos">{" ".join(pager)}</span>'
+            f'</form>'
+        )
+        # Partial postback like an UpdatePanel: POST the form, swap the body in place
+        script = ("<script>async function __doPostBack(t,a){var f=document.getElementById('aspnetForm');"
+                  "f.__EVENTTARGET.value=t;f.__EVENTARGUMENT.value=a;"
+                  "var r=await fetch(f.action,{method:'POST',body:new URLSearchParams(new FormData(f))});"
+                  "var d=new DOMParser().parseFromString(await r.text(),'text/html');"
+                  "document.body.innerHTML=d.body.innerHTML;}</script>")
+        return _page(body + script)
+
+    def lansdale_detail(self, vid):
+        i = vid - 5000
+        if not 0 <= i < self.scale:
+            return None
+        uploaded = _day(i).strftime("%B %d, %Y")
+        return _page(f'<h1>Borough Council Meeting #{self.scale - i}</h1>'
+                     f'<dl><dt>Uploaded</dt><dd class="first">{uploaded}</dd><dt>Length</dt><dd>02:11:09</dd></dl>')
+
+    # CivicClerk OData API
+    def _civicclerk_all_events(self):
+        if self._events is not None:
+            return self._events
+        events = []
+        for i in range(self.scale):
+            day = _day(i)
+            events.append({
+                "id": 9000 + i,
+                "eventName": f"City Council {day.isoformat()}",
+                "startDateTime": f"{day.isoformat()}T17:00:00Z",
+                "publishedFiles": [
+                    {"fileId": 20000 + 2 * i, "name": f"Agenda {day.isoformat()}", "type": "Agenda"},
+                    {"fileId": 20001 + 2 * i, "name": f"Minutes {day.isoformat()}", "type": "Minutes"},
+                ],
+            })
+        self._events = events
+        return events
+
+    def civicclerk_events(self, query):
+        events = self._civicclerk_all_events()
+        for op, value in re.findall(r"startDateTime (le|ge|lt|gt) (\S+)", query.get("$filter", "")):
+            bound = value.replace(".000", "")
+            keep = {
+                "le": lambda s: s <= bound, "ge": lambda s: s >= bound,
+                "lt": lambda s: s < bound, "gt": lambda s: s > bound,
+            }[op]
+            events = [e for e in events if keep(e["startDateTime"])]
+        if query.get("$orderby", "").startswith("startDateTime asc"):
+            events = events[::-1]
+        select = [field.strip() for field in query.get("$select", "").split(",") if field.strip()]
+        if select:
+            events = [{k: v for k, v in e.items() if k in select} for e in events]
+        total = len(events)
+        skip = int(query.get("$skip", 0))
+        top = int(query.get("$top", 20))
+        result = {"value": events[skip:skip + top]}
+        if query.get("$count") == "true":
+            result["@odata.count"] = total
+        return result
+
+    # Winchester CivicWeb
+    def winchester_meetings(self, from_date, to_date):
+        meetings = []
+        for i in range(self.scale):
+            day = _day(i).isoformat()
+            if from_date <= day <= to_date:
+                meetings.append({"Id": 3000 + i, "Name": f"City Council - 6:00 PM - {day}", "MeetingDate": day})
+        return meetings
+
+    def winchester_detail(self, meeting_id):
+        i = meeting_id - 3000
+        if not 0 <= i < self.scale:
+            return None
+        return _page(
+            f'<iframe id="ctl00_MainContent_MeetingDocument" src="/document/{330000 + i}"></iframe>'
+            f'<a href="/videos/{340000 + i}?ts=0">Watch video</a>')
+
+    # YouTube channel streams tab
+    def youtube_items(self, offset, count):
+        items = []
+        for i in range(offset, min(offset + count, self.scale)):
+            items.append(f'<ytd-rich-item-renderer><a id="video-title-link" href="/watch?v={_video_id(i)}" '
+                         f'title="Council Meeting {_day(i).isoformat()}">Council Meeting</a>'
+                         f'<div id="metadata-line"><span>{i + 7} views</span><span>Streamed {_ago(_day(i))}</span></div>'
+                         f'</ytd-rich-item-renderer>')
+        return "".join(items)
+
+    def youtube_streams(self):
+        # Further batches arrive through a continuation request when the page bottom is reached
+        script = """<script>
+let offset = %d, loading = false;
+window.addEventListener('scroll', async () => {
+  if (loading || window.innerHeight + window.scrollY < document.body.scrollHeight - 800) return;
+  loading = true;
+  const html = await (await fetch('/youtubei/v1/browse?offset=' + offset)).text();
+  if (html) { document.getElementById('contents').insertAdjacentHTML('beforeend', html); offset += %d; }
+  loading = false;
+});
+</script>""" % (YOUTUBE_BATCH, YOUTUBE_BATCH)
+        style = "<style>ytd-rich-item-renderer{display:block;height:120px}</style>"
+        return _page(f'<div id="contents">{self.youtube_items(0, YOUTUBE_BATCH)}</div>{script}', style)
+
+    def youtube_watch(self, video_id):
+        if self._video_index is None:
+            self._video_index = {_video_id(i): i for i in range(self.scale)}
+        i = self._video_index.get(video_id)
+        if i is None:
+            return None
+        streamed = _day(i).strftime("%b %d, %Y")
+        return _page(
+            f'<h1>Council Meeting {_day(i).isoformat()}</h1>'
+            f'<tp-yt-paper-button id="expand">...more</tp-yt-paper-button>'
+            f'<span class="yt-formatted-string">Streamed live on {streamed}</span>')
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    fixtures = None
+    requests_served = 0
+    _count_lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, content_type="text/html; charset=utf-8", status=200):
+        if body is None:
+            status, body = 404, "not found"
+        etag = None
+        if not isinstance(body, str):
+            body, content_type = json.dumps(body), "application/json; charset=utf-8"
+            # API responses carry an ETag and honour If-None-Match, like the real CivicClerk/Winchester APIs
+            etag = '"%s"' % hashlib.sha1(body.encode("utf-8")).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self, form=None, payload=None):
+        with self._count_lock:
+            type(self).requests_served += 1
+        fx = self.fixtures
+        parts = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        path = parts.path
+        if path == "/CablecastPublicSite/gallery/3":
+            return self._send(fx.detroit_gallery(int(query.get("page", 1))))
+        if path == "/cablecastapi/v1/shows/search/advanced" and payload:
+            return self._send(fx.cablecast_search(payload))
+        if path == "/cablecastapi/v1/shows":
+            show_ids = [int(v) for v in parse_qs(parts.query).get("ids", [])]
+            return self._send(fx.cablecast_shows(show_ids, "vod" in query.get("include", "")))
+        if path == "/CivicMedia":
+            page_number = 1
+            if form and form.get("__EVENTTARGET"):
+                page_number = int(re.search(r"ctl(\d+)$", form["__EVENTTARGET"]).group(1))
+            return self._send(fx.lansdale_listing(page_number, self.path))
+        if path == "/CivicMedia.aspx":
+            return self._send(fx.lansdale_detail(int(query.get("VID", -1))))
+        if path == "/v1/Events":
+            return self._send(fx.civicclerk_events(query))
+        if path == "/Services/MeetingsService.svc/meetings":
+            return self._send(fx.winchester_meetings(query.get("from", ""), query.get("to", "9999-12-31")))
+        if path == "/Portal/MeetingInformation.aspx":
+            return self._send(fx.winchester_detail(int(query.get("Id", -1))))
+        if path == "/@SLCLiveMeetings/streams":
+            return self._send(fx.youtube_streams())
+        if path == "/youtubei/v1/browse":
+            return self._send(fx.youtube_items(int(query.get("offset", 0)), YOUTUBE_BATCH))
+        if path == "/watch":
+            return self._send(fx.youtube_watch(query.get("v")))
+        return self._send(None)
+
+    def do_GET(self):
+        self._route()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = self.rfile.read(length).decode("utf-8")
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return self._route(payload=json.loads(data))
+        form = {k: v[0] for k, v in parse_qs(data).items()}
+        self._route(form)
+
+
+class FixtureServer:
+    """Serve SiteFixtures(scale) on 127.0.0.1 from a background thread.
+
+        with FixtureServer(1000) as server:
+            server.url("/v1")
+    """
+
+    def __init__(self, scale, port=0):
+        self.fixtures = SiteFixtures(scale)
+        handler = type("Handler", (FixtureHandler,), {"fixtures": self.fixtures, "requests_served": 0})
+        self.handler = handler
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def requests_served(self):
+        return self.handler.requests_served
+
+    def url(self, path="/"):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
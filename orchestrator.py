@@ -0,0 +1,255 @@
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from urllib.parse import urlparse
+from scrapers.blocking import get_profile
+from scrapers.browser_state import NO_BROWSER_STATE
+from scrapers.checkpoints import NO_CHECKPOINT, media_key
+from scrapers.dedup import NO_DEDUP
+from scrapers.http_cache import NO_CACHE
+from scrapers.metrics import site_metrics
+from scrapers.page_pool import PagePool, DEFAULT_MAX_PAGES, DEFAULT_MAX_NAVIGATIONS
+from scrapers.registry import resolve
+from scrapers.throttle import RateLimiter, NO_RATE_LIMIT, DEFAULT_DETAIL_CONCURRENCY
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_PER_HOST_LIMIT = 2
+DEFAULT_TASK_TIMEOUT = 30 * 60  # seconds per base_url
+
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'locale': 'en-US',
+    'extra_http_headers': {
+        'Accept-Language': 'en-US,en;q=0.9'
+    }
+}
+
+
+class LazyBrowser:
+    """Chromium launched on the first get(), so a run of HTTP-only scrapers never starts it."""
+
+    def __init__(self, browser_type, **launch_options):
+        self.browser_type = browser_type
+        self.launch_options = launch_options
+        self._browser = None
+        self._lock = asyncio.Lock()
+
+    async def get(self):
+        async with self._lock:
+            if self._browser is None:
+                self._browser = await self.browser_type.launch(**self.launch_options)
+        return self._browser
+
+    async def close(self):
+        if self._browser is not None:
+            await self._browser.close()
+
+
+class LazyContext:
+    """Stands in for a site's BrowserContext and opens it on the first call.
+
+    Scrapers call coroutine methods (new_page, cookies, add_cookies, ...) on
+    it as on a BrowserContext; a scraper that never does (the Cablecast API
+    engine, CivicClerk, Winchester) costs no browser, context or routes.
+    """
+
+    def __init__(self, open_context):
+        self._open = open_context
+        self._context = None
+        self._lock = asyncio.Lock()
+
+    async def get(self):
+        async with self._lock:
+            if self._context is None:
+                self._context = await self._open()
+        return self._context
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def forward(*args, **kwargs):
+            context = await self.get()
+            return await getattr(context, name)(*args, **kwargs)
+        return forward
+
+
+class ScrapeOrchestrator:
+    """Run every base_url as its own task on a shared browser.
+
+    Each site gets its own BrowserContext, carrying that site's request
+    blocking profile and page pool, so per-site routing rules and cookies
+    never leak into another scraper. With a BrowserStateStore the context
+    starts from the state that site left behind in the previous run. The
+    context is only opened once the scraper first uses it, and `browser` may
+    be a LazyBrowser, so sites served over plain HTTP never start Chromium.
+
+    Scrapers are async generators; each media goes to `sink` the moment it is
+    yielded, so nothing has to wait for the slowest site to finish.
+
+    A global semaphore caps the number of sites scraped at once, a per-host
+    semaphore keeps us polite to each municipal server, and every task gets its
+    own timeout so one stuck site cannot hold the whole run hostage.
+
+    A job is a base_url or a (base_url, start_date, end_date) tuple; jobs
+    without their own dates use the orchestrator's range.
+    """
+
+    def __init__(self, browser, start_date, end_date, sink, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 per_host_limit=DEFAULT_PER_HOST_LIMIT, task_timeout=DEFAULT_TASK_TIMEOUT, checkpoints=None,
+                 max_pages=DEFAULT_MAX_PAGES, max_navigations=DEFAULT_MAX_NAVIGATIONS, blocking=True, host_limits=None,
+                 dedup=None, http_cache=None, detail_concurrency=DEFAULT_DETAIL_CONCURRENCY, detail_rate=None,
+                 browser_state=None):
+        self.browser = browser
+        self.start_date = start_date
+        self.end_date = end_date
+        self.sink = sink
+        self.checkpoints = checkpoints
+        # Cross-run index: medias emitted by earlier runs are not written again
+        self.dedup = dedup or NO_DEDUP
+        self.http_cache = http_cache or NO_CACHE
+        # Per-site cookies/localStorage (or whole Chromium profiles) carried over from earlier runs
+        self.browser_state = browser_state or NO_BROWSER_STATE
+        self.max_pages = max_pages
+        self.max_navigations = max_navigations
+        self.blocking = blocking
+        self.per_host_limit = per_host_limit
+        # Per-host overrides of per_host_limit, e.g. a worker's share of a host
+        self.host_limits = host_limits or {}
+        self.task_timeout = task_timeout
+        # Detail pages resolved at once per site, and requests/second allowed per host
+        self.detail_concurrency = detail_concurrency
+        self.detail_rate = detail_rate
+        self._rate_limiters = {}
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        self._host_limits = {}
+        self._written = set()
+        self.counts = {}
+
+    def _host_semaphore(self, base_url):
+        host = urlparse(base_url).netloc.lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.host_limits.get(host, self.per_host_limit))
+        return self._host_limits[host]
+
+    def _host_rate_limiter(self, base_url):
+        """The RateLimiter shared by every scraper on base_url's host.
+
+        A worker that got a share of a host's per_host_limit also gets the
+        same share of its rate, so the cap holds across processes.
+        """
+        if not self.detail_rate:
+            return NO_RATE_LIMIT
+        host = urlparse(base_url).netloc.lower()
+        if host not in self._rate_limiters:
+            share = self.host_limits.get(host, self.per_host_limit) / self.per_host_limit
+            self._rate_limiters[host] = RateLimiter(self.detail_rate * share)
+        return self._rate_limiters[host]
+
+    @asynccontextmanager
+    async def site_context(self, spec, base_url):
+        """A LazyContext with the site's persisted state and blocking profile, and a page pool on it."""
+        async with AsyncExitStack() as stack:
+            async def open_context():
+                browser = await self.browser.get() if isinstance(self.browser, LazyBrowser) else self.browser
+                context = await stack.enter_async_context(
+                    self.browser_state.context(browser, base_url, CONTEXT_OPTIONS))
+                # Cache first: the blocking profile's route runs before it and falls back to it
+                await self.http_cache.apply(context)
+                profile = get_profile(spec.profile) if self.blocking else None
+                if profile is not None:
+                    await profile.apply(context)
+                return context
+
+            context = LazyContext(open_context)
+            page_pool = PagePool(context, max_pages=self.max_pages, max_navigations=self.max_navigations, name=base_url)
+            try:
+                yield context, page_pool
+            finally:
+                if page_pool.acquired:
+                    page_pool.report()
+                await page_pool.close()
+
+    def _emit(self, base_url, media, check_index=True):
+        """Write media unless an overlapping date window of base_url, or an earlier run, already did."""
+        key = (base_url, media_key(media))
+        if key in self._written:
+            return False
+        if check_index and self.dedup.is_known(media["url"]):
+            return False
+        self._written.add(key)
+        self.sink.write(base_url, media)
+        self.dedup.remember(base_url, media["url"])
+        return True
+
+    async def scrape(self, base_url, start_date=None, end_date=None):
+        """Stream every media for base_url into the sink, counting them in self.counts."""
+        start_date = start_date or self.start_date
+        end_date = end_date or self.end_date
+        key = (base_url, start_date, end_date)
+        self.counts[key] = 0
+        checkpoint = NO_CHECKPOINT
+        if self.checkpoints is not None:
+            checkpoint = self.checkpoints.for_run(base_url, start_date, end_date)
+        if checkpoint.resumed:
+            # Medias of the interrupted run go out first; the scraper picks up at its cursor
+            print(f"[Orchestrator] Resuming {base_url} from checkpoint")
+            for media in checkpoint.emitted_medias():
+                # Already in the index since the interrupted run, but part of this run's output
+                if self._emit(base_url, media, check_index=False):
+                    self.counts[key] += 1
+        spec = resolve(base_url)
+        if spec is None:
+            print(f"Unknown base_url: {base_url}, skipping.")
+            return
+        async with self.site_context(spec, base_url) as (context, page_pool):
+            scraper = spec.create(context, base_url, start_date, end_date,
+                                  checkpoint=checkpoint, page_pool=page_pool, dedup=self.dedup,
+                                  http_cache=self.http_cache, detail_concurrency=self.detail_concurrency,
+                                  rate_limiter=self._host_rate_limiter(base_url),
+                                  metrics=site_metrics(spec.module, base_url))
+            async for media in scraper.scrape():
+                if checkpoint.is_emitted(media):
+                    continue
+                checkpoint.record_emitted(media)
+                if self._emit(base_url, media):
+                    self.counts[key] += 1
+        # Only a clean finish clears the checkpoint; errors and timeouts keep it for the next run
+        checkpoint.complete()
+
+    async def _run_one(self, job):
+        base_url, start_date, end_date = job if isinstance(job, (tuple, list)) else (job, None, None)
+        start_date = start_date or self.start_date
+        end_date = end_date or self.end_date
+        spec = resolve(base_url)
+        metrics = site_metrics(spec.module if spec else "unknown", base_url)
+        label = base_url if (start_date, end_date) == (self.start_date, self.end_date) \
+            else f"{base_url} [{start_date} .. {end_date}]"
+        # Take the host slot first so a task waiting on a busy host does not
+        # sit on one of the global slots in the meantime.
+        async with self._host_semaphore(base_url):
+            async with self._global_limit:
+                started = asyncio.get_running_loop().time()
+                print(f"[Orchestrator] Starting {label}")
+                try:
+                    await asyncio.wait_for(self.scrape(base_url, start_date, end_date), timeout=self.task_timeout)
+                except asyncio.TimeoutError:
+                    # Medias already yielded stay in the sink
+                    metrics.count("timeouts")
+                    print(f"[Orchestrator] Timed out after {self.task_timeout}s: {label}")
+                except Exception as e:
+                    metrics.count("errors")
+                    print(f"[Orchestrator] Error scraping {label}: {e}")
+                elapsed = asyncio.get_running_loop().time() - started
+                count = self.counts.get((base_url, start_date, end_date), 0)
+                print(f"[Orchestrator] Finished {label} in {elapsed:.1f}s ({count} medias)")
+        return {
+            "base_url": base_url,
+            "start_date": start_date,
+            "end_date": end_date,
+            "count": count
+        }
+
+    async def run(self, jobs):
+        """Scrape all jobs concurrently; returns per-job media counts in input order."""
+        tasks = [asyncio.create_task(self._run_one(job)) for job in jobs]
+        return await asyncio.gather(*tasks)
@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+from dateutil.parser import parse as dateparse
+from scrapers.registry import resolve
+
+WINDOW_UNITS = ("month", "week")
+
+
+def _to_date(value):
+    return value if isinstance(value, date) else dateparse(value).date()
+
+
+def _next_boundary(day, unit):
+    if unit == "week":
+        # Windows start on Mondays
+        return day + timedelta(days=7 - day.weekday())
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def calendar_windows(start_date, end_date, unit="month"):
+    """Split an inclusive range at calendar month/week boundaries.
+
+    Neighbouring windows share their boundary day. Scrapers compare full
+    datetimes against midnight, so disjoint windows would drop anything that
+    happened later on a boundary day; the overlap is removed again when
+    results are merged.
+    """
+    if unit not in WINDOW_UNITS:
+        raise ValueError(f"Unknown window unit: {unit}")
+    start, end = _to_date(start_date), _to_date(end_date)
+    windows = []
+    while True:
+        boundary = _next_boundary(start, unit)
+        if boundary >= end:
+            windows.append((start.isoformat(), end.isoformat()))
+            return windows
+        windows.append((start.isoformat(), boundary.isoformat()))
+        start = boundary
+
+
+def split_date_range(start_date, end_date, parts):
+    """Split an inclusive range into up to `parts` equal, contiguous windows (see calendar_windows)."""
+    start, end = _to_date(start_date), _to_date(end_date)
+    parts = max(1, min(parts, (end - start).days))
+    bounds = [start + timedelta(days=(end - start).days * i // parts) for i in range(parts)] + [end]
+    return [(a.isoformat(), b.isoformat()) for a, b in zip(bounds, bounds[1:])]
+
+
+def plan_jobs(base_urls, start_date, end_date, window=None, shards=1):
+    """Expand base_urls into (base_url, start_date, end_date) jobs.
+
+    Scrapers registered as `windowed` get one job per calendar `window` (or
+    per equal split when `shards` > 1) so a long backfill runs as many
+    independent tasks. Every other scraper walks its source newest-first
+    regardless of the range, so splitting would only repeat that walk; it
+    keeps a single job.
+    """
+    if start_date and end_date and window:
+        windows = calendar_windows(start_date, end_date, window)
+    elif start_date and end_date and shards > 1:
+        windows = split_date_range(start_date, end_date, shards)
+    else:
+        windows = [(start_date, end_date)]
+    jobs = []
+    for base_url in base_urls:
+        spec = resolve(base_url)
+        if spec is not None and spec.windowed:
+            jobs.extend((base_url, window_start, window_end) for window_start, window_end in windows)
+        else:
+            jobs.append((base_url, start_date, end_date))
+    return jobs
@@ -1,91 +1,154 @@
+import argparse
 import asyncio
 import json
 from playwright.async_api import async_playwright
-from scrapers import DetroitScraper, LansdaleScraper, FacebookVideoScraper, CharlestonCivicClerkScraper, YouTubeLiveMeetingsScraper, RegionalWebTVScraper, WinchesterVAScraper
+from orchestrator import LazyBrowser, ScrapeOrchestrator, DEFAULT_MAX_CONCURRENCY, DEFAULT_PER_HOST_LIMIT, DEFAULT_TASK_TIMEOUT
+from sinks import GroupedJsonSink, JsonlSink, compact_jsonl
+from planner import plan_jobs, WINDOW_UNITS
+from workers import WorkerPool
+from scrapers.browser_state import BrowserStateStore, DEFAULT_STATE_TTL
+from scrapers.checkpoints import CheckpointStore
+from scrapers.dedup import DedupIndex
+from scrapers.http_cache import HttpCache, DEFAULT_TTL
+from scrapers.metrics import METRICS
+from scrapers.page_pool import DEFAULT_MAX_PAGES, DEFAULT_MAX_NAVIGATIONS
+from scrapers.throttle import DEFAULT_DETAIL_CONCURRENCY
 
-async def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape meeting metadata for every base_url in the input file.")
+    parser.add_argument('--input', default='input.json', help="Input JSON with start_date, end_date and base_urls")
+    parser.add_argument('--output', default='output.json', help="Where to write the grouped JSON results")
+    parser.add_argument('--jsonl', metavar='PATH',
+                        help="Stream each media to this JSONL file as it is found instead of buffering output.json")
+    parser.add_argument('--compact', action='store_true',
+                        help="With --jsonl, rebuild the grouped --output JSON from the JSONL file at the end")
+    parser.add_argument('--checkpoint', metavar='PATH',
+                        help="SQLite file for resumable crawls; an interrupted base_url continues from its last page/offset")
+    parser.add_argument('--dedup-index', metavar='PATH',
+                        help="SQLite index of medias ingested by earlier runs; known medias are skipped, new ones recorded")
+    parser.add_argument('--http-cache', metavar='DIR',
+                        help="Record responses (pages, API calls) to this directory and replay them while fresh")
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL,
+                        help="Seconds a cached response stays fresh")
+    parser.add_argument('--offline', action='store_true',
+                        help="With --http-cache, serve everything from the cache and never touch the network")
+    parser.add_argument('--browser-state', metavar='DIR',
+                        help="Keep each site's cookies and localStorage in this directory and start the next run from them")
+    parser.add_argument('--persistent-profile', action='store_true',
+                        help="With --browser-state, use a persistent Chromium profile per site (also keeps its disk cache)")
+    parser.add_argument('--state-ttl', type=float, default=DEFAULT_STATE_TTL,
+                        help="Seconds before saved browser state is discarded and rebuilt")
+    parser.add_argument('--metrics-file', metavar='PATH',
+                        help="Write per-site counters and latency histograms at the end (JSON for *.json, else Prometheus text)")
+    parser.add_argument('--max-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help="Maximum number of base_urls scraped at the same time")
+    parser.add_argument('--per-host-limit', type=int, default=DEFAULT_PER_HOST_LIMIT,
+                        help="Maximum number of concurrent tasks against the same host")
+    parser.add_argument('--task-timeout', type=float, default=DEFAULT_TASK_TIMEOUT,
+                        help="Seconds before a single base_url is abandoned")
+    parser.add_argument('--max-pages', type=int, default=DEFAULT_MAX_PAGES,
+                        help="Size of each site's page pool used for detail/iframe pages")
+    parser.add_argument('--page-max-navigations', type=int, default=DEFAULT_MAX_NAVIGATIONS,
+                        help="Recycle a pooled page after this many navigations")
+    parser.add_argument('--detail-concurrency', type=int, default=DEFAULT_DETAIL_CONCURRENCY,
+                        help="Detail pages (e.g. Lansdale upload dates) resolved at the same time per site")
+    parser.add_argument('--detail-rate', type=float,
+                        help="Cap detail page requests to this many per second per host")
+    parser.add_argument('--no-blocking', action='store_true',
+                        help="Load images, fonts, stylesheets and trackers instead of applying per-site blocking profiles")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes, each with its own browser; 1 runs everything in this process")
+    parser.add_argument('--window', choices=WINDOW_UNITS,
+                        help="Split the date range into calendar windows scraped as separate jobs (date-seekable sites only)")
+    parser.add_argument('--date-shards', type=int, default=1,
+                        help="Split the date range into this many equal windows instead of calendar ones")
+    return parser.parse_args(argv)
+
+async def main(argv=None):
+    args = parse_args(argv)
     # Read input from input.json
-    with open('input.json', 'r') as f:
+    with open(args.input, 'r') as f:
         INPUT = json.load(f)
     start_date = INPUT.get("start_date")
     end_date = INPUT.get("end_date")
     base_urls = INPUT["base_urls"]
-    results = []
+    if args.jsonl:
+        sink = JsonlSink(args.jsonl)
+    else:
+        sink = GroupedJsonSink(args.output, base_urls)
+    if args.offline and not args.http_cache:
+        raise SystemExit("--offline needs --http-cache")
+    http_cache = HttpCache(args.http_cache, ttl=args.cache_ttl, offline=args.offline) if args.http_cache else None
+    if args.persistent_profile and not args.browser_state:
+        raise SystemExit("--persistent-profile needs --browser-state")
+    browser_state = BrowserStateStore(args.browser_state, ttl=args.state_ttl,
+                                      persistent=args.persistent_profile) if args.browser_state else None
+    jobs = plan_jobs(base_urls, start_date, end_date, window=args.window, shards=args.date_shards)
+
+    if args.workers > 1:
+        pool = WorkerPool(
+            args.workers, sink, args.per_host_limit,
+            max_concurrency=args.max_concurrency,
+            task_timeout=args.task_timeout,
+            checkpoint=args.checkpoint,
+            dedup_index=args.dedup_index,
+            http_cache=http_cache,
+            max_pages=args.max_pages,
+            max_navigations=args.page_max_navigations,
+            detail_concurrency=args.detail_concurrency,
+            detail_rate=args.detail_rate,
+            browser_state=browser_state,
+            blocking=not args.no_blocking
+        )
+        try:
+            # The parent only merges results; blocking queue reads stay off the event loop
+            await asyncio.to_thread(pool.run, jobs)
+        finally:
+            sink.close()
+    else:
+        await run_in_process(args, jobs, start_date, end_date, sink, http_cache, browser_state)
+        if http_cache:
+            http_cache.report()
 
+    METRICS.report()
+    if args.metrics_file:
+        METRICS.write(args.metrics_file)
+
+    if args.jsonl and args.compact:
+        compact_jsonl(args.jsonl, args.output, base_urls)
+
+async def run_in_process(args, jobs, start_date, end_date, sink, http_cache=None, browser_state=None):
+    checkpoints = CheckpointStore(args.checkpoint) if args.checkpoint else None
+    dedup = DedupIndex(args.dedup_index) if args.dedup_index else None
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-            extra_http_headers={
-                'Accept-Language': 'en-US,en;q=0.9'
-            }
+        # Chromium starts with the first site that needs a page
+        browser = LazyBrowser(p.chromium, headless=True)
+        # Every base_url runs as its own task (and context); the slowest site sets the wall-clock time
+        orchestrator = ScrapeOrchestrator(
+            browser, start_date, end_date, sink,
+            max_concurrency=args.max_concurrency,
+            per_host_limit=args.per_host_limit,
+            task_timeout=args.task_timeout,
+            checkpoints=checkpoints,
+            dedup=dedup,
+            http_cache=http_cache,
+            max_pages=args.max_pages,
+            max_navigations=args.page_max_navigations,
+            detail_concurrency=args.detail_concurrency,
+            detail_rate=args.detail_rate,
+            browser_state=browser_state,
+            blocking=not args.no_blocking
         )
-        for base_url in base_urls:
-            # Use Scraper for Detroit, LansdaleScraper for Lansdale, FacebookVideoScraper for Facebook, CharlestonCivicClerkScraper for Charleston, YouTubeLiveMeetingsScraper for YouTube, RegionalWebTVScraper for Regional Web TV, WinchesterVAScraper for Winchester VA
-            if "detroit-vod.cablecast.tv" in base_url:
-                scraper = DetroitScraper(context, start_date, end_date, [base_url])
-                medias = await scraper.scrape_detroit_vod()
-                results.append({
-                    "base_url": base_url,
-                    "medias": medias
-                })
-            elif "lansdale.org" in base_url:
-                scraper = LansdaleScraper(context, base_url, start_date, end_date)
-                medias = await scraper.scrape_lansdale_videos()
-                results.append({
-                    "base_url": base_url,
-                    "medias": medias
-                })
-            elif "facebook.com/DauphinCountyPA/videos" in base_url:
-                scraper = FacebookVideoScraper(context, base_url)
-                medias = await scraper.scrape_facebook_videos()
-                results.append({
-                    "base_url": base_url,
-                    "medias": medias
-                })
-            elif "charlestonwv.portal.civicclerk.com" in base_url:
-                scraper = CharlestonCivicClerkScraper(context, base_url, start_date, end_date)
-                medias = await scraper.scrape_charleston_civicclerk()
-                results.append({
-                    "base_url": base_url,
-                    "medias": medias
-                })
-            elif "youtube.com/@SLCLiveMeetings/streams" in base_url:
-                scraper = YouTubeLiveMeetingsScraper(context, base_url, start_date, end_date)
-                medias = await scraper.scrape_youtube_live_meetings()
-                results.append({
-                    "base_url": base_url,
-                    "medias": medias
-                })
-            elif "regionalwebtv.com/fredcc" in base_url:
-                scraper = RegionalWebTVScraper(context, base_url, start_date, end_date)
-                medias = await scraper.scrape_regional_webtv()
-                results.append({
-                    "base_url": base_url,
-                    "medias": medias
-                })
-            elif "winchesterva.civicweb.net/portal" in base_url:
-                # Synchronous scraper, run outside async context
-                scraper = WinchesterVAScraper()
-                medias = scraper.scrape_meetings_to_json(start_date, end_date)
-                results.append({
-                    "base_url": base_url,
-                    "medias": medias
-                })
-            else:
-                print(f"Unknown base_url: {base_url}, skipping.")
-                results.append({
-                    "base_url": base_url,
-                    "medias": []
-                })
-        await context.close()
+        try:
+            await orchestrator.run(jobs)
+        finally:
+            # Buffered mode writes output.json here; JSONL mode just closes the stream
+            sink.close()
+            if checkpoints:
+                checkpoints.close()
+            if dedup:
+                dedup.close()
         await browser.close()
 
-    # Write output to output.json
-    with open('output.json', 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    print("Results written to output.json")
-
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,21 @@
+import importlib
+
+# Scraper classes are resolved lazily so `import scrapers` stays cheap; a run that
+# only touches one portal never imports selenium, aiohttp, bs4, ... for the others.
+_LAZY_CLASSES = {
+    "DetroitScraper": "scrapers.detroit",
+    "LansdaleScraper": "scrapers.lansdale",
+    "FacebookVideoScraper": "scrapers.facebook",
+    "CharlestonCivicClerkScraper": "scrapers.civicclerk",
+    "YouTubeLiveMeetingsScraper": "scrapers.youtube",
+    "RegionalWebTVScraper": "scrapers.regionalwebtv",
+    "WinchesterVAScraper": "scrapers.winchester",
+}
+
+__all__ = list(_LAZY_CLASSES)
+
+
+def __getattr__(name):
+    if name in _LAZY_CLASSES:
+        return getattr(importlib.import_module(_LAZY_CLASSES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,156 @@
+import fcntl
+import json
+import os
+import re
+import shutil
+import time
+from contextlib import asynccontextmanager, contextmanager
+from urllib.parse import urlparse
+
+DEFAULT_STATE_TTL = 7 * 24 * 60 * 60  # seconds
+
+# Touched when a persistent profile is created; its age decides when the profile is rebuilt
+_PROFILE_MARKER = ".created"
+
+
+def site_key(base_url):
+    """File-name-safe site identity: the base_url's host."""
+    return re.sub(r"[^a-z0-9.-]", "_", urlparse(base_url).netloc.lower()) or "default"
+
+
+@contextmanager
+def _locked(lock_path):
+    """Hold an exclusive lock on lock_path, shared by every process using the same root."""
+    with open(lock_path, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+class BrowserStateStore:
+    """Per-site browser state kept across runs, so consent banners, login cookies and caches survive.
+
+    Layout under `root`:
+        state/<host>.json          Playwright storage_state (cookies, localStorage)
+        profiles/<host>-<slot>/    Chromium user data dirs, with persistent=True
+
+    By default each site's context starts from its saved storage_state and
+    saves it again when the scrape finishes cleanly. With persistent=True the
+    context is a persistent Chromium profile instead, which also keeps the
+    disk cache (warm JS bundles), IndexedDB and service workers. Two
+    concurrent scrapes of one site use separate profile slots, since Chromium
+    locks a profile to one process.
+
+    A storage_state not saved for `ttl` seconds, or a profile created more
+    than `ttl` seconds ago, is discarded and rebuilt by the next run; expired
+    cookies are dropped on load. State is keyed by host only, so every worker
+    process of a run shares it: writes of a site's state file hold a lock
+    file next to it, and a profile slot stays locked while a context (of
+    any process) runs on it.
+    """
+
+    def __init__(self, root, ttl=DEFAULT_STATE_TTL, persistent=False):
+        self.root = root
+        self.ttl = ttl
+        self.persistent = persistent
+
+    def _expired(self, path):
+        return time.time() - os.path.getmtime(path) > self.ttl
+
+    def state_path(self, key):
+        return os.path.join(self.root, "state", f"{key}.json")
+
+    def load_state(self, key):
+        """The site's saved storage_state without expired cookies, or None if missing or not saved within ttl."""
+        path = self.state_path(key)
+        if not os.path.exists(path):
+            return None
+        if self._expired(path):
+            print(f"[BrowserState] {key}: saved state expired, starting fresh")
+            with _locked(path + ".lock"):
+                if os.path.exists(path) and self._expired(path):
+                    os.remove(path)
+            return None
+        try:
+            # Writers replace the file atomically, so a read needs no lock
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        now = time.time()
+        state["cookies"] = [c for c in state.get("cookies", []) if not 0 < c.get("expires", -1) < now]
+        print(f"[BrowserState] {key}: restored {len(state['cookies'])} cookies")
+        return state
+
+    async def save_state(self, key, context):
+        state = await context.storage_state()
+        path = self.state_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Another worker may be saving the same site; never leave a half-written file for the next run
+        with _locked(path + ".lock"):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+
+    def _acquire_profile(self, key):
+        """Lock the first free profile slot of the site; returns (lock file, profile_dir).
+
+        The slot is free again once the lock file is closed, also when its
+        process dies.
+        """
+        profiles = os.path.join(self.root, "profiles")
+        os.makedirs(profiles, exist_ok=True)
+        slot = 0
+        while True:
+            lock = open(os.path.join(profiles, f"{key}-{slot}.lock"), "w")
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                lock.close()
+                slot += 1
+        profile_dir = os.path.join(profiles, f"{key}-{slot}")
+        marker = os.path.join(profile_dir, _PROFILE_MARKER)
+        if os.path.exists(marker) and self._expired(marker):
+            print(f"[BrowserState] {key}: profile expired, rebuilding")
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        if not os.path.exists(marker):
+            os.makedirs(profile_dir, exist_ok=True)
+            open(marker, "w").close()
+        return lock, profile_dir
+
+    @asynccontextmanager
+    async def context(self, browser, base_url, options):
+        """A BrowserContext for base_url's site, started from its persisted state and saved after a clean scrape."""
+        key = site_key(base_url)
+        slot_lock = None
+        if self.persistent:
+            slot_lock, profile_dir = self._acquire_profile(key)
+            context = await browser.browser_type.launch_persistent_context(profile_dir, headless=True, **options)
+        else:
+            state = self.load_state(key)
+            context = await browser.new_context(storage_state=state, **options) if state \
+                else await browser.new_context(**options)
+        try:
+            yield context
+            if not self.persistent:
+                await self.save_state(key, context)
+        finally:
+            await context.close()
+            if slot_lock is not None:
+                slot_lock.close()
+
+
+class NullBrowserStateStore:
+    """Stand-in used when state is not persisted: every site starts from an empty context."""
+
+    @asynccontextmanager
+    async def context(self, browser, base_url, options):
+        context = await browser.new_context(**options)
+        try:
+            yield context
+        finally:
+            await context.close()
+
+
+NO_BROWSER_STATE = NullBrowserStateStore()
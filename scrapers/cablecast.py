@@ -0,0 +1,124 @@
+import asyncio
+import json
+from urllib.parse import urlencode, urlsplit
+import aiohttp
+from dateutil.parser import parse as dateparse
+from dateutil.tz import UTC
+from .http_cache import NO_CACHE, fetch_aiohttp
+from .metrics import site_metrics
+
+# Show ids per shows request
+PAGE_SIZE = 100
+# Connections kept open to one tenant
+MAX_CONNECTIONS = 4
+
+
+class CablecastApiError(RuntimeError):
+    """The tenant does not expose the Cablecast API (or refused the request)."""
+
+
+def api_root_for(base_url):
+    """Cablecast API root of a PublicSite URL: http://X/CablecastPublicSite -> http://X/cablecastapi/v1."""
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}/cablecastapi/v1"
+
+
+class CablecastApi:
+    """HTTP-only reader of a Cablecast tenant's shows API.
+
+    One advanced show search returns the ids of every show in the date range,
+    newest first; the shows (with their VODs) are then fetched PAGE_SIZE ids
+    per request over a small pooled connector. Shows without a VOD are
+    skipped, like the PublicSite VOD gallery does. Media dicts match the
+    gallery's: the PublicSite show page, the show title and its event date.
+    """
+
+    def __init__(self, base_url, start_date, end_date, site_id=1, http_cache=None, metrics=None):
+        self.base_url = base_url.rstrip('/')
+        self.api_root = api_root_for(base_url)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.site_id = site_id
+        self.http_cache = http_cache or NO_CACHE
+        self.metrics = metrics or site_metrics(__name__)
+
+    def search_query(self):
+        filters = []
+        if self.start_date is not None:
+            filters.append({"field": "eventDate", "operator": "greaterThanOrEqual",
+                            "searchValue": self.start_date.strftime('%Y-%m-%dT00:00:00')})
+        if self.end_date is not None:
+            filters.append({"field": "eventDate", "operator": "lessThanOrEqual",
+                            "searchValue": self.end_date.strftime('%Y-%m-%dT23:59:59')})
+        return {"savedShowSearch": {
+            "query": {"groups": [{"orAnd": "and", "filters": filters}], "orAnd": "and"},
+            "sortOrders": [{"field": "eventDate", "descending": True}],
+        }}
+
+    async def _request(self, session, url, data=None):
+        print(f"Fetching: {url}")
+        self.metrics.count("pages_navigated")
+        with self.metrics.timer("goto_seconds"):
+            response = await fetch_aiohttp(session, url, self.http_cache, data=data,
+                                           headers={"Content-Type": "application/json"} if data else None)
+        if response.status != 200:
+            raise CablecastApiError(f"Failed to fetch {url}: Status {response.status}")
+        try:
+            return response.json()
+        except ValueError:
+            raise CablecastApiError(f"Not a Cablecast API response: {url}")
+
+    async def search_show_ids(self, session):
+        data = await self._request(session, f"{self.api_root}/shows/search/advanced",
+                                   data=json.dumps(self.search_query()))
+        return (data.get("savedShowSearch") or {}).get("results") or []
+
+    async def fetch_shows(self, session, show_ids):
+        """Shows for `show_ids` with their VODs embedded under show["vods"]."""
+        query = urlencode([("ids", show_id) for show_id in show_ids] +
+                          [("include", "vod"), ("page_size", len(show_ids))])
+        data = await self._request(session, f"{self.api_root}/shows?{query}")
+        vods = {vod["id"]: vod for vod in data.get("vods", [])}
+        # New records: the payload itself stays as the API sent it
+        return [{**show, "vods": [vods[vod_id] for vod_id in show.get("vods") or [] if vod_id in vods]}
+                for show in data.get("shows", [])]
+
+    def show_to_media(self, show):
+        """Media dict for one show, or None if it has no VOD or falls outside the range."""
+        if not show.get("vods"):
+            return None
+        title = (show.get("cgTitle") or show.get("title") or "").strip()
+        try:
+            event_date = dateparse(show["eventDate"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if event_date.tzinfo is None:
+            event_date = event_date.replace(tzinfo=UTC)
+        day = event_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if (self.start_date and day < self.start_date) or (self.end_date and day > self.end_date):
+            self.metrics.count("items_filtered")
+            return None
+        return {
+            "url": f"{self.base_url}/show/{show['id']}?site={self.site_id}",
+            "title": title,
+            "date": day.strftime('%Y-%m-%d'),
+            "source_type": "video"
+        }
+
+    async def scrape(self):
+        """Yield the VOD shows inside the date range, newest first."""
+        connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            show_ids = await self.search_show_ids(session)
+            print(f"Cablecast API: {len(show_ids)} shows between {self.start_date.strftime('%Y-%m-%d')} "
+                  f"and {self.end_date.strftime('%Y-%m-%d')}")
+            batches = [show_ids[i:i + PAGE_SIZE] for i in range(0, len(show_ids), PAGE_SIZE)]
+            pages = await asyncio.gather(*(self.fetch_shows(session, batch) for batch in batches))
+        # The search decides the order; the shows endpoint may not keep it
+        by_id = {show["id"]: show for shows in pages for show in shows}
+        for show_id in show_ids:
+            show = by_id.get(show_id)
+            media = self.show_to_media(show) if show else None
+            if media:
+                self.metrics.count("items_found")
+                yield media
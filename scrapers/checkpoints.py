@@ -0,0 +1,147 @@
+import json
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursors (
+    run_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (run_key, name)
+);
+CREATE TABLE IF NOT EXISTS done (
+    run_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (run_key, name, item)
+);
+CREATE TABLE IF NOT EXISTS emitted (
+    run_key TEXT NOT NULL,
+    media_key TEXT NOT NULL,
+    media TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (run_key, media_key)
+);
+"""
+
+
+def media_key(media):
+    """Identity of a media dict inside one run: the same URL can be a document and a video."""
+    return f"{media.get('source_type')}|{media.get('url')}"
+
+
+class CheckpointStore:
+    """SQLite file holding crawl progress for every (base_url, date range) run.
+
+    A run's rows survive crashes and timeouts so the next invocation can
+    resume; they are deleted once that run finishes cleanly.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Winchester reports progress from an executor thread
+        self._lock = threading.Lock()
+        # Worker processes (workers.py) share the file; wait on their write locks instead of failing
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def for_run(self, base_url, start_date, end_date):
+        run_key = f"{base_url}|{start_date}|{end_date}"
+        return Checkpoint(self, run_key)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class Checkpoint:
+    """Progress of one base_url over one date range."""
+
+    def __init__(self, store, run_key):
+        self.store = store
+        self.run_key = run_key
+        self.resumed = bool(
+            store._execute("SELECT 1 FROM cursors WHERE run_key = ? LIMIT 1", (run_key,))
+            or store._execute("SELECT 1 FROM emitted WHERE run_key = ? LIMIT 1", (run_key,))
+        )
+
+    def get(self, name, default=None):
+        """Return the last saved cursor (page, offset, timestamp, ...) or default."""
+        rows = self.store._execute(
+            "SELECT value FROM cursors WHERE run_key = ? AND name = ?", (self.run_key, name))
+        return json.loads(rows[0][0]) if rows else default
+
+    def set(self, name, value):
+        self.store._execute(
+            "INSERT OR REPLACE INTO cursors (run_key, name, value, updated_at) VALUES (?, ?, ?, ?)",
+            (self.run_key, name, json.dumps(value), time.time()))
+
+    def is_done(self, name, item):
+        """True if `item` (a detail URL, meeting id, ...) was fully processed before."""
+        return bool(self.store._execute(
+            "SELECT 1 FROM done WHERE run_key = ? AND name = ? AND item = ?", (self.run_key, name, str(item))))
+
+    def mark_done(self, name, item):
+        self.store._execute(
+            "INSERT OR IGNORE INTO done (run_key, name, item) VALUES (?, ?, ?)", (self.run_key, name, str(item)))
+
+    def is_emitted(self, media):
+        return bool(self.store._execute(
+            "SELECT 1 FROM emitted WHERE run_key = ? AND media_key = ?", (self.run_key, media_key(media))))
+
+    def record_emitted(self, media):
+        self.store._execute(
+            "INSERT OR IGNORE INTO emitted (run_key, media_key, media, seq) "
+            "VALUES (?, ?, ?, (SELECT COUNT(*) FROM emitted WHERE run_key = ?))",
+            (self.run_key, media_key(media), json.dumps(media, ensure_ascii=False), self.run_key))
+
+    def emitted_medias(self):
+        """Medias emitted by the interrupted run, in the order they were yielded."""
+        rows = self.store._execute(
+            "SELECT media FROM emitted WHERE run_key = ? ORDER BY seq", (self.run_key,))
+        return [json.loads(row[0]) for row in rows]
+
+    def complete(self):
+        """Forget this run; the next invocation starts from scratch."""
+        for table in ("cursors", "done", "emitted"):
+            self.store._execute(f"DELETE FROM {table} WHERE run_key = ?", (self.run_key,))
+
+
+class NullCheckpoint:
+    """Stand-in used when checkpointing is off: remembers nothing."""
+
+    resumed = False
+
+    def get(self, name, default=None):
+        return default
+
+    def set(self, name, value):
+        pass
+
+    def is_done(self, name, item):
+        return False
+
+    def mark_done(self, name, item):
+        pass
+
+    def is_emitted(self, media):
+        return False
+
+    def record_emitted(self, media):
+        pass
+
+    def emitted_medias(self):
+        return []
+
+    def complete(self):
+        pass
+
+
+NO_CHECKPOINT = NullCheckpoint()
@@ -0,0 +1,190 @@
+import asyncio
+from collections import deque
+from dateutil.parser import parse as dateparse
+from datetime import datetime
+from urllib.parse import urlparse, urljoin
+import aiohttp
+from dateutil.tz import UTC
+from .checkpoints import NO_CHECKPOINT
+from .http_cache import NO_CACHE, fetch_aiohttp
+from .metrics import site_metrics
+
+PAGE_SIZE = 100
+# Event pages requested at the same time once $count is known
+PARALLEL_PAGES = 4
+# Everything event_to_medias reads; publishedFiles comes back whole
+EVENT_FIELDS = "id,eventName,startDateTime,publishedFiles"
+
+def api_base_for(base_url):
+    """CivicClerk API root for a portal URL: https://X.portal.civicclerk.com/ -> https://X.api.civicclerk.com/v1.
+
+    Any other host (a mirror, the offline benchmark server) is expected to
+    serve the API under <base_url>/v1.
+    """
+    parts = urlparse(base_url)
+    host = parts.netloc.lower()
+    if host.endswith(".portal.civicclerk.com"):
+        return f"{parts.scheme}://{host[:-len('.portal.civicclerk.com')]}.api.civicclerk.com/v1"
+    return urljoin(base_url if base_url.endswith('/') else base_url + '/', 'v1')
+
+
+class CharlestonCivicClerkScraper:
+    def __init__(self, context, base_url, start_date=None, end_date=None, checkpoint=None, api_base=None, http_cache=None,
+                 metrics=None):
+        if start_date is not None and isinstance(start_date, str):
+            start_date = dateparse(start_date)
+        if end_date is not None and isinstance(end_date, str):
+            end_date = dateparse(end_date)
+        # Make start_date and end_date timezone-aware (UTC) if not already
+        if start_date is not None and start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=UTC)
+        if end_date is not None and end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=UTC)
+        self.context = context
+        self.base_url = base_url
+        self.start_date = start_date
+        self.end_date = end_date
+        self.checkpoint = checkpoint or NO_CHECKPOINT
+        self.metrics = metrics or site_metrics(__name__, base_url)
+        self.api_base = api_base or api_base_for(base_url)
+        self.http_cache = http_cache or NO_CACHE
+
+    def date_filter(self, timestamp):
+        """OData $filter for events between start_date and min(end_date, timestamp)."""
+        upper = timestamp
+        if self.end_date is not None:
+            # The snapshot timestamp still caps the range so saved offsets stay valid
+            upper = min(dateparse(timestamp), self.end_date).strftime('%Y-%m-%dT%H:%M:%SZ')
+        clauses = [f"startDateTime le {upper}"]
+        if self.start_date is not None:
+            clauses.append(f"startDateTime ge {self.start_date.strftime('%Y-%m-%dT%H:%M:%SZ')}")
+        return " and ".join(clauses)
+
+    async def fetch_event_page(self, session, timestamp, offset, count=False):
+        """One page of the Events query as parsed JSON; with `count`, also asks for @odata.count."""
+        query_params = {
+            "$filter": self.date_filter(timestamp),
+            "$select": EVENT_FIELDS,
+            "$orderby": "startDateTime desc, eventName desc",
+            "$top": str(PAGE_SIZE),
+            "$skip": str(offset)
+        }
+        if count:
+            query_params["$count"] = "true"
+        query_string = "&".join(f"{k}={aiohttp.helpers.quote(v)}" for k, v in query_params.items())
+        full_url = f"{self.api_base}/Events?{query_string}"
+        print(f"Fetching: {full_url}")
+        self.metrics.count("pages_navigated")
+        with self.metrics.timer("goto_seconds"):
+            response = await fetch_aiohttp(session, full_url, self.http_cache)
+        if response.status != 200:
+            raise RuntimeError(f"Failed to fetch {full_url}: Status {response.status}")
+        return response.json()
+
+    async def iter_event_pages(self, session, timestamp, offset=0):
+        """Yield (offset, events) for each page of events in the date range that started before `timestamp`.
+
+        The first page also returns the total count; the remaining pages are
+        then fetched PARALLEL_PAGES at a time but still yielded in offset
+        order, so checkpointed offsets stay valid.
+        """
+        first = await self.fetch_event_page(session, timestamp, offset, count=True)
+        events = first.get("value", [])
+        if not events:
+            return
+        yield offset, events
+        total = first.get("@odata.count")
+        if total is None:
+            # Server ignored $count: page sequentially until an empty page
+            while True:
+                offset += PAGE_SIZE
+                events = (await self.fetch_event_page(session, timestamp, offset)).get("value", [])
+                if not events:
+                    return
+                yield offset, events
+        offsets = deque(range(offset + PAGE_SIZE, total, PAGE_SIZE))
+        pending = deque()
+        try:
+            while offsets or pending:
+                while offsets and len(pending) < PARALLEL_PAGES:
+                    page_offset = offsets.popleft()
+                    pending.append((page_offset, asyncio.ensure_future(
+                        self.fetch_event_page(session, timestamp, page_offset))))
+                page_offset, task = pending.popleft()
+                events = (await task).get("value", [])
+                if not events:
+                    return
+                yield page_offset, events
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def fetch_events_paginated(self, session, timestamp):
+        all_events = []
+        try:
+            async for _, events in self.iter_event_pages(session, timestamp):
+                all_events.extend(events)
+        except Exception as e:
+            print(f"Error fetching events: {e}")
+        return all_events
+
+    def event_to_medias(self, event):
+        """Media dicts for the published files of one event, or [] if it is outside the range."""
+        title = event.get("eventName") or event.get("name")
+        upload_date = event.get("startDateTime")
+        published_files = event.get("publishedFiles") or []
+        # Date filtering
+        dt = None
+        if upload_date:
+            try:
+                dt = dateparse(upload_date)
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=UTC)
+            except Exception:
+                dt = None
+        # Only filter if both start_date and end_date are provided and dt is valid
+        if self.start_date and self.end_date:
+            if not dt or not (self.start_date <= dt <= self.end_date):
+                self.metrics.count("items_filtered")
+                return []
+        medias = []
+        for file in published_files:
+            file_id = file.get("fileId") or file.get("id")
+            file_name = file.get("name")
+            if file_id and file_id != 0:
+                file_url = f"{self.api_base}/Meetings/GetMeetingFileStream(fileId={file_id},plainText=false)"
+                medias.append({
+                    "url": file_url,
+                    "title": file_name or title or "PDF Media",
+                    "date": upload_date[:10] if upload_date else None,
+                    "source_type": "pdf"
+                })
+        return medias
+
+    async def scrape(self):
+        """Yield published files of events inside the date range, page by page."""
+        print(f"\nScraping Charleston CivicClerk media from {self.base_url}")
+        seen_urls = set()
+        # Reuse an interrupted run's listing snapshot so its saved offset still lines up. A new
+        # snapshot is floored to the hour so reruns within the hour send identical queries
+        # (and hit the HTTP cache).
+        timestamp = self.checkpoint.get('timestamp') or datetime.utcnow().strftime('%Y-%m-%dT%H:00:00Z')
+        self.checkpoint.set('timestamp', timestamp)
+        offset = self.checkpoint.get('offset', 0)
+        if offset:
+            print(f"Resuming from checkpoint at offset {offset}")
+        async with aiohttp.ClientSession() as session:
+            async for offset, events in self.iter_event_pages(session, timestamp, offset):
+                for event in events:
+                    for media in self.event_to_medias(event):
+                        if media["url"] in seen_urls:
+                            continue
+                        seen_urls.add(media["url"])
+                        self.metrics.count("items_found")
+                        print(f"✓ Added: {media['title']} | {media['url']} | {event.get('startDateTime')}")
+                        yield media
+                self.checkpoint.set('offset', offset + len(events))
+        print(f"\nTotal Charleston CivicClerk media found: {len(seen_urls)}")
+
+    async def scrape_charleston_civicclerk(self):
+        return [media async for media in self.scrape()]
@@ -0,0 +1,44 @@
+import re
+from datetime import datetime, timedelta
+from dateutil.tz import UTC
+
+# Shortest span each unit can stand for, so an estimate errs towards the present
+_UNITS = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(weeks=4),
+    "year": timedelta(days=365),
+}
+_AGO = re.compile(r"\b(\d+|an?|one)\s+(second|minute|hour|day|week|month|year)s?\s+ago\b", re.I)
+_YESTERDAY = re.compile(r"\byesterday\b", re.I)
+_JUST_NOW = re.compile(r"\b(just now|today)\b", re.I)
+
+
+def estimate_date(text, now=None):
+    """Latest date a relative phrase in text ("Streamed 3 weeks ago", "yesterday") allows; None without one.
+
+    "3 weeks ago" covers anything 3 to 4 weeks back, so its newest end is
+    returned, with a month counted as 4 weeks and a year as 365 days: an
+    item is never judged older than it can really be.
+    """
+    if not text:
+        return None
+    now = now or datetime.now(UTC)
+    match = _AGO.search(text)
+    if match:
+        amount, unit = match.groups()
+        amount = int(amount) if amount.isdigit() else 1
+        return now - amount * _UNITS[unit.lower()]
+    if _YESTERDAY.search(text):
+        return now - _UNITS["day"]
+    if _JUST_NOW.search(text):
+        return now
+    return None
+
+
+def before_start(date, start_date):
+    """True when a scroll that has reached `date` (newest-first feed) has passed start_date."""
+    return date is not None and start_date is not None and date < start_date
@@ -0,0 +1,140 @@
+import hashlib
+import math
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    key TEXT PRIMARY KEY,
+    base_url TEXT NOT NULL,
+    first_seen REAL NOT NULL
+);
+"""
+
+# Query parameters that never change what a URL points at
+_TRACKING_PARAMS = re.compile(r"^(utm_.*|fbclid|gclid|si|feature|ts)$", re.IGNORECASE)
+
+# Content ids that outlive URL changes (extra query params, path variants, ...): (kind, pattern, global).
+# Only YouTube ids are global; the others are numbered per tenant, so their keys carry the host.
+_CONTENT_IDS = (
+    ("civicclerk", re.compile(r"fileId=(\d+)", re.IGNORECASE), False),
+    ("youtube", re.compile(r"(?:[?&]v=|youtu\.be/|/shorts/|/live/)([A-Za-z0-9_-]{11})"), True),
+    ("lansdale", re.compile(r"CivicMedia\.aspx\?VID=(\d+)", re.IGNORECASE), False),
+    ("civicweb-document", re.compile(r"civicweb\.net/document/(\d+)", re.IGNORECASE), False),
+    ("swagit", re.compile(r"swagit\.com/videos/(\d+)", re.IGNORECASE), False),
+)
+
+
+def normalize_url(url):
+    """Canonical form of a media URL: lowercase scheme/host, no fragment,
+    no tracking parameters, sorted query, no trailing slash."""
+    parts = urlsplit(url.strip())
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not _TRACKING_PARAMS.match(k))
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+def identity_keys(url):
+    """Every key a URL is known under: its normalized form plus any content ids in it.
+
+    Per-tenant ids are scoped by host (`civicclerk:<host>:<id>`); global ones are not (`youtube:<id>`).
+    """
+    keys = [f"url:{normalize_url(url)}"]
+    host = urlsplit(url.strip()).netloc.lower()
+    for kind, pattern, is_global in _CONTENT_IDS:
+        match = pattern.search(url)
+        if match:
+            keys.append(f"{kind}:{match.group(1)}" if is_global else f"{kind}:{host}:{match.group(1)}")
+    return keys
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings; no false negatives."""
+
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class DedupIndex:
+    """Media seen by earlier runs, kept in SQLite across runs.
+
+    Lookups go to an in-memory Bloom filter loaded at start-up, so the common
+    case (a new item) never touches the disk; only possible hits are
+    confirmed in SQLite.
+    """
+
+    def __init__(self, path, error_rate=0.001):
+        self.path = path
+        # Scrapers may call in from executor threads, worker processes share the file
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        keys = [row[0] for row in self._conn.execute("SELECT key FROM seen")]
+        # Room for the index to double during this run before the error rate degrades
+        self._bloom = BloomFilter(max(2 * len(keys), 100000), error_rate)
+        for key in keys:
+            self._bloom.add(key)
+        self.hits = 0
+        self.added = 0
+        print(f"[Dedup] Loaded {len(keys)} known keys from {path}")
+
+    def is_known(self, url):
+        """True if this URL, or content with the same id, was emitted by an earlier run."""
+        candidates = [key for key in identity_keys(url) if key in self._bloom]
+        if not candidates:
+            return False
+        placeholders = ",".join("?" * len(candidates))
+        with self._lock:
+            row = self._conn.execute(f"SELECT 1 FROM seen WHERE key IN ({placeholders}) LIMIT 1", candidates).fetchone()
+        if row:
+            self.hits += 1
+        return bool(row)
+
+    def remember(self, base_url, url):
+        now = time.time()
+        keys = identity_keys(url)
+        with self._lock:
+            self._conn.executemany("INSERT OR IGNORE INTO seen (key, base_url, first_seen) VALUES (?, ?, ?)",
+                                   [(key, base_url, now) for key in keys])
+        for key in keys:
+            self._bloom.add(key)
+        self.added += 1
+
+    def close(self):
+        print(f"[Dedup] {self.hits} known items skipped, {self.added} new items recorded")
+        with self._lock:
+            self._conn.close()
+
+
+class NullDedupIndex:
+    """Stand-in used when no dedup index is configured: everything is new."""
+
+    def is_known(self, url):
+        return False
+
+    def remember(self, base_url, url):
+        pass
+
+
+NO_DEDUP = NullDedupIndex()
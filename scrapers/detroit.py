@@ -0,0 +1,216 @@
+import asyncio
+import re
+from collections import deque
+from urllib.parse import urljoin
+from dateutil.parser import parse as dateparse
+from datetime import datetime
+from dateutil.tz import UTC
+from .cablecast import CablecastApi, CablecastApiError
+from .checkpoints import NO_CHECKPOINT
+from .extract import extract_all
+from .metrics import site_metrics
+from .page_pool import PagePool
+
+class DetroitScraper:
+    """Cablecast PublicSite scraper (Detroit and other Cablecast tenants).
+
+    engine="browser" reads the VOD gallery pages in Chromium; engine="api"
+    queries the tenant's JSON API over plain HTTP (scrapers/cablecast.py)
+    and only falls back to the gallery if the API is unavailable and a
+    browser context was given.
+    """
+
+    def __init__(self, context, start_date, end_date, base_urls, checkpoint=None, page_pool=None,
+                 engine="browser", http_cache=None, metrics=None):
+        if isinstance(start_date, str):
+            start_date = dateparse(start_date)
+        if isinstance(end_date, str):
+            end_date = dateparse(end_date)
+        # Make start_date and end_date timezone-aware (UTC) if not already
+        if start_date is not None and start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=UTC)
+        if end_date is not None and end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=UTC)
+        self.context = context
+        self.start_date = start_date
+        self.end_date = end_date
+        self.base_urls = base_urls
+        self.checkpoint = checkpoint or NO_CHECKPOINT
+        # A single tenant gets its host in the label; the orchestrator passes its own metrics
+        self.metrics = metrics or site_metrics(__name__, base_urls[0] if len(base_urls) == 1 else None)
+        self.pages = page_pool or PagePool(context)
+        self.engine = engine
+        self.http_cache = http_cache
+        # Gallery pages read by the locator, kept so the scrape does not load them twice
+        self._gallery = {}
+
+    @classmethod
+    def from_base_url(cls, context, base_url, start_date=None, end_date=None, **options):
+        return cls(context, start_date, end_date, [base_url], **options)
+
+    async def read_gallery_page(self, page, base_url, page_number):
+        """Open one gallery page; returns (title, href, meeting_date) per stub, [] past the last page.
+
+        meeting_date is None when the title carries no parseable date.
+        """
+        url = f"{base_url}?page={page_number}&site=1"
+        print(f"Navigating to: {url}")
+        await self.metrics.goto(page, url, wait_until='domcontentloaded', timeout=60000)
+        items = []
+        for stub in await extract_all(page, '.show-stub', {"href": "a@href", "title": "h3"}):
+            href, title = stub["href"], stub["title"]
+            if not href or not title:
+                continue
+            title = title.strip()
+            href = urljoin(url, href)
+            # Extract date from title
+            meeting_date = None
+            date_match = re.findall(r'(\d{2}-\d{2}-\d{4})', title)
+            if date_match:
+                try:
+                    month, day, year = map(int, date_match[-1].split('-'))
+                    # Aware like start_date/end_date so the comparisons below work
+                    meeting_date = datetime(year, month, day, tzinfo=UTC)
+                except Exception:
+                    pass
+            items.append((title, href, meeting_date))
+        return items
+
+    async def gallery_page(self, base_url, page_number):
+        """read_gallery_page on a pooled page, remembered until the scrape consumes it."""
+        if page_number not in self._gallery:
+            async with self.pages.page() as page:
+                self._gallery[page_number] = await self.read_gallery_page(page, base_url, page_number)
+        return self._gallery[page_number]
+
+    async def page_satisfies(self, base_url, page_number, predicate):
+        """`predicate` on the page's dates; True past the end of the gallery.
+
+        A page whose titles carry no date cannot decide, so the next dated
+        (or empty) page is read in its place.
+        """
+        while True:
+            items = await self.gallery_page(base_url, page_number)
+            if not items:
+                return True
+            dates = [d for _, _, d in items if d is not None]
+            if dates:
+                return predicate(dates)
+            page_number += 1
+
+    async def first_page_where(self, base_url, page_number, predicate):
+        """Smallest page >= page_number whose dates satisfy `predicate`.
+
+        `predicate` must be monotonic over the newest-first gallery (false,
+        ..., false, true, ...). Gallops page_number+1, +2, +4, ... until a
+        probe satisfies it, then binary-searches the last gap, so reaching
+        page N costs O(log N) page loads.
+        """
+        if await self.page_satisfies(base_url, page_number, predicate):
+            return page_number
+        below, step = page_number, 1
+        while True:
+            probe = page_number + step
+            if await self.page_satisfies(base_url, probe, predicate):
+                break
+            below, step = probe, step * 2
+        while probe - below > 1:
+            middle = (below + probe) // 2
+            if await self.page_satisfies(base_url, middle, predicate):
+                probe = middle
+            else:
+                below = middle
+        return probe
+
+    async def locate_page_range(self, base_url, first_page=1):
+        """(first, stop): gallery pages first..stop-1 are the only ones that can hold the date range.
+
+        Pages past the end of the gallery have no stubs and count as both
+        reaching and passing the window; undated pages take the verdict of
+        the next dated page (see page_satisfies).
+        """
+        first = await self.first_page_where(
+            base_url, first_page, lambda dates: min(dates) <= self.end_date)
+        stop = await self.first_page_where(
+            base_url, first, lambda dates: max(dates) < self.start_date)
+        print(f"Date range {self.start_date.strftime('%Y-%m-%d')} - {self.end_date.strftime('%Y-%m-%d')} "
+              f"is on gallery pages {first}-{stop - 1} ({len(self._gallery)} pages probed)")
+        return first, stop
+
+    async def iter_gallery_pages(self, base_url, first, stop):
+        """Yield (page_number, items) for pages first..stop-1 in order, loading up to max_pages at once."""
+        page_numbers = deque(range(first, stop))
+        pending = deque()
+        try:
+            while page_numbers or pending:
+                while page_numbers and len(pending) < self.pages.max_pages:
+                    page_number = page_numbers.popleft()
+                    pending.append((page_number, asyncio.ensure_future(self.gallery_page(base_url, page_number))))
+                page_number, task = pending.popleft()
+                yield page_number, await task
+                self._gallery.pop(page_number, None)
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def scrape(self):
+        """Yield videos inside the date range from the configured engine."""
+        if self.engine == "api":
+            api = CablecastApi(self.base_urls[0], self.start_date, self.end_date,
+                               http_cache=self.http_cache, metrics=self.metrics)
+            yielded = False
+            try:
+                async for media in api.scrape():
+                    yielded = True
+                    yield media
+                return
+            except CablecastApiError as e:
+                if yielded or self.context is None:
+                    raise
+                print(f"Cablecast API unavailable ({e}); reading the gallery pages instead")
+        async for media in self.scrape_gallery():
+            yield media
+
+    async def scrape_gallery(self):
+        """Yield gallery videos inside the date range as soon as they are parsed."""
+        print(f"\nSearching for videos between {self.start_date.strftime('%Y-%m-%d')} and {self.end_date.strftime('%Y-%m-%d')}")
+        found = 0
+        base_url = self.base_urls[0] + "/gallery/3"
+        # Resume after the last gallery page a previous run finished
+        resume_page = self.checkpoint.get('page', 0) + 1
+        if resume_page > 1:
+            print(f"Resuming from checkpoint at page {resume_page}")
+        try:
+            first, stop = await self.locate_page_range(base_url, resume_page)
+            async for current_page, items in self.iter_gallery_pages(base_url, first, stop):
+                print(f"\nProcessing page {current_page}...")
+                print(f"Found {len(items)} videos on page {current_page}")
+                for title, href, meeting_date in items:
+                    if meeting_date is None:
+                        print(f"No date found in title: {title}")
+                        continue
+
+                    print(f"Title: {title}")
+                    print(f"URL: {href}")
+                    print(f"Date: {meeting_date.strftime('%Y-%m-%d')}")
+
+                    if self.start_date <= meeting_date <= self.end_date:
+                        found += 1
+                        self.metrics.count("items_found")
+                        print("✓ Added to results")
+                        yield {
+                            "url": href,
+                            "title": title,
+                            "date": meeting_date.strftime('%Y-%m-%d'),
+                            "source_type": "video"
+                        }
+                    else:
+                        self.metrics.count("items_filtered")
+                        print("× Date outside range")
+                self.checkpoint.set('page', current_page)
+        finally:
+            self._gallery.clear()
+            print(f"\nTotal videos found: {found}")
+
+    async def scrape_detroit_vod(self):
+        return [media async for media in self.scrape()]
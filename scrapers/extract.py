@@ -0,0 +1,49 @@
+_EXTRACT_JS = """([itemSelector, fields]) => Array.from(document.querySelectorAll(itemSelector), item => {
+    const out = {};
+    for (const [name, alternatives] of fields) {
+        out[name] = null;
+        for (const [selector, attribute] of alternatives) {
+            const el = selector ? item.querySelector(selector) : item;
+            if (!el) continue;
+            const value = attribute ? el.getAttribute(attribute) : el.textContent;
+            if (value && value.trim()) { out[name] = value; break; }
+        }
+    }
+    return out;
+})"""
+
+_COUNT_JS = "selector => document.querySelectorAll(selector).length"
+
+
+def parse_fields(fields):
+    """{"name": spec or [specs]} -> [[name, [[selector, attribute or None], ...]], ...] for the page script."""
+    parsed = []
+    for name, spec in fields.items():
+        alternatives = []
+        for alternative in (spec if isinstance(spec, (list, tuple)) else [spec]):
+            selector, _, attribute = alternative.partition('@')
+            alternatives.append([selector.strip(), attribute.strip() or None])
+        parsed.append([name, alternatives])
+    return parsed
+
+
+async def extract_all(page, item_selector, fields):
+    """One dict per element matching item_selector on `page` (a Page or Frame), read in one round trip.
+
+    Reading a listing with query_selector/get_attribute/text_content costs a
+    browser round trip per call, 4-6 per item; this costs one per listing:
+
+        items = await extract_all(page, '.show-stub', {"href": "a@href", "title": "h3"})
+        # [{"href": "/show/1?site=1", "title": "City Council 01-02-2025"}, ...]
+
+    A field spec is "selector@attribute", "selector" (its text content),
+    "@attribute" (of the item itself) or "" (the item's own text); the
+    selector is matched inside the item. A list of specs is tried in order
+    and the first non-blank value wins. Fields that match nothing are None.
+    """
+    return await page.evaluate(_EXTRACT_JS, [item_selector, parse_fields(fields)])
+
+
+async def count(page, selector):
+    """Number of elements matching selector, without creating element handles."""
+    return await page.evaluate(_COUNT_JS, selector)
@@ -0,0 +1,416 @@
+import asyncio
+import itertools
+import json
+import os
+from dateutil.parser import parse as dateparse
+from dateutil.tz import UTC
+from .checkpoints import NO_CHECKPOINT
+from .metrics import site_metrics
+from .dates import before_start, estimate_date
+from .extract import count
+from .scroll import InfiniteScroll
+from .waits import Waits
+from .facebook_graphql import EMBEDDED_JSON_JS, GRAPHQL_PATH, GraphqlVideos, is_graphql
+
+# Present once logged in; a context restored with it needs no facebook_cookies.json
+LOGIN_COOKIE = 'c_user'
+# Seconds to back off after a failed goto and reload, doubled per attempt: there is no page
+# event to wait on, only a server that refused or dropped the navigation
+NAV_RETRY_BACKOFF = 4
+VIDEO_CARDS = 'div.x9f619.x1r8uery.x1iyjqo2.x6ikm8r.x10wlt62.x1n2onr6'
+# Waits.until check: the number of cards with a link or text once at least 70% of them have one
+CARDS_POPULATED = """const cards = document.querySelectorAll(arg);
+    let loaded = 0;
+    for (const card of cards) {
+        if (card.querySelector('a[href]') || card.textContent.trim().length > 20) loaded++;
+    }
+    return cards.length && loaded >= cards.length * 0.7 ? loaded : null;"""
+# Scroll the window and every scrollable feed container to the bottom, then fire the events lazy loaders listen to
+FEED_SCROLL_JS = """() => {
+    window.scrollTo(0, document.body.scrollHeight);
+    const scrollableElements = [
+        document.querySelector('[role="main"]'),
+        document.querySelector('[data-pagelet="ProfileTimeline"]'),
+        document.querySelector('div[style*="overflow"]'),
+        document.documentElement
+    ];
+    scrollableElements.forEach(el => {
+        if (el && el.scrollHeight > el.clientHeight) {
+            el.scrollTop = el.scrollHeight;
+        }
+    });
+    ['scroll', 'wheel', 'touchmove'].forEach(eventType => {
+        window.dispatchEvent(new Event(eventType, { bubbles: true }));
+    });
+}"""
+CARD_TITLE = 'span.x1lliihq.x6ikm8r.x10wlt62.x1n2onr6'
+# Reads the cards not harvested yet and marks them; a card without its link yet is left for the next harvest
+HARVEST_CARDS = """([cards, titles]) => {
+    const harvested = [];
+    for (const card of document.querySelectorAll(cards + ':not([data-harvested])')) {
+        const link = card.querySelector('a[href*="/videos/"]');
+        if (!link) continue;
+        card.setAttribute('data-harvested', '');
+        const title = link.querySelector(titles) || card.querySelector(titles);
+        // The card text carries the relative age ("3 weeks ago") used to stop scrolling
+        harvested.push({url: link.href, title: title ? title.textContent.trim() : null,
+                        text: card.textContent.slice(0, 500)});
+    }
+    return harvested;
+}"""
+
+class FacebookVideoScraper:
+    """Videos of a public Facebook page's videos tab.
+
+    engine="graphql" reads the videos (with their creation times) from the
+    page's embedded Relay data and the /api/graphql/ responses its scrolling
+    triggers, and only reads the rendered cards if those yield nothing;
+    engine="dom" always reads the cards.
+    """
+
+    def __init__(self, context, base_url, start_date=None, end_date=None, checkpoint=None, engine="graphql", metrics=None):
+        if start_date is not None and isinstance(start_date, str):
+            start_date = dateparse(start_date)
+        if end_date is not None and isinstance(end_date, str):
+            end_date = dateparse(end_date)
+        # Make start_date and end_date timezone-aware (UTC) if not already
+        if start_date is not None and start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=UTC)
+        if end_date is not None and end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=UTC)
+        self.context = context
+        self.base_url = base_url
+        self.start_date = start_date
+        self.end_date = end_date
+        self.checkpoint = checkpoint or NO_CHECKPOINT
+        self.metrics = metrics or site_metrics(__name__, base_url)
+        self.waits = Waits(self.metrics)
+        self.engine = engine
+
+    async def harvest_cards(self, page, oldest=None):
+        """Media of the cards rendered since the last harvest, read and marked in one evaluate.
+
+        Returns (medias, oldest): oldest is the earlier of `oldest` and the ages estimated from the cards' text.
+        """
+        with self.metrics.timer("item_extract_seconds"):
+            cards = await page.evaluate(HARVEST_CARDS, [VIDEO_CARDS, CARD_TITLE])
+        for card in cards:
+            estimate = estimate_date(card["text"])
+            if estimate is not None and (oldest is None or estimate < oldest):
+                oldest = estimate
+        return [{"url": card["url"], "title": card["title"], "date": None, "source_type": "video"}
+                for card in cards], oldest
+
+    def reached_start(self, oldest):
+        if before_start(oldest, self.start_date):
+            print(f"Loaded videos back to {oldest.strftime('%Y-%m-%d')}, before the start date. Stopping scroll.")
+            return True
+        return False
+
+    async def scroll_to_load_all_videos(self, page, target_count=None, max_scrolls=None, base_wait_time=4):
+        """Aggressive scrolling until the feed stops growing or reaches start_date, with YouTube-style fallback if needed.
+
+        Yields each card's media as soon as the card has rendered its link; no element handles are kept.
+        target_count and max_scrolls optionally cap the scroll.
+        """
+        print(f"Starting to scroll and load video content (target: {target_count or 'all'} videos)...")
+        oldest = None
+        done = False
+        # Jump to the bottom first; if the feed stalls, creep down 500px at a time like a reader would
+        passes = (
+            ("Scroll", FEED_SCROLL_JS, base_wait_time, 3),
+            ("Fallback", 'window.scrollBy(0, 500)', 1.2, 10),
+        )
+        for label, scroll_js, wait_time, idle_limit in passes:
+            async with InfiniteScroll(page, VIDEO_CARDS, self.waits, self.metrics, wait_time=wait_time,
+                                      idle_limit=idle_limit, max_scrolls=max_scrolls, scroll_js=scroll_js,
+                                      feed_url=GRAPHQL_PATH) as scroll:
+                async for current_count in scroll.counts():
+                    print(f"[{label}] {current_count} video cards loaded")
+                    # Hand over the cards this scroll rendered
+                    medias, oldest = await self.harvest_cards(page, oldest)
+                    for media in medias:
+                        yield media
+                    if self.reached_start(oldest):
+                        done = True
+                        break
+                    if target_count and current_count >= target_count:
+                        print(f"🎉 Target reached! Found {current_count} cards (target was {target_count})")
+                        done = True
+                        break
+            if done:
+                break
+            print(f"[{label}] No new cards after {idle_limit} idle scrolls.")
+        used_fallback = label == "Fallback"
+        
+        # Final comprehensive wait for all content to load
+        print("Final loading phase - waiting for all cards to populate...")
+        loaded_count = await self.waits.until(page, CARDS_POPULATED, VIDEO_CARDS, timeout=20, optional=True)
+        if loaded_count:
+            print(f"{loaded_count} cards have content")
+        else:
+            print("Warning: Cards may not have fully loaded, proceeding anyway...")
+        medias, oldest = await self.harvest_cards(page, oldest)
+        for media in medias:
+            yield media
+        final_count = await count(page, VIDEO_CARDS)
+        print(f"Final count: {final_count} video cards loaded" + (" (YouTube-style fallback used)" if used_fallback else ""))
+        if target_count and final_count < target_count:
+            print(f"⚠️  Only found {final_count} cards out of expected {target_count}")
+            print("This could be due to:")
+            print("- Facebook's rate limiting")
+            print("- Authentication requirements") 
+            print("- Changed page structure")
+            print("- Network issues")
+
+    def listen_graphql(self, page, videos):
+        """Parse every GraphQL response of the page into videos; returns the list of pending reads."""
+        pending = []
+
+        async def read(response):
+            try:
+                videos.add_payload(await response.text())
+            except Exception:
+                # Bodies of redirected or aborted requests are not available
+                pass
+
+        def on_response(response):
+            if is_graphql(response):
+                pending.append(asyncio.ensure_future(read(response)))
+
+        page.on("response", on_response)
+        return pending
+
+    def in_range(self, created):
+        """Without a date range everything is in range; with one, an undated video is not."""
+        if self.start_date is None or self.end_date is None:
+            return True
+        return created is not None and self.start_date <= created <= self.end_date
+
+    async def scrape_graphql(self, page, videos, pending, max_scrolls=None, wait_time=5, no_new_limit=3):
+        """Yield videos from the embedded data, then from the GraphQL pages each scroll loads.
+
+        Scrolls until the feed stops growing or, newest first, reaches videos created before start_date.
+        """
+        for text in await page.evaluate(EMBEDDED_JSON_JS):
+            videos.add_payload(text)
+        no_new = 0
+        oldest = None
+        for scroll_num in itertools.count():
+            if pending:
+                await asyncio.gather(*pending)
+                del pending[:]
+            new = videos.take_new()
+            for media, created in new:
+                if created is not None and (oldest is None or created < oldest):
+                    oldest = created
+                if self.in_range(created):
+                    yield media
+                else:
+                    self.metrics.count("items_filtered")
+            no_new = 0 if new else no_new + 1
+            print(f"[GraphQL] Scroll {scroll_num}: {len(videos.videos)} videos in payloads")
+            if self.reached_start(oldest) or no_new >= no_new_limit or scroll_num == max_scrolls:
+                break
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            await self.waits.event(videos.grown, timeout=wait_time)
+        # Videos that never got all their fields; undated ones only pass when no date range is set
+        for media, created in videos.take_new(final=True):
+            if self.in_range(created):
+                yield media
+            else:
+                self.metrics.count("items_filtered")
+
+    async def scrape(self):
+        """Main scraping method with enhanced error handling; yields videos as cards are processed"""
+        print(f"\nScraping Facebook videos from {self.base_url}")
+        
+        seen_urls = set()
+        
+        try:
+            page = await self.context.new_page()
+            
+            # Enhanced headers to appear more like a real browser
+            await page.set_extra_http_headers({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+            })
+            
+            # Set viewport to ensure proper rendering
+            await page.set_viewport_size({"width": 1366, "height": 768})
+            if self.engine == "graphql":
+                # Listen before navigating so the first pages' responses are not missed
+                videos = GraphqlVideos(self.base_url)
+                pending = self.listen_graphql(page, videos)
+
+            # --- Load Facebook cookies if available ---
+            cookie_path = 'facebook_cookies.json'
+            restored = {cookie['name'] for cookie in await self.context.cookies(self.base_url)}
+            if LOGIN_COOKIE in restored:
+                # The session came back with the browser state saved by an earlier run
+                print("Reusing the Facebook session from the saved browser state.")
+            elif os.path.exists(cookie_path):
+                with open(cookie_path, 'r') as f:
+                    cookies = json.load(f)
+                # print("COOKIES TO BE ADDED:")
+                # print(json.dumps(cookies, indent=2))
+                try:
+                    await self.context.add_cookies(cookies)
+                    print("Loaded Facebook cookies for authentication.")
+                except Exception as e:
+                    print(f"Error adding cookies: {e}")
+                    print("Cookies passed:")
+                    print(json.dumps(cookies, indent=2))
+                    await page.close()
+                    return
+            else:
+                print("facebook_cookies.json not found. Proceeding without cookies.")
+
+            print(f"Navigating to: {self.base_url}")
+            nav_success = False
+            for attempt in range(3):
+                try:
+                    await self.metrics.goto(page, self.base_url, wait_until='domcontentloaded', timeout=90000)
+                    nav_success = True
+                    break
+                except Exception as e:
+                    self.metrics.count("errors")
+                    print(f"[Retry {attempt+1}] Page.goto failed: {e}")
+                    # A timed-out goto has waited long enough already; reload straight away
+                    try:
+                        await page.reload(wait_until='domcontentloaded', timeout=90000)
+                        nav_success = True
+                        break
+                    except Exception as e2:
+                        print(f"[Retry {attempt+1}] Page.reload failed: {e2}")
+                        if attempt < 2:
+                            await asyncio.sleep(NAV_RETRY_BACKOFF * 2 ** attempt)
+            if not nav_success:
+                print("Failed to load Facebook page after retries. Skipping.")
+                await page.close()
+                return
+            # Wait for the initial render to settle instead of a fixed 8s
+            await self.waits.settled(page, quiet=1, timeout=8, optional=True)
+            # Handle cookie consent
+            try:
+                cookie_buttons = await page.query_selector_all('[data-testid="cookie-policy-manage-dialog"] button, [data-cookiebanner="accept_button"]')
+                if cookie_buttons:
+                    await cookie_buttons[0].click()
+                    await self.waits.settled(page, quiet=0.5, timeout=2, optional=True)
+                    print("Handled cookie consent")
+            except Exception as e:
+                print(f"Cookie consent handling error: {e}")
+            # Check for login wall
+            try:
+                login_elements = await page.query_selector_all('#login_form, [data-testid="royal_login_form"]')
+                if login_elements:
+                    print("⚠️  Login form detected - Facebook may require authentication. Skipping this page.")
+                    # Do not carry a dead session into the next run's browser state
+                    await self.context.clear_cookies()
+                    await page.close()
+                    return
+            except Exception as e:
+                print(f"Login wall check error: {e}")
+            # Verify main content is loaded
+            try:
+                await self.metrics.wait_for_selector(page, '[role="main"], div[data-pagelet="ProfileTimeline"]', timeout=15000)
+                print("Page main content detected")
+            except:
+                print("Warning: Main content selector not found, proceeding anyway...")
+            if self.engine == "graphql":
+                async for media in self.scrape_graphql(page, videos, pending):
+                    if media["url"] not in seen_urls:
+                        seen_urls.add(media["url"])
+                        self.metrics.count("items_found")
+                        print(f"✓ Added: {media['title'][:60]} | {media['date']}")
+                        print(f"  └─ URL: {media['url']}")
+                        yield media
+                if videos.videos:
+                    await page.close()
+                    print(f"\nTotal Facebook videos found: {len(seen_urls)}")
+                    return
+                print("No videos in the GraphQL payloads; falling back to the rendered cards")
+            # Wait for the first video cards
+            await self.waits.count_above(page, VIDEO_CARDS, 0, timeout=5, optional=True)
+            # Scroll until the feed ends or passes start_date; cards are yielded as they render
+            harvested = 0
+            async for video_info in self.scroll_to_load_all_videos(page):
+                harvested += 1
+                if video_info["url"] in seen_urls:
+                    print(f"× Skipped (duplicate): {video_info['url']}")
+                    continue
+                seen_urls.add(video_info["url"])
+                self.metrics.count("items_found")
+                print(f"✓ Added: {(video_info['title'] or '')[:60]}...")
+                print(f"  └─ URL: {video_info['url']}")
+                yield video_info
+            if not harvested:
+                print("No video cards found after scrolling. Debugging page...")
+                await self.debug_facebook_page(page)
+            await page.close()
+        except Exception as e:
+            self.metrics.count("errors")
+            print(f"Error in scrape_facebook_videos: {e}")
+            if 'page' in locals():
+                await page.close()
+        print(f"\nTotal Facebook videos found: {len(seen_urls)}")
+
+    async def scrape_facebook_videos(self):
+        return [media async for media in self.scrape()]
+
+    async def debug_facebook_page(self, page):
+        """Enhanced debug method"""
+        try:
+            print("\n=== FACEBOOK PAGE DEBUG ===")
+            
+            title = await page.title()
+            url = page.url
+            print(f"Page Title: {title}")
+            print(f"Current URL: {url}")
+            
+            # Check for login requirement
+            login_elements = await page.query_selector_all('#login_form, [data-testid="royal_login_form"]')
+            if login_elements:
+                print("⚠️  Login form detected - Facebook may require authentication")
+            
+            # Check various video-related selectors
+            selectors_to_check = [
+                ('Target video cards', VIDEO_CARDS),
+                ('Video links', 'a[href*="/videos/"]'),
+                ('Any videos', 'video'),
+                ('Role img elements', '[role="img"]'),
+                ('Main content', '[role="main"]'),
+                ('Profile timeline', '[data-pagelet="ProfileTimeline"]')
+            ]
+            
+            for name, selector in selectors_to_check:
+                try:
+                    elements = await page.query_selector_all(selector)
+                    print(f"{name}: {len(elements)} found")
+                except:
+                    print(f"{name}: Error checking selector")
+            
+            # Sample some card content
+            try:
+                cards = await page.query_selector_all(VIDEO_CARDS)
+                print(f"\nSampling first 3 cards:")
+                for i, card in enumerate(cards[:3]):
+                    try:
+                        text = await card.text_content()
+                        html = await card.inner_html()
+                        print(f"Card {i+1}:")
+                        print(f"  Text length: {len(text) if text else 0}")
+                        print(f"  HTML length: {len(html) if html else 0}")
+                        if text and len(text.strip()) > 0:
+                            print(f"  Sample text: {text[:100]}...")
+                    except Exception as e:
+                        print(f"  Error sampling card {i+1}: {e}")
+            except:
+                print("Could not sample card content")
+                
+        except Exception as e:
+            print(f"Error in debug_facebook_page: {e}")
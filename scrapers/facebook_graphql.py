@@ -0,0 +1,138 @@
+import asyncio
+import json
+from datetime import datetime
+from dateutil.tz import UTC
+
+GRAPHQL_PATH = "/api/graphql/"
+# Anti-JSON-hijacking guard some endpoints put before the payload
+_GUARD = "for (;;);"
+
+_TITLE_KEYS = ("title", "savable_title", "name", "message")
+_URL_KEYS = ("permalink_url", "url", "video_permalink_url")
+_TIME_KEYS = ("creation_time", "publish_time", "created_time")
+
+# Server-rendered Relay payloads: the first batch of videos never goes through /api/graphql/
+EMBEDDED_JSON_JS = """() => Array.from(
+    document.querySelectorAll('script[type="application/json"]'),
+    script => script.textContent
+).filter(text => text.includes('"Video"'))"""
+
+
+def is_graphql(response):
+    return GRAPHQL_PATH in response.url and response.request.method == "POST"
+
+
+def json_documents(text):
+    """Every JSON document in a GraphQL body; streamed (@defer) responses carry one per line."""
+    text = text.strip()
+    if text.startswith(_GUARD):
+        text = text[len(_GUARD):]
+    try:
+        yield json.loads(text)
+        return
+    except ValueError:
+        pass
+    for line in text.splitlines():
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue
+
+
+def video_nodes(document):
+    """Every Video node (a dict with __typename "Video" and an id) in a payload, in document order."""
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if node.get("__typename") == "Video" and node.get("id"):
+                yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _text(value):
+    if isinstance(value, dict):
+        value = value.get("text")
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def video_fields(node):
+    """{"title", "url", "created"} found on one Video node; a field the node does not carry is left out."""
+    fields = {}
+    title = next(filter(None, (_text(node.get(key)) for key in _TITLE_KEYS)), None)
+    if title:
+        fields["title"] = title
+    url = next((node[key] for key in _URL_KEYS
+                if isinstance(node.get(key), str) and node[key].startswith("http")), None)
+    if url:
+        fields["url"] = url
+    created = next((node[key] for key in _TIME_KEYS if isinstance(node.get(key), int) and node[key] > 0), None)
+    if created:
+        fields["created"] = created
+    return fields
+
+
+# Fields a Video node must have gathered before it is handed out mid-scroll
+COMPLETE_FIELDS = ("url", "title", "created")
+
+
+class GraphqlVideos:
+    """Videos seen in a page's GraphQL payloads, merged by id in first-seen order.
+
+    The same video shows up in several payloads, each carrying a different
+    subset of its fields (often a bare {__typename, id} reference first);
+    the first value seen for a field wins. A video is only handed out once
+    it has a url, title and creation time, except by the final flush.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.videos = {}
+        self.taken = set()
+        # Set whenever a payload completes a video not handed out yet
+        self.grown = asyncio.Event()
+
+    def complete(self, video_id):
+        return all(key in self.videos[video_id] for key in COMPLETE_FIELDS)
+
+    def add_payload(self, text):
+        """Merge the Video nodes of one response body; returns the number of videos it completed."""
+        completed = 0
+        for document in json_documents(text):
+            for node in video_nodes(document):
+                video_id = str(node["id"])
+                was_complete = video_id in self.videos and self.complete(video_id)
+                video = self.videos.setdefault(video_id, {})
+                for key, value in video_fields(node).items():
+                    video.setdefault(key, value)
+                if not was_complete and self.complete(video_id):
+                    completed += 1
+        if completed:
+            self.grown.set()
+        return completed
+
+    def take_new(self, final=False):
+        """Media dicts (plus their creation datetime) for the complete videos not handed out yet.
+
+        With final=True, also the videos still missing fields: the scroll is over and no payload will fill them in.
+        """
+        self.grown.clear()
+        ids = [video_id for video_id in self.videos
+               if video_id not in self.taken and (final or self.complete(video_id))]
+        self.taken.update(ids)
+        return [self.media(video_id) for video_id in ids]
+
+    def media(self, video_id):
+        video = self.videos[video_id]
+        created = video.get("created")
+        created = datetime.fromtimestamp(created, UTC) if created else None
+        return {
+            "url": video.get("url") or f"{self.base_url}/{video_id}/",
+            "title": video.get("title") or "Facebook Video",
+            "date": created.strftime('%Y-%m-%d') if created else None,
+            "source_type": "video",
+        }, created
@@ -0,0 +1,281 @@
+import copy
+import hashlib
+import json
+import os
+import time
+from collections.abc import Mapping
+from urllib.parse import urlencode
+
+DEFAULT_TTL = 6 * 60 * 60  # seconds
+
+# Playwright resource types worth replaying; images/fonts are blocked or irrelevant
+CACHEABLE_TYPES = ("document", "xhr", "fetch", "script", "stylesheet")
+
+# Hop-by-hop or length headers that must not be replayed with a re-encoded body
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class CacheMiss(RuntimeError):
+    """Raised in offline mode for a request that is not in the cache."""
+
+
+class HttpError(RuntimeError):
+    pass
+
+
+class CachedResponse:
+    """Status, headers and body of a response, whether it came from the network or the cache."""
+
+    def __init__(self, url, status, headers, body, from_cache=False, stored_at=None, parsed=None):
+        self.url = url
+        self.status = status
+        self.headers = {k.lower(): v for k, v in headers.items()}
+        self.body = body
+        self.from_cache = from_cache
+        self.stored_at = stored_at
+        # Parsed JSON keyed by body hash, shared with the cache that produced this response
+        self._parsed = parsed if parsed is not None else {}
+
+    def text(self):
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self):
+        """The parsed body; the body is parsed once, and each caller gets its own copy to modify."""
+        key = hashlib.sha256(self.body).hexdigest()
+        if key not in self._parsed:
+            self._parsed[key] = json.loads(self.body)
+        return copy.deepcopy(self._parsed[key])
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise HttpError(f"{self.status} error for {self.url}")
+
+
+def request_key(method, url, body=None):
+    digest = hashlib.sha256(f"{method.upper()} {url}\n".encode("utf-8"))
+    if isinstance(body, Mapping):
+        # Form fields, as aiohttp would encode them
+        body = urlencode(list(body.items()))
+    if body:
+        digest.update(body if isinstance(body, bytes) else body.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class HttpCache:
+    """Content-addressed on-disk record/replay cache shared by all three HTTP stacks.
+
+    Layout under `root`:
+
+        objects/ab/abcdef...      response bodies, named by their sha256
+        requests/12/1234...json   one entry per request (method, URL, body):
+                                  status, headers, body hash, stored_at
+
+    Identical bodies (a gallery page fetched from two URLs, the same script
+    bundle) are stored once. Entries older than `ttl` seconds are refetched;
+    with `offline=True` every entry is served regardless of age and a miss
+    raises CacheMiss (Playwright requests are aborted) instead of touching
+    the network.
+
+    A stale entry that carries an ETag or Last-Modified is revalidated with a
+    conditional GET instead of being refetched; on 304 it is renewed and its
+    stored body (already parsed, if this process parsed it before) is reused.
+    """
+
+    def __init__(self, root, ttl=DEFAULT_TTL, offline=False):
+        self.root = root
+        self.ttl = ttl
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._parsed = {}
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(root, "requests"), exist_ok=True)
+
+    def _entry_path(self, key):
+        return os.path.join(self.root, "requests", key[:2], key + ".json")
+
+    def _object_path(self, sha):
+        return os.path.join(self.root, "objects", sha[:2], sha)
+
+    @staticmethod
+    def _write_atomic(path, data):
+        # Worker processes may write the same entry; readers never see a partial file
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def entry(self, method, url, body=None):
+        """The stored response for this request regardless of age, or None."""
+        try:
+            with open(self._entry_path(request_key(method, url, body)), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(self._object_path(meta["sha256"]), "rb") as f:
+                content = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        return CachedResponse(url, meta["status"], meta["headers"], content,
+                              from_cache=True, stored_at=meta["stored_at"], parsed=self._parsed)
+
+    def is_fresh(self, response):
+        return self.offline or time.time() - response.stored_at < self.ttl
+
+    def lookup(self, method, url, body=None):
+        """A fresh (or, offline, any) cached response; raises CacheMiss offline when absent."""
+        response = self.entry(method, url, body)
+        if response is not None and self.is_fresh(response):
+            self.hits += 1
+            return response
+        if self.offline:
+            raise CacheMiss(f"Not in cache (offline): {method} {url}")
+        self.misses += 1
+        return None
+
+    def validators(self, response):
+        """If-None-Match/If-Modified-Since headers for revalidating `response` (may be None)."""
+        headers = {}
+        if response is None:
+            return headers
+        if response.headers.get("etag"):
+            headers["If-None-Match"] = response.headers["etag"]
+        if response.headers.get("last-modified"):
+            headers["If-Modified-Since"] = response.headers["last-modified"]
+        return headers
+
+    def revalidated(self, method, url, response, body=None):
+        """The server answered 304 for `response`: keep it fresh for another ttl and return it."""
+        self.misses -= 1
+        self.revalidations += 1
+        path = self._entry_path(request_key(method, url, body))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return response
+        meta["stored_at"] = response.stored_at = time.time()
+        self._write_atomic(path, json.dumps(meta).encode("utf-8"))
+        return response
+
+    def store(self, method, url, status, headers, content, body=None):
+        if not 200 <= status < 300:
+            return
+        sha = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(sha)
+        if not os.path.exists(object_path):
+            self._write_atomic(object_path, content)
+        meta = {
+            "method": method.upper(),
+            "url": url,
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS},
+            "sha256": sha,
+            "stored_at": time.time(),
+        }
+        self._write_atomic(self._entry_path(request_key(method, url, body)), json.dumps(meta).encode("utf-8"))
+
+    async def _route(self, route):
+        request = route.request
+        if request.method != "GET" or request.resource_type not in CACHEABLE_TYPES:
+            await route.fallback()
+            return
+        try:
+            cached = self.lookup("GET", request.url)
+        except CacheMiss:
+            await route.abort()
+            return
+        if cached is not None:
+            await route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+            return
+        stale = self.entry("GET", request.url)
+        conditional = self.validators(stale)
+        try:
+            if conditional:
+                response = await route.fetch(headers={**request.headers, **conditional})
+            else:
+                response = await route.fetch()
+            if response.status == 304 and stale is not None:
+                self.revalidated("GET", request.url, stale)
+                await route.fulfill(status=stale.status, headers=stale.headers, body=stale.body)
+                return
+            content = await response.body()
+        except Exception:
+            # Let Playwright surface the network error to the page as usual
+            await route.fallback()
+            return
+        self.store("GET", request.url, response.status, response.headers, content)
+        await route.fulfill(response=response, body=content)
+
+    async def apply(self, context):
+        """Record/replay every cacheable request of `context`.
+
+        Install this before any blocking profile: Playwright runs the most
+        recently registered route first, so blocked requests never reach
+        the cache and allowed ones fall back to it.
+        """
+        await context.route("**/*", self._route)
+
+    def report(self):
+        print(f"[HttpCache] {self.hits} hits, {self.revalidations} revalidated (304), {self.misses} misses "
+              f"({self.root}{', offline' if self.offline else ''})")
+
+
+class NullHttpCache:
+    """Stand-in used when caching is off: every request goes to the network."""
+
+    offline = False
+
+    def lookup(self, method, url, body=None):
+        return None
+
+    def entry(self, method, url, body=None):
+        return None
+
+    def validators(self, response):
+        return {}
+
+    def store(self, method, url, status, headers, content, body=None):
+        pass
+
+    async def apply(self, context):
+        pass
+
+    def report(self):
+        pass
+
+
+NO_CACHE = NullHttpCache()
+
+
+async def fetch_aiohttp(session, url, cache=NO_CACHE, headers=None, data=None, **kwargs):
+    """GET (POST of `data`, if given) through an aiohttp session, served from/recorded into `cache`."""
+    method = "GET" if data is None else "POST"
+    cached = cache.lookup(method, url, data)
+    if cached is not None:
+        return cached
+    stale = cache.entry(method, url, data)
+    headers = {**(headers or {}), **cache.validators(stale)}
+    async with session.request(method, url, headers=headers, data=data, **kwargs) as response:
+        if response.status == 304 and stale is not None:
+            return cache.revalidated(method, url, stale, data)
+        content = await response.read()
+        result = CachedResponse(url, response.status, dict(response.headers), content)
+    cache.store(method, url, result.status, result.headers, content, data)
+    return result
+
+
+def fetch_requests(url, cache=NO_CACHE, headers=None, **kwargs):
+    """requests.get, served from/recorded into `cache`."""
+    import requests
+    cached = cache.lookup("GET", url)
+    if cached is not None:
+        return cached
+    stale = cache.entry("GET", url)
+    headers = {**(headers or {}), **cache.validators(stale)}
+    response = requests.get(url, headers=headers, **kwargs)
+    if response.status_code == 304 and stale is not None:
+        return cache.revalidated("GET", url, stale)
+    result = CachedResponse(url, response.status_code, dict(response.headers), response.content)
+    cache.store("GET", url, result.status, result.headers, response.content)
+    return result
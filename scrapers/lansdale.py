@@ -0,0 +1,266 @@
+import asyncio
+from collections import deque
+from urllib.parse import urljoin
+import aiohttp
+from dateutil.parser import parse as dateparse
+from dateutil.tz import UTC
+from .checkpoints import NO_CHECKPOINT
+from .metrics import site_metrics
+from .dedup import NO_DEDUP
+from .http_cache import NO_CACHE, fetch_aiohttp
+from .extract import extract_all
+from .page_pool import PagePool
+from .throttle import DEFAULT_DETAIL_CONCURRENCY, NO_RATE_LIMIT
+from .waits import Waits
+from . import webforms
+
+PAGER_LINKS = 'span[id*="dpgVideos"] a'
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+}
+
+class LansdaleScraper:
+    """Lansdale CivicMedia videos, dated from each video's detail page.
+
+    engine="http" pages through the listing by replaying the DataPager's
+    WebForms postbacks over plain HTTP (scrapers/webforms.py) and only
+    drives the pager in the browser if that finds nothing; engine="browser"
+    always clicks through it. Detail pages are always read in the browser.
+    """
+
+    def __init__(self, context, base_url, start_date=None, end_date=None, checkpoint=None, page_pool=None, dedup=None,
+                 detail_concurrency=DEFAULT_DETAIL_CONCURRENCY, rate_limiter=None, engine="http", http_cache=None,
+                 metrics=None):
+        if start_date is not None and isinstance(start_date, str):
+            start_date = dateparse(start_date)
+        if end_date is not None and isinstance(end_date, str):
+            end_date = dateparse(end_date)
+        # Make start_date and end_date timezone-aware (UTC) if not already
+        if start_date is not None and start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=UTC)
+        if end_date is not None and end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=UTC)
+        self.context = context
+        self.base_url = base_url
+        self.start_date = start_date
+        self.end_date = end_date
+        self.checkpoint = checkpoint or NO_CHECKPOINT
+        self.metrics = metrics or site_metrics(__name__, base_url)
+        self.dedup = dedup or NO_DEDUP
+        # Detail/iframe pages are borrowed from a pool instead of opened per item
+        self.pages = page_pool or PagePool(context)
+        # Detail pages resolved at once; the rate limiter is shared with everything else on the host
+        self.detail_concurrency = max(1, detail_concurrency)
+        self.rate_limiter = rate_limiter or NO_RATE_LIMIT
+        self.engine = engine
+        self.http_cache = http_cache or NO_CACHE
+        self.waits = Waits(self.metrics)
+
+    async def get_upload_date(self, video_url):
+        # Wait for a request slot before taking a page, so queued requests do not hold pool pages
+        await self.rate_limiter.wait()
+        async with self.pages.page() as page:
+            try:
+                await self.metrics.goto(page, video_url, wait_until='domcontentloaded', timeout=60000)
+                # Try to close any modal/pop-up
+                try:
+                    close_btn = await page.query_selector('button[aria-label="Close"], .close, .modal-close')
+                    if close_btn:
+                        await close_btn.click()
+                except Exception:
+                    pass
+                # Wait for dd.first to appear
+                await self.metrics.wait_for_selector(page, 'dd.first', timeout=30000)
+                dd_first = await page.query_selector('dd.first')
+                if dd_first:
+                    date_text = (await dd_first.text_content() or '').strip()
+                    try:
+                        parsed_date = dateparse(date_text).strftime('%Y-%m-%d')
+                        return parsed_date
+                    except Exception:
+                        return date_text  # fallback: return raw text
+                return 'nan'
+            except Exception as e:
+                self.metrics.count("errors")
+                print(f"Error fetching upload date for {video_url}: {e}")
+                return 'nan'
+
+    def add_video(self, href, title, video_infos, seen_urls):
+        """Append one listing card to video_infos unless it is not a video or already listed."""
+        if not href or not title:
+            return
+        print(f"Found href: {href}")  # Debug: print all hrefs
+        title = title.strip()
+        # Accept links that start with /CivicMedia.aspx?VID=
+        if not href.startswith('/CivicMedia.aspx?VID='):
+            return
+        full_url = urljoin(self.base_url, href)
+        if full_url in seen_urls:
+            print(f"Skipping duplicate: {full_url}")
+            return
+        seen_urls.add(full_url)
+        video_infos.append({
+            "url": full_url,
+            "title": title
+        })
+
+    async def collect_video_infos_http(self):
+        """Every listed video, paging by POSTing the form back with the next pager link's __EVENTTARGET.
+
+        The session keeps the ASP.NET cookies; each response carries the
+        __VIEWSTATE/__EVENTVALIDATION that the next postback must send.
+        """
+        video_infos = []
+        seen_urls = set()
+        connector = aiohttp.TCPConnector(limit=2)
+        async with aiohttp.ClientSession(connector=connector, headers=HTTP_HEADERS) as session:
+            url, data = self.base_url, None
+            current_page = 1
+            while True:
+                print(f"Fetching page {current_page}: {url}{' (postback)' if data else ''}")
+                self.metrics.count("pages_navigated")
+                try:
+                    with self.metrics.timer("goto_seconds"):
+                        response = await fetch_aiohttp(session, url, self.http_cache, data=data)
+                    response.raise_for_status()
+                    html = response.text()
+                except Exception as e:
+                    self.metrics.count("errors")
+                    print(f"Error fetching listing page {current_page}: {e}")
+                    break
+                soup = webforms.parse(html)
+                cards = soup.select('.video')
+                if not cards:
+                    print(f"No video cards found on page {current_page}")
+                    break
+                print(f"Found {len(cards)} videos on page {current_page}")
+                for card in cards:
+                    link, h3 = card.find('a'), card.find('h3')
+                    if link is not None and h3 is not None:
+                        self.add_video(link.get('href'), h3.get_text(), video_infos, seen_urls)
+                next_link = webforms.postback_links(soup, PAGER_LINKS).get(str(current_page + 1))
+                if next_link is None:
+                    print("No more pages found.")
+                    break
+                action, fields = webforms.form_state(soup)
+                url = urljoin(url, action) if action else url
+                data = webforms.postback_data(fields, *next_link)
+                current_page += 1
+        return video_infos
+
+    async def collect_video_infos_browser(self):
+        """Every listed video, clicking through the DataPager in a browser page."""
+        video_infos = []
+        seen_urls = set()
+        page = await self.context.new_page()
+        print(f"Navigating to: {self.base_url}")
+        await self.metrics.goto(page, self.base_url, wait_until='domcontentloaded', timeout=60000)
+        current_page = 1
+        while True:
+            print(f"Processing page {current_page}")
+            video_cards = await extract_all(page, '.video', {"href": "a@href", "title": "h3"})
+            if not video_cards:
+                print(f"No video cards found on page {current_page}")
+                break
+            print(f"Found {len(video_cards)} videos on page {current_page}")
+            for card in video_cards:
+                self.add_video(card["href"], card["title"], video_infos, seen_urls)
+            # Find the next page number link (not the current one)
+            pagination_links = await extract_all(page, PAGER_LINKS, {"text": ""})
+            # Get the first video href before clicking
+            first_video_href = video_cards[0]["href"]
+            for index, link in enumerate(pagination_links):
+                text = (link["text"] or '').strip()
+                if text == str(current_page + 1):
+                    print(f"Clicking to page {text}")
+                    answered = await self.waits.response_after(
+                        page, lambda: page.locator(PAGER_LINKS).nth(index).click(),
+                        lambda response: response.request.method == "POST", timeout=30)
+                    # The postback has answered; wait for the first video href to change (i.e., new page rendered)
+                    rendered = answered and await self.waits.changed(
+                        page, '.video a', first_video_href, attribute='href', timeout=30)
+                    if not rendered:
+                        # Reading on would scrape the previous page again as page current_page + 1
+                        self.metrics.count("errors")
+                        print(f"Page {current_page + 1} did not load; stopping pagination")
+                        await page.close()
+                        return video_infos
+                    current_page += 1
+                    # After clicking, break out of the for loop and let the while loop re-query everything
+                    break
+            else:
+                print("No more pages found.")
+                break
+        await page.close()
+        return video_infos
+
+    async def timed_upload_date(self, video_url):
+        with self.metrics.timer("item_extract_seconds"):
+            return await self.get_upload_date(video_url)
+
+    async def iter_upload_dates(self, video_infos):
+        """Yield (info, upload_date) in listing order, resolving up to detail_concurrency detail pages at once."""
+        waiting = deque(video_infos)
+        pending = deque()
+        try:
+            while waiting or pending:
+                while waiting and len(pending) < self.detail_concurrency:
+                    info = waiting.popleft()
+                    pending.append((info, asyncio.ensure_future(self.timed_upload_date(info['url']))))
+                info, task = pending.popleft()
+                yield info, await task
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def scrape(self):
+        """Yield Lansdale videos in the date range as their upload dates are resolved."""
+        print(f"\nScraping Lansdale videos from {self.base_url}")
+        if self.start_date and self.end_date:
+            print(f"Filtering videos between {self.start_date.strftime('%Y-%m-%d')} and {self.end_date.strftime('%Y-%m-%d')}")
+        if self.engine == "http":
+            video_infos = await self.collect_video_infos_http()
+            if not video_infos and self.context is not None:
+                # Listing rendered client-side or the request was refused: drive the pager in the browser
+                print("HTTP postback listing found no videos; paging in the browser instead")
+                video_infos = await self.collect_video_infos_browser()
+        else:
+            video_infos = await self.collect_video_infos_browser()
+        print(f"\nTotal Lansdale videos found: {len(video_infos)}")
+        # Now, visit each video URL to get the upload date
+        to_resolve = []
+        for info in video_infos:
+            if self.checkpoint.is_done('details', info['url']):
+                # Already resolved by an interrupted earlier run
+                continue
+            if self.dedup.is_known(info['url']):
+                print(f"Skipping known video: {info['url']}")
+                continue
+            to_resolve.append(info)
+        async for info, upload_date in self.iter_upload_dates(to_resolve):
+            add_media = True
+            dt = None
+            if self.start_date and self.end_date and upload_date and upload_date != 'nan':
+                try:
+                    dt = dateparse(upload_date)
+                    if dt.tzinfo is None:
+                        dt = dt.replace(tzinfo=UTC)
+                    add_media = self.start_date <= dt <= self.end_date
+                except Exception:
+                    add_media = False
+            if add_media:
+                self.metrics.count("items_found")
+                print(f"✓ Finalized: {info['title']} | {info['url']} | {upload_date}")
+                yield {
+                    "url": info['url'],
+                    "title": info['title'],
+                    "date": upload_date,
+                    "source_type": "video"
+                }
+            else:
+                self.metrics.count("items_filtered")
+                print(f"× Skipped (out of range): {info['title']} | {upload_date}")
+            self.checkpoint.mark_done('details', info['url'])
+
+    async def scrape_lansdale_videos(self):
+        return [media async for media in self.scrape()]
@@ -0,0 +1,202 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+# Upper bounds (seconds) shared by every histogram; +Inf is implicit
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+COUNTERS = {
+    "pages_navigated": "Page navigations (page.goto) or API page requests",
+    "items_found": "Medias yielded by the scraper",
+    "items_filtered": "Items dropped for falling outside the date range",
+    "errors": "Errors caught while scraping",
+    "timeouts": "Scrape tasks abandoned after --task-timeout",
+    "scroll_backoffs": "Infinite-scroll pauses after the site answered 429/503",
+}
+
+HISTOGRAMS = {
+    "goto_seconds": "Latency of page.goto or of one API page request",
+    "selector_wait_seconds": "Time spent waiting for a selector to appear",
+    "item_extract_seconds": "Time to resolve one item (detail page, card, meeting)",
+    "scroll_step_seconds": "Time from one infinite-scroll step to its new items rendering",
+}
+
+
+class _Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Process-wide counters and histograms, labelled by site.
+
+    Scrapers record through `site_metrics(name)`; the run writes everything
+    once at the end with `write(path)`.
+    """
+
+    def __init__(self):
+        # Winchester records from executor threads
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def inc(self, name, site, value=1):
+        with self._lock:
+            self._counters[(name, site)] = self._counters.get((name, site), 0) + value
+
+    def observe(self, name, site, seconds):
+        with self._lock:
+            self._histograms.setdefault((name, site), _Histogram()).observe(seconds)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """Plain-data copy, e.g. to ship from a worker process to the parent."""
+        with self._lock:
+            return {
+                "counters": [[name, site, value] for (name, site), value in self._counters.items()],
+                "histograms": [[name, site, h.counts, h.sum, h.count] for (name, site), h in self._histograms.items()],
+            }
+
+    def merge(self, snapshot):
+        with self._lock:
+            for name, site, value in snapshot["counters"]:
+                self._counters[(name, site)] = self._counters.get((name, site), 0) + value
+            for name, site, counts, total, count in snapshot["histograms"]:
+                h = self._histograms.setdefault((name, site), _Histogram())
+                h.counts = [a + b for a, b in zip(h.counts, counts)]
+                h.sum += total
+                h.count += count
+
+    def to_json(self):
+        sites = {}
+        with self._lock:
+            for (name, site), value in sorted(self._counters.items()):
+                sites.setdefault(site, {})[name] = value
+            for (name, site), h in sorted(self._histograms.items()):
+                sites.setdefault(site, {})[name] = {
+                    "count": h.count,
+                    "sum": round(h.sum, 3),
+                    "avg": round(h.sum / h.count, 3) if h.count else 0,
+                    "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], h.counts)),
+                }
+        return {"generated_at": time.time(), "sites": sites}
+
+    def to_prometheus(self):
+        """Prometheus text exposition format, for node_exporter's textfile collector."""
+        lines = []
+        with self._lock:
+            for name, help_text in COUNTERS.items():
+                series = sorted((site, value) for (n, site), value in self._counters.items() if n == name)
+                if not series:
+                    continue
+                lines.append(f"# HELP scraper_{name}_total {help_text}")
+                lines.append(f"# TYPE scraper_{name}_total counter")
+                for site, value in series:
+                    lines.append(f'scraper_{name}_total{{site="{site}"}} {value}')
+            for name, help_text in HISTOGRAMS.items():
+                series = sorted((site, h) for (n, site), h in self._histograms.items() if n == name)
+                if not series:
+                    continue
+                lines.append(f"# HELP scraper_{name} {help_text}")
+                lines.append(f"# TYPE scraper_{name} histogram")
+                for site, h in series:
+                    cumulative = 0
+                    for bound, count in zip([str(b) for b in BUCKETS] + ["+Inf"], h.counts):
+                        cumulative += count
+                        lines.append(f'scraper_{name}_bucket{{site="{site}",le="{bound}"}} {cumulative}')
+                    lines.append(f'scraper_{name}_sum{{site="{site}"}} {h.sum:.6f}')
+                    lines.append(f'scraper_{name}_count{{site="{site}"}} {h.count}')
+        lines.append("# HELP scraper_last_run_timestamp_seconds Unix time the run wrote these metrics")
+        lines.append("# TYPE scraper_last_run_timestamp_seconds gauge")
+        lines.append(f"scraper_last_run_timestamp_seconds {time.time():.0f}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write JSON for *.json paths, Prometheus text otherwise."""
+        body = json.dumps(self.to_json(), indent=2) if path.endswith(".json") else self.to_prometheus()
+        # node_exporter may read the file at any moment; never expose a half-written one
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+        print(f"Metrics written to {path}")
+
+    def report(self):
+        """One summary line per site."""
+        data = self.to_json()["sites"]
+        for site, values in sorted(data.items()):
+            goto = values.get("goto_seconds", {})
+            extract = values.get("item_extract_seconds", {})
+            print(f"[Metrics {site}] {values.get('items_found', 0)} found, "
+                  f"{values.get('items_filtered', 0)} filtered, {values.get('errors', 0)} errors, "
+                  f"{values.get('pages_navigated', 0)} pages (avg {goto.get('avg', 0)}s), "
+                  f"avg item {extract.get('avg', 0)}s")
+
+
+METRICS = MetricsRegistry()
+
+
+class SiteMetrics:
+    """METRICS bound to one site label."""
+
+    def __init__(self, site, registry=METRICS):
+        self.site = site
+        self.registry = registry
+
+    def count(self, name, value=1):
+        self.registry.inc(name, self.site, value)
+
+    @contextmanager
+    def timer(self, name):
+        """Time the block into histogram `name`; works around awaits too."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registry.observe(name, self.site, time.perf_counter() - started)
+
+    async def goto(self, page, url, **kwargs):
+        """page.goto, counted as a navigation and timed."""
+        self.count("pages_navigated")
+        with self.timer("goto_seconds"):
+            return await page.goto(url, **kwargs)
+
+    async def wait_for_selector(self, page, selector, **kwargs):
+        with self.timer("selector_wait_seconds"):
+            return await page.wait_for_selector(selector, **kwargs)
+
+
+def site_label(module_name, base_url=None):
+    """Site label: the scraper module plus the base_url's host, e.g. "detroit:detroit-vod.cablecast.tv".
+
+    One module serves many tenants (every Cablecast PublicSite runs through
+    scrapers.detroit), so the module name alone would merge them; without a
+    base_url the label is the module alone.
+    """
+    label = module_name.rsplit(".", 1)[-1]
+    host = urlparse(base_url).netloc.lower() if base_url else ""
+    return f"{label}:{host}" if host else label
+
+
+def site_metrics(module_name, base_url=None):
+    """SiteMetrics labelled by site_label(module_name, base_url)."""
+    return SiteMetrics(site_label(module_name, base_url))
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+DEFAULT_MAX_PAGES = 6
+DEFAULT_MAX_NAVIGATIONS = 50
+
+
+class PagePool:
+    """Bounded pool of reusable Playwright pages on top of one BrowserContext.
+
+    Opening a page is one of the most expensive per-item steps, so detail-page
+    lookups borrow a page, navigate it, and hand it back:
+
+        async with pool.page() as page:
+            await page.goto(url)
+
+    Returned pages are reset to about:blank and reused. A page is closed and
+    replaced once it has made `max_navigations` navigations, so long crawls do
+    not accumulate renderer memory.
+    """
+
+    def __init__(self, context, max_pages=DEFAULT_MAX_PAGES, max_navigations=DEFAULT_MAX_NAVIGATIONS, name=None):
+        self.context = context
+        self.name = name
+        self.max_pages = max_pages
+        self.max_navigations = max_navigations
+        self._slots = asyncio.Semaphore(max_pages)
+        self._idle = []
+        self._navigations = {}
+        # Utilization bookkeeping
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+        self.acquired = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.wait_seconds = 0.0
+        self._busy_page_seconds = 0.0
+        self._started = time.monotonic()
+        self._last_change = self._started
+
+    def _track_in_use(self, delta):
+        now = time.monotonic()
+        self._busy_page_seconds += self.in_use * (now - self._last_change)
+        self._last_change = now
+        self.in_use += delta
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _on_navigated(self, page, frame):
+        if frame == page.main_frame and frame.url != 'about:blank':
+            self._navigations[page] = self._navigations.get(page, 0) + 1
+
+    async def _checkout(self):
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                self.reused += 1
+                return page
+            self._navigations.pop(page, None)
+        page = await self.context.new_page()
+        self._navigations[page] = 0
+        page.on('framenavigated', lambda frame, page=page: self._on_navigated(page, frame))
+        self.created += 1
+        return page
+
+    async def _checkin(self, page):
+        if page.is_closed():
+            self._navigations.pop(page, None)
+            return
+        if self._navigations.get(page, 0) >= self.max_navigations:
+            self.recycled += 1
+            await self._discard(page)
+            return
+        try:
+            # Drop the previous document (and its timers/sockets) before reuse
+            await page.goto('about:blank')
+        except Exception:
+            await self._discard(page)
+            return
+        self._idle.append(page)
+
+    async def _discard(self, page):
+        self._navigations.pop(page, None)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a page; waits while all `max_pages` pages are in use."""
+        wait_started = time.monotonic()
+        await self._slots.acquire()
+        self.wait_seconds += time.monotonic() - wait_started
+        page = None
+        try:
+            page = await self._checkout()
+            self.acquired += 1
+            self._track_in_use(+1)
+            yield page
+        finally:
+            if page is not None:
+                self._track_in_use(-1)
+                await self._checkin(page)
+            self._slots.release()
+
+    def utilization(self):
+        """Average fraction of the pool's pages that were busy since it was created."""
+        self._track_in_use(0)
+        elapsed = self._last_change - self._started
+        if elapsed <= 0:
+            return 0.0
+        return self._busy_page_seconds / (elapsed * self.max_pages)
+
+    def stats(self):
+        return {
+            "max_pages": self.max_pages,
+            "acquired": self.acquired,
+            "created": self.created,
+            "reused": self.reused,
+            "recycled": self.recycled,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "idle": len(self._idle),
+            "wait_seconds": round(self.wait_seconds, 3),
+            "utilization": round(self.utilization(), 3),
+        }
+
+    def report(self):
+        stats = self.stats()
+        label = f"[PagePool {self.name}]" if self.name else "[PagePool]"
+        print(f"{label} {stats['acquired']} leases on {stats['created']} pages "
+              f"(reused {stats['reused']}, recycled {stats['recycled']}), "
+              f"peak {stats['peak_in_use']}/{stats['max_pages']} in use, "
+              f"utilization {stats['utilization']:.0%}, waited {stats['wait_seconds']:.1f}s")
+        return stats
+
+    async def close(self):
+        while self._idle:
+            await self._discard(self._idle.pop())
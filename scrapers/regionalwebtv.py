@@ -0,0 +1,253 @@
+import re
+from dateutil.parser import parse as dateparse
+from datetime import datetime
+from dateutil.tz import UTC
+from .checkpoints import NO_CHECKPOINT
+from .extract import extract_all
+from .scroll import InfiniteScroll
+from .waits import Waits
+from .metrics import site_metrics
+from .page_pool import PagePool
+
+class RegionalWebTVScraper:
+    def __init__(self, context, base_url, start_date=None, end_date=None, checkpoint=None, page_pool=None, metrics=None):
+        if start_date is not None and isinstance(start_date, str):
+            start_date = dateparse(start_date)
+        if end_date is not None and isinstance(end_date, str):
+            end_date = dateparse(end_date)
+        # Make start_date and end_date timezone-aware (UTC) if not already
+        if start_date is not None and start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=UTC)
+        if end_date is not None and end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=UTC)
+        self.context = context
+        self.base_url = base_url
+        self.start_date = start_date
+        self.end_date = end_date
+        self.checkpoint = checkpoint or NO_CHECKPOINT
+        self.metrics = metrics or site_metrics(__name__, base_url)
+        # Detail/iframe pages are borrowed from a pool instead of opened per item
+        self.pages = page_pool or PagePool(context)
+        self.waits = Waits(self.metrics)
+
+    async def extract_date_from_title(self, title):
+        # Match dates like 2/8/2022, 2-8-2022, 2 8 2022, 02/08/2022, etc.
+        date_patterns = [
+            r'(\d{1,2})[\/\-\s](\d{1,2})[\/\-\s](\d{2,4})'
+        ]
+        for pattern in date_patterns:
+            match = re.search(pattern, title)
+            if match:
+                month, day, year = match.groups()
+                if len(year) == 2:
+                    year = '20' + year  # handle 2-digit years
+                try:
+                    dt = datetime(int(year), int(month), int(day))
+                    return dt.strftime('%Y-%m-%d')
+                except Exception:
+                    continue
+        return None
+
+    async def scroll_to_load_all(self, page, max_scrolls=30, wait_time=2):
+        # Try the original selector from your screenshot; stop once a scroll brings no new cards
+        async with InfiniteScroll(page, 'a.w-video-card', self.waits, self.metrics, wait_time=wait_time,
+                                  idle_limit=1, max_scrolls=max_scrolls) as scroll:
+            async for _ in scroll.counts():
+                pass
+        # Title: the h3's title or text, else any [title] inside, else the card's own text
+        return await extract_all(page, 'a.w-video-card', {
+            "href": "@href",
+            "title": ["h3@title", "h3", "[title]@title", ""],
+        })
+
+    async def scrape(self):
+        """Yield videos from every listing iframe as the cards are read."""
+        print(f"\nScraping Regional Web TV from {self.base_url}")
+        if self.start_date and self.end_date:
+            print(f"Filtering videos between {self.start_date.strftime('%Y-%m-%d')} and {self.end_date.strftime('%Y-%m-%d')}")
+        found = 0
+        seen_urls = set()
+        
+        try:
+            page = await self.context.new_page()
+            print(f"Navigating to: {self.base_url}")
+            await self.metrics.goto(page, self.base_url, wait_until='domcontentloaded', timeout=60000)
+            
+            # Wait for the listing iframes to be inserted
+            await self.waits.until(
+                page, "return !!document.querySelector('iframe[src*=\"filesusr.com/html\"]');", timeout=10)
+            
+            # Look for iframes that contain video content
+            iframes = await extract_all(page, 'iframe', {"src": "@src"})
+            print(f"Found {len(iframes)} iframes on the page")
+            
+            video_iframes = []
+            for iframe in iframes:
+                src = iframe["src"]
+                if src and 'filesusr.com/html' in src:
+                    video_iframes.append(src)
+                    print(f"Found video iframe: {src}")
+            
+            if not video_iframes:
+                print("No video iframes found. Debugging page structure...")
+                await self.debug_page_structure(page)
+                await page.close()
+                return
+            
+            # Process each video iframe
+            for iframe_url in video_iframes:
+                print(f"\nProcessing iframe: {iframe_url}")
+                
+                # Borrow a pooled page for the iframe content
+                async with self.pages.page() as iframe_page:
+                    try:
+                        await self.metrics.goto(iframe_page, iframe_url, wait_until='domcontentloaded', timeout=60000)
+                        await self.waits.count_above(iframe_page, 'a.w-video-card', 0, timeout=10, optional=True)  # Wait for content to load
+                    
+                        # Now look for video cards in the iframe
+                        card_elems = await self.scroll_to_load_all(iframe_page)
+                        print(f"Found {len(card_elems)} video items in iframe")
+                    
+                        for card in card_elems:
+                            try:
+                                href = card["href"]
+                                if not href or href in seen_urls:
+                                    continue
+                            
+                                # Make href absolute if it's relative
+                                if href.startswith('/'):
+                                    href = f"https://www.regionalwebtv.com{href}"
+                                elif not href.startswith('http'):
+                                    # If relative to iframe domain
+                                    if href.startswith('../') or not href.startswith('./'):
+                                        href = f"https://www-regionalwebtv-com.filesusr.com{href}"
+                            
+                                seen_urls.add(href)
+                            
+                                title = card["title"]
+                                if not title:
+                                    print(f"⚠️  No title found for: {href}")
+                                    continue
+                            
+                                title = title.strip()
+                                upload_date = await self.extract_date_from_title(title)
+                            
+                                # Only add if upload_date is within range (if both dates are set and upload_date is valid)
+                                add_media = True
+                                if self.start_date and self.end_date and upload_date:
+                                    try:
+                                        dt = dateparse(upload_date)
+                                        if dt.tzinfo is None:
+                                            dt = dt.replace(tzinfo=UTC)
+                                        add_media = self.start_date <= dt <= self.end_date
+                                    except Exception:
+                                        add_media = False
+                                if add_media:
+                                    found += 1
+                                    self.metrics.count("items_found")
+                                    print(f"✓ Added: {title} | {href} | {upload_date}")
+                                    yield {
+                                        "url": href,
+                                        "title": title,
+                                        "date": upload_date,
+                                        "source_type": "video"
+                                    }
+                                else:
+                                    self.metrics.count("items_filtered")
+                                    print(f"× Skipped (out of range): {title} | {upload_date}")
+                            
+                            except Exception as e:
+                                self.metrics.count("errors")
+                                print(f"Error processing card: {e}")
+                                continue
+                    
+                    except Exception as e:
+                        self.metrics.count("errors")
+                        print(f"Error processing iframe {iframe_url}: {e}")
+            
+            await page.close()
+            
+        except Exception as e:
+            self.metrics.count("errors")
+            print(f"Error in scrape_regional_webtv: {e}")
+            if 'page' in locals():
+                await page.close()
+        
+        print(f"\nTotal Regional Web TV videos found: {found}")
+
+    async def scrape_regional_webtv(self):
+        return [media async for media in self.scrape()]
+    
+    async def debug_page_structure(self, page):
+        """Debug method to understand the page structure"""
+        try:
+            print("\n=== PAGE STRUCTURE DEBUG ===")
+            
+            # Wait for any potential dynamic content
+            print("Waiting for dynamic content...")
+            await self.waits.settled(page, quiet=1, timeout=5, optional=True)
+            
+            # Get page title and URL to confirm we're on the right page
+            title = await page.title()
+            url = page.url
+            print(f"Page Title: {title}")
+            print(f"Current URL: {url}")
+            
+            # Get all links on the page with their attributes
+            all_links = await page.query_selector_all('a')
+            print(f"\nTotal links found: {len(all_links)}")
+            
+            print("\nFirst 10 links with their classes and hrefs:")
+            for i, link in enumerate(all_links[:10]):
+                href = await link.get_attribute('href')
+                class_name = await link.get_attribute('class')
+                text = await link.text_content()
+                print(f"  {i+1}. href='{href}' class='{class_name}' text='{text[:50]}...' if text else 'No text'")
+            
+            # Look for any elements with common video-related terms
+            search_terms = ['video', 'card', 'media', 'content', 'item', 'thumb', 'preview']
+            for term in search_terms:
+                elements = await page.query_selector_all(f'*[class*="{term}"]')
+                if elements:
+                    print(f"\nElements with '{term}' in class: {len(elements)}")
+                    for i, elem in enumerate(elements[:3]):
+                        class_name = await elem.get_attribute('class')
+                        tag_name = await elem.evaluate('el => el.tagName')
+                        print(f"  {i+1}. <{tag_name.lower()}> class='{class_name}'")
+            
+            # Get page HTML structure (first 3000 chars)
+            html_content = await page.content()
+            print(f"\nFirst 3000 characters of page HTML:")
+            print("=" * 50)
+            print(html_content[:3000])
+            print("=" * 50)
+            
+            # Look for iframes (content might be in iframe)
+            iframes = await page.query_selector_all('iframe')
+            print(f"\nIframes found: {len(iframes)}")
+            for i, iframe in enumerate(iframes):
+                src = await iframe.get_attribute('src')
+                print(f"  {i+1}. iframe src: {src}")
+            
+            # Check if page has JavaScript errors or is still loading
+            print(f"\nPage ready state: {await page.evaluate('document.readyState')}")
+            
+            # Try to find any divs that might contain video content
+            divs = await page.query_selector_all('div')
+            print(f"\nTotal divs found: {len(divs)}")
+            
+            # Look for divs with specific attributes that might indicate video content
+            video_related_divs = []
+            for div in divs[:20]:  # Check first 20 divs
+                class_name = await div.get_attribute('class') or ''
+                id_name = await div.get_attribute('id') or ''
+                if any(term in class_name.lower() or term in id_name.lower() 
+                       for term in ['video', 'media', 'content', 'grid', 'list', 'item']):
+                    video_related_divs.append((div, class_name, id_name))
+            
+            print(f"\nPotentially relevant divs: {len(video_related_divs)}")
+            for i, (div, class_name, id_name) in enumerate(video_related_divs[:5]):
+                print(f"  {i+1}. class='{class_name}' id='{id_name}'")
+                
+        except Exception as e:
+            print(f"Error in debug_page_structure: {e}")
@@ -0,0 +1,86 @@
+import importlib
+import inspect
+import re
+
+
+class ScraperSpec:
+    """Maps a base_url pattern to a scraper class that is imported on first use.
+
+    `profile` names the request-blocking profile (see scrapers/blocking.py)
+    applied to the scraper's browser context; None means no blocking.
+    `windowed` marks scrapers whose cost shrinks with the date range (their
+    source can be queried or seeked by date), so the planner may split
+    their range into independent windows. `options` are constructor
+    options every scraper of this spec gets (e.g. a Cablecast engine).
+    """
+
+    def __init__(self, pattern, module, class_name, profile="default", windowed=False, options=None):
+        self.pattern = re.compile(pattern, re.IGNORECASE)
+        self.module = module
+        self.class_name = class_name
+        self.profile = profile
+        self.windowed = windowed
+        self.options = options or {}
+        self._cls = None
+
+    def matches(self, base_url):
+        return bool(self.pattern.search(base_url))
+
+    def load(self):
+        # Only now do we pay for selenium/aiohttp/bs4/... of this one site
+        if self._cls is None:
+            module = importlib.import_module(self.module)
+            self._cls = getattr(module, self.class_name)
+        return self._cls
+
+    def create(self, context, base_url, start_date=None, end_date=None, **options):
+        """Instantiate the scraper; see create_scraper."""
+        cls = self.load()
+        accepted = inspect.signature(cls.__init__).parameters
+        options = {name: value for name, value in {**self.options, **options}.items() if name in accepted}
+        if hasattr(cls, 'from_base_url'):
+            return cls.from_base_url(context, base_url, start_date, end_date, **options)
+        return cls(context, base_url, start_date, end_date, **options)
+
+
+REGISTRY = [
+    ScraperSpec(r"detroit-vod\.cablecast\.tv", "scrapers.detroit", "DetroitScraper", profile="detroit", windowed=True,
+                options={"engine": "api"}),
+    ScraperSpec(r"lansdale\.org", "scrapers.lansdale", "LansdaleScraper", profile="lansdale"),
+    ScraperSpec(r"facebook\.com/DauphinCountyPA/videos", "scrapers.facebook", "FacebookVideoScraper", profile="facebook"),
+    ScraperSpec(r"charlestonwv\.portal\.civicclerk\.com", "scrapers.civicclerk", "CharlestonCivicClerkScraper", profile=None, windowed=True),
+    ScraperSpec(r"youtube\.com/@SLCLiveMeetings/streams", "scrapers.youtube", "YouTubeLiveMeetingsScraper", profile="youtube"),
+    ScraperSpec(r"regionalwebtv\.com/fredcc", "scrapers.regionalwebtv", "RegionalWebTVScraper", profile="regionalwebtv"),
+    ScraperSpec(r"winchesterva\.civicweb\.net/portal", "scrapers.winchester", "WinchesterVAScraper", profile=None, windowed=True),
+    # Any other Cablecast tenant, on cablecast.tv or its own domain
+    ScraperSpec(r"\.cablecast\.tv|/CablecastPublicSite", "scrapers.detroit", "DetroitScraper", profile="detroit", windowed=True,
+                options={"engine": "api"}),
+]
+
+
+def register(pattern, module, class_name, profile="default", windowed=False, options=None):
+    """Register a scraper for base_urls matching `pattern`; newer entries win."""
+    spec = ScraperSpec(pattern, module, class_name, profile, windowed, options)
+    REGISTRY.insert(0, spec)
+    return spec
+
+
+def resolve(base_url):
+    """Return the ScraperSpec for base_url, or None if no scraper handles it."""
+    for spec in REGISTRY:
+        if spec.matches(base_url):
+            return spec
+    return None
+
+
+def create_scraper(base_url, context, start_date=None, end_date=None, **options):
+    """Build the scraper for base_url; every scraper exposes an async scrape().
+
+    `options` (checkpoint, page_pool, ...) are passed to the scraper's
+    constructor; options a scraper does not accept are dropped, so a
+    browser-less scraper never sees the page pool.
+    """
+    spec = resolve(base_url)
+    if spec is None:
+        return None
+    return spec.create(context, base_url, start_date, end_date, **options)
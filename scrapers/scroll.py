@@ -0,0 +1,140 @@
+import asyncio
+import time
+from .extract import count
+
+# Statuses with which a site asks the client to slow down
+THROTTLE_STATUSES = {429, 503}
+# Request types that can bring in more feed items
+_FEED_REQUESTS = {"xhr", "fetch"}
+# Backoffs in a row after which a still-throttled feed is given up on
+MAX_BACKOFFS = 5
+
+SCROLL_TO_BOTTOM = "window.scrollTo(0, document.documentElement.scrollHeight)"
+
+
+class InfiniteScroll:
+    """Infinite-scroll loop shared by the feed scrapers (Facebook, YouTube, RegionalWebTV).
+
+    Each step scrolls and waits for the number of `selector` matches to grow
+    (a MutationObserver, through Waits.count_above), so the next scroll
+    follows as soon as new items render. If nothing rendered while XHR/fetch
+    requests are still in flight, the step also waits for them to finish; it
+    counts as idle only once the page has nothing left to deliver. A 429 or
+    503 answer to a feed request (XHR/fetch whose URL contains `feed_url`,
+    any XHR/fetch without one) backs off exponentially before the next
+    scroll; otherwise there is no fixed delay. Ends after `idle_limit` idle
+    steps in a row, after `max_scrolls` steps, after `max_backoffs` throttled
+    steps in a row, or when the caller stops iterating.
+
+    Use as an async context manager; leaving it detaches the request
+    listeners and prints the items/s achieved.
+    """
+
+    def __init__(self, page, selector, waits, metrics, wait_time=5, idle_limit=3, max_scrolls=None,
+                 scroll_js=SCROLL_TO_BOTTOM, backoff=1, max_backoff=30, feed_url=None, max_backoffs=MAX_BACKOFFS):
+        self.page = page
+        self.selector = selector
+        self.waits = waits
+        self.metrics = metrics
+        self.wait_time = wait_time
+        self.idle_limit = idle_limit
+        self.max_scrolls = max_scrolls
+        self.scroll_js = scroll_js
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.feed_url = feed_url
+        self.max_backoffs = max_backoffs
+        self.in_flight = set()
+        # Set while no feed request is in flight
+        self.quiet = asyncio.Event()
+        self.quiet.set()
+        self.throttled = False
+        self.scrolls = 0
+        self.backoffs = 0
+        self.first_count = None
+        self.loaded = 0
+        self._started = None
+
+    def _on_request(self, request):
+        if request.resource_type in _FEED_REQUESTS:
+            self.in_flight.add(request)
+            self.quiet.clear()
+
+    def _on_request_done(self, request):
+        self.in_flight.discard(request)
+        if not self.in_flight:
+            self.quiet.set()
+
+    def _on_response(self, response):
+        # A throttled image or analytics beacon says nothing about the feed
+        if response.status in THROTTLE_STATUSES and response.request.resource_type in _FEED_REQUESTS \
+                and (self.feed_url is None or self.feed_url in response.url):
+            self.throttled = True
+
+    def _listeners(self):
+        return {
+            "request": self._on_request,
+            "requestfinished": self._on_request_done,
+            "requestfailed": self._on_request_done,
+            "response": self._on_response,
+        }
+
+    async def __aenter__(self):
+        for event, listener in self._listeners().items():
+            self.page.on(event, listener)
+        self._started = time.perf_counter()
+        return self
+
+    async def __aexit__(self, *exc):
+        for event, listener in self._listeners().items():
+            self.page.remove_listener(event, listener)
+        elapsed = time.perf_counter() - self._started
+        new_items = self.loaded - (self.first_count or 0)
+        rate = new_items / elapsed if elapsed > 0 else 0
+        print(f"[Scroll {self.metrics.site}] {new_items} new items in {elapsed:.1f}s over {self.scrolls} scrolls "
+              f"({rate:.1f} items/s, {self.backoffs} backoffs)")
+
+    async def _step(self):
+        """Scroll once; the new item count, or None if nothing new rendered."""
+        await self.page.evaluate(self.scroll_js)
+        grown = await self.waits.count_above(self.page, self.selector, self.loaded, timeout=self.wait_time)
+        if not grown and not self.quiet.is_set():
+            # Content may still be on its way
+            await self.waits.event(self.quiet, timeout=self.wait_time)
+            grown = await self.waits.count_above(self.page, self.selector, self.loaded, timeout=0.5)
+        return grown
+
+    async def counts(self):
+        """Yield the item count: once for the items already there, then every time a scroll adds more."""
+        self.loaded = self.first_count = await count(self.page, self.selector)
+        if self.loaded:
+            yield self.loaded
+        idle_steps = 0
+        throttled_steps = 0
+        delay = self.backoff
+        while idle_steps < self.idle_limit and (self.max_scrolls is None or self.scrolls < self.max_scrolls):
+            if not self.throttled:
+                throttled_steps = 0
+            elif throttled_steps >= self.max_backoffs:
+                print(f"[Scroll {self.metrics.site}] Warning: still throttled after {throttled_steps} backoffs "
+                      f"in a row; stopping")
+                self.metrics.count("errors")
+                return
+            else:
+                self.throttled = False
+                throttled_steps += 1
+                self.backoffs += 1
+                self.metrics.count("scroll_backoffs")
+                print(f"[Scroll {self.metrics.site}] Throttled; backing off {delay}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_backoff)
+            self.scrolls += 1
+            with self.metrics.timer("scroll_step_seconds"):
+                grown = await self._step()
+            if grown:
+                idle_steps = 0
+                delay = self.backoff
+                self.loaded = grown
+                yield grown
+            elif not self.throttled:
+                idle_steps += 1
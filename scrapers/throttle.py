@@ -0,0 +1,35 @@
+import asyncio
+
+DEFAULT_DETAIL_CONCURRENCY = 4
+
+
+class RateLimiter:
+    """Spaces requests to at most `rate` per second; shared by every task that hits one host.
+
+    Each wait() reserves the next free slot, so concurrent callers queue up
+    at 1/rate intervals instead of bursting together.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def wait(self):
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class NullRateLimiter:
+    """Stand-in used when no rate cap is configured."""
+
+    rate = None
+
+    async def wait(self):
+        pass
+
+
+NO_RATE_LIMIT = NullRateLimiter()
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# Seconds a scraper may lose to optional waits that time out before the rest are skipped
+DEFAULT_WAIT_BUDGET = 180
+
+_OBSERVED = "{childList: true, subtree: true, attributes: true, characterData: true}"
+
+# `check` runs on every DOM mutation; the wait resolves with its first non-null result, or null on timeout
+_UNTIL_JS = """([arg, timeoutMs]) => new Promise(resolve => {
+    const check = () => { %s };
+    const first = check();
+    if (first !== null && first !== undefined && first !== false) return resolve(first);
+    let timer = null;
+    const observer = new MutationObserver(() => {
+        const value = check();
+        if (value === null || value === undefined || value === false) return;
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(value);
+    });
+    observer.observe(document, %s);
+    timer = setTimeout(() => { observer.disconnect(); resolve(null); }, timeoutMs);
+})"""
+
+_SETTLED_JS = """([quietMs, timeoutMs]) => new Promise(resolve => {
+    let quiet = null, overall = null;
+    const done = value => { observer.disconnect(); clearTimeout(quiet); clearTimeout(overall); resolve(value); };
+    const observer = new MutationObserver(() => { clearTimeout(quiet); quiet = setTimeout(done, quietMs, true); });
+    observer.observe(document, %s);
+    quiet = setTimeout(done, quietMs, true);
+    overall = setTimeout(done, timeoutMs, false);
+})""" % _OBSERVED
+
+COUNT_ABOVE = "const n = document.querySelectorAll(arg.selector).length; return n > arg.count ? n : null;"
+CHANGED = """const el = document.querySelector(arg.selector);
+    const value = el ? (arg.attribute ? el.getAttribute(arg.attribute) : el.textContent) : null;
+    return value && value !== arg.previous ? value : null;"""
+TEXT_MATCHES = """const pattern = new RegExp(arg.pattern);
+    for (const el of document.querySelectorAll(arg.selector)) {
+        const text = (el.textContent || '').trim();
+        if (pattern.test(text)) return text;
+    }
+    return null;"""
+
+
+class Waits:
+    """Event-driven waits for one scraper, in place of fixed sleeps and polling loops.
+
+    Every wait returns as soon as its condition holds (DOM waits through a
+    MutationObserver, network waits on Playwright response events) and
+    returns a falsy value on timeout instead of raising, so the caller can
+    carry on with what has loaded; callers must check it.
+
+    Waits are required by default and always get their full timeout.
+    Waits passed optional=True (settling, banners, best-effort content
+    checks) draw on a per-scraper budget: time lost to optional waits that
+    time out is charged to it, and once it is spent optional waits are
+    skipped instead of stalling the rest of the crawl.
+    """
+
+    def __init__(self, metrics, budget=DEFAULT_WAIT_BUDGET):
+        self.metrics = metrics
+        self.budget = budget
+        self.spent = 0.0
+        self._exhausted_reported = False
+
+    def timeout_ms(self, seconds, optional=False):
+        if optional:
+            remaining = self.budget - self.spent
+            if remaining <= 0 and not self._exhausted_reported:
+                self._exhausted_reported = True
+                print(f"[Waits {self.metrics.site}] Optional wait budget of {self.budget}s spent; skipping optional waits")
+            seconds = min(seconds, remaining)
+        # Playwright treats 0 as "no timeout"
+        return max(1, int(seconds * 1000))
+
+    @contextmanager
+    def _charged(self, result, optional):
+        """Time the wait into selector_wait_seconds; an optional wait that ends with a falsy result[0] is charged to the budget."""
+        started = time.perf_counter()
+        try:
+            with self.metrics.timer("selector_wait_seconds"):
+                yield
+        finally:
+            if optional and not result[0]:
+                self.spent += time.perf_counter() - started
+
+    async def until(self, page, check, arg=None, timeout=10, optional=False):
+        """First non-null result of the JS function body `check` (it sees `arg`), re-run on every DOM mutation."""
+        result = [None]
+        with self._charged(result, optional):
+            try:
+                result[0] = await page.evaluate(_UNTIL_JS % (check, _OBSERVED), [arg, self.timeout_ms(timeout, optional)])
+            except Exception:
+                # The page navigated or closed underneath the observer
+                pass
+        return result[0]
+
+    async def count_above(self, page, selector, count, timeout=10, optional=False):
+        """Number of `selector` matches once it exceeds `count`; None on timeout."""
+        return await self.until(page, COUNT_ABOVE, {"selector": selector, "count": count}, timeout, optional)
+
+    async def changed(self, page, selector, previous, attribute=None, timeout=10, optional=False):
+        """The first match's attribute (or text) once it differs from `previous`; None on timeout."""
+        return await self.until(page, CHANGED, {"selector": selector, "attribute": attribute, "previous": previous}, timeout, optional)
+
+    async def text(self, page, selector, pattern, timeout=10, optional=False):
+        """Text of the first `selector` match whose text matches the JS regex `pattern`; None on timeout."""
+        return await self.until(page, TEXT_MATCHES, {"selector": selector, "pattern": pattern}, timeout, optional)
+
+    async def settled(self, page, quiet=0.5, timeout=5, optional=False):
+        """True once the DOM has not changed for `quiet` seconds, False if it kept changing until timeout."""
+        result = [False]
+        with self._charged(result, optional):
+            try:
+                result[0] = await page.evaluate(_SETTLED_JS, [int(quiet * 1000), self.timeout_ms(timeout, optional)])
+            except Exception:
+                pass
+        return result[0]
+
+    async def selector(self, root, selector, timeout=10, optional=False, **kwargs):
+        """root.wait_for_selector (root is a Page, Frame or ElementHandle); None on timeout."""
+        result = [None]
+        with self._charged(result, optional):
+            try:
+                result[0] = await root.wait_for_selector(selector, timeout=self.timeout_ms(timeout, optional), **kwargs)
+            except PlaywrightTimeoutError:
+                pass
+        return result[0]
+
+    async def response(self, page, predicate, timeout=10, optional=False):
+        """Next response for which predicate(response) is true; None on timeout."""
+        result = [None]
+        with self._charged(result, optional):
+            try:
+                result[0] = await page.wait_for_event("response", predicate=predicate, timeout=self.timeout_ms(timeout, optional))
+            except PlaywrightTimeoutError:
+                pass
+        return result[0]
+
+    async def event(self, event, timeout=10, optional=False):
+        """True once the asyncio.Event is set (e.g. by a response handler), False on timeout."""
+        result = [False]
+        with self._charged(result, optional):
+            try:
+                result[0] = await asyncio.wait_for(event.wait(), self.timeout_ms(timeout, optional) / 1000)
+            except asyncio.TimeoutError:
+                pass
+        return result[0]
+
+    async def response_after(self, page, action, predicate, timeout=10, optional=False):
+        """Await action() and then the response matching predicate that it triggered; None on timeout.
+
+        The listener is installed before the action runs, so a fast response is not missed.
+        """
+        result = [None]
+        with self._charged(result, optional):
+            try:
+                async with page.expect_response(predicate, timeout=self.timeout_ms(timeout, optional)) as response_info:
+                    await action()
+                result[0] = await response_info.value
+            except PlaywrightTimeoutError:
+                pass
+        return result[0]
@@ -0,0 +1,50 @@
+import importlib.util
+import re
+from bs4 import BeautifulSoup
+
+PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+_POSTBACK = re.compile(r"__doPostBack\(\s*['\"]([^'\"]*)['\"]\s*,\s*['\"]([^'\"]*)['\"]\s*\)")
+
+# Input types a browser leaves out of a postback that was not triggered by them
+_SKIPPED_INPUTS = {"submit", "button", "image", "reset", "file"}
+
+
+def parse(html):
+    """BeautifulSoup with lxml when it is installed (several times faster), html.parser otherwise."""
+    return BeautifulSoup(html, PARSER)
+
+
+def form_state(soup):
+    """(action, fields) of the page's first form: __VIEWSTATE, __EVENTVALIDATION and every other named control."""
+    form = soup.find("form") or soup
+    fields = {}
+    for control in form.find_all("input", attrs={"name": True}):
+        kind = (control.get("type") or "text").lower()
+        if kind in _SKIPPED_INPUTS:
+            continue
+        if kind in ("checkbox", "radio") and not control.has_attr("checked"):
+            continue
+        fields[control["name"]] = control.get("value", "")
+    for control in form.find_all("select", attrs={"name": True}):
+        option = control.find("option", selected=True) or control.find("option")
+        if option is not None:
+            fields[control["name"]] = option.get("value", option.get_text())
+    for control in form.find_all("textarea", attrs={"name": True}):
+        fields[control["name"]] = control.get_text()
+    return form.get("action"), fields
+
+
+def postback_links(soup, selector):
+    """{link text: (event target, event argument)} for the javascript:__doPostBack links matching selector."""
+    links = {}
+    for link in soup.select(selector):
+        match = _POSTBACK.search(link.get("href") or "")
+        if match:
+            links[link.get_text(strip=True)] = match.groups()
+    return links
+
+
+def postback_data(fields, target, argument=""):
+    """Form body that replays __doPostBack(target, argument) with the page's state."""
+    return {**fields, "__EVENTTARGET": target, "__EVENTARGUMENT": argument}
@@ -0,0 +1,214 @@
+import asyncio
+import threading
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+from .checkpoints import NO_CHECKPOINT
+from .dedup import NO_DEDUP
+from .http_cache import NO_CACHE, fetch_requests
+from .metrics import site_metrics
+
+DOCUMENT_WAIT_SECONDS = 10
+
+
+def document_populated(driver):
+    """WebDriverWait condition: the page has loaded and the meeting document iframe has its src."""
+    return driver.execute_script(
+        "const frame = document.getElementById('ctl00_MainContent_MeetingDocument');"
+        "return document.readyState === 'complete' && (!frame || !!frame.getAttribute('src'));"
+    )
+
+# WinchesterVAScraper (for https://winchesterva.civicweb.net/portal/)
+class WinchesterVAScraper:
+    def __init__(self, start_date=None, end_date=None, checkpoint=None, dedup=None,
+                 site_url="https://winchesterva.civicweb.net", http_cache=None, metrics=None):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.checkpoint = checkpoint or NO_CHECKPOINT
+        self.dedup = dedup or NO_DEDUP
+        self.http_cache = http_cache or NO_CACHE
+        self.metrics = metrics or site_metrics(__name__, site_url)
+        self.base_url = site_url.rstrip('/')
+        self.headers = {
+            "User-Agent": "Mozilla/5.0",
+            "Accept": "text/html",
+            "Referer": f"{self.base_url}/Portal/MeetingInformation.aspx",
+            "X-Requested-With": "XMLHttpRequest"
+        }
+        # Set when scrape() is cancelled or closed; executor threads check it and stop
+        self.cancelled = threading.Event()
+        # WebDrivers running in executor threads, quit from the loop on cancellation
+        self._drivers = set()
+        self._drivers_lock = threading.Lock()
+
+    @classmethod
+    def from_base_url(cls, context, base_url, start_date=None, end_date=None, **options):
+        # Uses requests + Selenium, not the shared Playwright context
+        parts = urlparse(base_url)
+        return cls(start_date, end_date, site_url=f"{parts.scheme}://{parts.netloc}", **options)
+
+    async def scrape(self):
+        """Yield each meeting's medias as soon as its detail page has been read.
+
+        requests and Selenium are blocking, so every call runs in an executor
+        thread. Cancelling the scrape (e.g. the orchestrator's task timeout)
+        cannot stop that thread, so it sets `cancelled` and quits the running
+        WebDriver instead; the thread then returns without starting another.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            meetings = await loop.run_in_executor(None, self.fetch_meetings, self.start_date, self.end_date)
+            for meeting in meetings:
+                if self.checkpoint.is_done('meetings', meeting.get("Id")):
+                    # Already resolved by an interrupted earlier run
+                    continue
+                meeting_url = self.meeting_url(meeting.get("Id"))
+                if self.dedup.is_known(meeting_url):
+                    # An earlier run already found both its agenda and video; skip the Selenium visit
+                    continue
+                with self.metrics.timer("item_extract_seconds"):
+                    medias = await loop.run_in_executor(None, self.meeting_to_medias, meeting)
+                for media in medias:
+                    self.metrics.count("items_found")
+                    yield media
+                self.checkpoint.mark_done('meetings', meeting.get("Id"))
+                # A meeting missing its agenda or video is revisited next run, it may be posted later
+                if {media["source_type"] for media in medias} >= {"document", "video"}:
+                    self.dedup.remember(self.base_url, meeting_url)
+        finally:
+            self.cancel()
+
+    def cancel(self):
+        """Stop the executor threads: no new WebDriver starts, and running ones are quit."""
+        self.cancelled.set()
+        with self._drivers_lock:
+            drivers = list(self._drivers)
+        for driver in drivers:
+            # quit() talks to chromedriver over HTTP; keep that off the event loop
+            threading.Thread(target=driver.quit, daemon=True).start()
+
+    def fetch_meetings(self, from_date="2024-07-01", to_date="9999-12-31"):
+        """Fetch all meetings from the API within the specified date range."""
+        url = f"{self.base_url}/Services/MeetingsService.svc/meetings?from={from_date}&to={to_date}"
+        self.metrics.count("pages_navigated")
+        with self.metrics.timer("goto_seconds"):
+            response = fetch_requests(url, self.http_cache, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
+
+    def meeting_url(self, meeting_id):
+        return f"{self.base_url}/Portal/MeetingInformation.aspx?Org=Cal&Id={meeting_id}"
+
+    def fetch_meeting_details_with_selenium(self, meeting_id):
+        """Fetch detailed meeting information including agenda and video links using Selenium."""
+        url = self.meeting_url(meeting_id)
+
+        # Configure headless Chrome browser
+        options = Options()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+
+        if self.cancelled.is_set():
+            return None, None
+        # Launch browser
+        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        with self._drivers_lock:
+            self._drivers.add(driver)
+        try:
+            if self.cancelled.is_set():
+                return None, None
+            self.metrics.count("pages_navigated")
+            with self.metrics.timer("goto_seconds"):
+                driver.get(url)
+
+            # Wait for JS to populate the iframe instead of sleeping a fixed 3s
+            try:
+                with self.metrics.timer("selector_wait_seconds"):
+                    WebDriverWait(driver, DOCUMENT_WAIT_SECONDS).until(document_populated)
+            except TimeoutException:
+                print(f"Meeting {meeting_id}: document frame not populated after {DOCUMENT_WAIT_SECONDS}s")
+
+            soup = BeautifulSoup(driver.page_source, "html.parser")
+        except WebDriverException:
+            if self.cancelled.is_set():
+                # cancel() quit the driver under us
+                return None, None
+            raise
+        finally:
+            with self._drivers_lock:
+                self._drivers.discard(driver)
+            driver.quit()
+
+        # Locate iframe with document link
+        iframe = soup.find("iframe", {"id": "ctl00_MainContent_MeetingDocument"})
+        agenda_src = iframe.get("src") if iframe else None
+        agenda_link = self.base_url + agenda_src if agenda_src else None
+
+        # Locate video link
+        video_link = None
+        for a in soup.find_all("a", href=True):
+            if "video" in a.text.lower() or "video" in a["href"].lower():
+                video_link = a["href"]
+                if not video_link.startswith("http"):
+                    video_link = self.base_url + video_link
+                break
+
+        return agenda_link, video_link
+
+    def meeting_to_medias(self, meeting):
+        """Resolve one meeting from the API into its media dicts (document and/or video)."""
+        if self.cancelled.is_set():
+            return []
+        meeting_id = meeting.get("Id")
+        name = meeting.get("Name")
+        date = meeting.get("MeetingDate")
+        
+        print(f"Processing: {date} - {name} (ID: {meeting_id})")
+        
+        agenda_link, video_link = self.fetch_meeting_details_with_selenium(meeting_id)
+        
+        medias = []
+        
+        # Add document if found
+        if agenda_link:
+            medias.append({
+                "url": agenda_link,
+                "title": name,
+                "date": date,
+                "source_type": "document"
+            })
+            print(f"  Found document: {agenda_link}")
+        
+        # Add video if found
+        if video_link:
+            medias.append({
+                "url": video_link,
+                "title": name,
+                "date": date,
+                "source_type": "video"
+            })
+            print(f"  Found video: {video_link}")
+        
+        if not agenda_link and not video_link:
+            print("  No media found for this meeting")
+        
+        print()
+        return medias
+
+    def scrape_meetings_to_json(self, start_date, end_date):
+        """Scrape meetings and return a list of media dicts (documents and videos)."""
+        meetings = self.fetch_meetings(from_date=start_date, to_date=end_date)
+        
+        medias = []
+        
+        for meeting in meetings:
+            medias.extend(self.meeting_to_medias(meeting))
+        
+        return medias
@@ -0,0 +1,209 @@
+import re
+from urllib.parse import urljoin
+from dateutil.parser import parse as dateparse
+from dateutil.tz import UTC
+from .checkpoints import NO_CHECKPOINT
+from .metrics import site_metrics
+from .dedup import NO_DEDUP
+from .dates import before_start, estimate_date
+from .extract import extract_all
+from .scroll import InfiniteScroll
+from .waits import Waits
+from .page_pool import PagePool
+
+# InnerTube endpoint the streams tab loads its continuation pages from
+FEED_PATH = "/youtubei/v1/browse"
+
+# Metadata line ("12 views • Streamed 3 weeks ago") of every item from index `start` on
+ITEM_METADATA_JS = """([selector, start]) => Array.prototype.slice.call(document.querySelectorAll(selector), start)
+    .map(item => { const line = item.querySelector('#metadata-line'); return line ? line.textContent : ''; })"""
+
+class YouTubeLiveMeetingsScraper:
+    def __init__(self, context, base_url, start_date=None, end_date=None, checkpoint=None, page_pool=None, dedup=None, metrics=None):
+        from dateutil.parser import parse as dateparse
+        self.context = context
+        self.base_url = base_url
+        if start_date is not None and isinstance(start_date, str):
+            start_date = dateparse(start_date)
+        if end_date is not None and isinstance(end_date, str):
+            end_date = dateparse(end_date)
+        # Make start_date and end_date timezone-aware (UTC) if not already
+        if start_date is not None and start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=UTC)
+        if end_date is not None and end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=UTC)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.checkpoint = checkpoint or NO_CHECKPOINT
+        self.metrics = metrics or site_metrics(__name__, base_url)
+        self.dedup = dedup or NO_DEDUP
+        # Detail/iframe pages are borrowed from a pool instead of opened per item
+        self.pages = page_pool or PagePool(context)
+        self.waits = Waits(self.metrics)
+
+    async def oldest_loaded(self, page, start, oldest):
+        """Oldest upload date estimated from the metadata lines of the items loaded from index `start` on."""
+        for metadata in await page.evaluate(ITEM_METADATA_JS, ['ytd-rich-item-renderer', start]):
+            estimate = estimate_date(metadata)
+            if estimate is not None and (oldest is None or estimate < oldest):
+                oldest = estimate
+        return oldest
+
+    async def scroll_to_load_all_youtube_videos(self, page, max_scrolls=None, wait_time=5, no_new_limit=3):
+        """Scroll the streams tab until it stops growing or, newest first, its items are older than start_date."""
+        print("[Scroll] Starting to scroll to load YouTube videos...")
+        last_count = 0
+        oldest = None
+        async with InfiniteScroll(page, 'ytd-rich-item-renderer', self.waits, self.metrics, wait_time=wait_time,
+                                  idle_limit=no_new_limit, max_scrolls=max_scrolls, feed_url=FEED_PATH) as scroll:
+            async for loaded in scroll.counts():
+                print(f"[Scroll] {loaded} videos loaded so far.")
+                oldest = await self.oldest_loaded(page, last_count, oldest)
+                last_count = loaded
+                if before_start(oldest, self.start_date):
+                    print(f"[Scroll] Loaded items back to {oldest.strftime('%Y-%m-%d')}, before the start date. Stopping scroll.")
+                    break
+        print(f"[Scroll] Finished scrolling. Total videos loaded: {last_count}")
+        return await extract_all(page, 'ytd-rich-item-renderer', {
+            "href": "a#video-title-link@href",
+            "title": ["a#video-title-link@title", "a#video-title-link"],
+            "metadata": "#metadata-line",
+        })
+
+    async def extract_upload_date_from_video(self, video_url):
+        print(f"[DateExtract] Visiting video page: {video_url}")
+        async with self.pages.page() as page:
+            try:
+                await self.metrics.goto(page, video_url, wait_until='domcontentloaded', timeout=60000)
+                # Try to find and click the 'more' button robustly
+                try:
+                    more_btn = await self.waits.selector(page, 'tp-yt-paper-button#expand', state='visible', timeout=5, optional=True)
+                    if not more_btn:
+                        # Try fallback selector
+                        btns = await page.query_selector_all('tp-yt-paper-button')
+                        for btn in btns:
+                            btn_text = (await btn.text_content() or '').strip().lower()
+                            if btn_text == 'more':
+                                more_btn = btn
+                                break
+                    if more_btn:
+                        is_enabled = True
+                        try:
+                            is_enabled = await more_btn.is_enabled()
+                        except Exception:
+                            pass
+                        if is_enabled:
+                            print("[DateExtract] Clicking 'more' button to expand description...")
+                            await more_btn.click()
+                        else:
+                            print("[DateExtract] 'more' button found but not enabled.")
+                    else:
+                        print("[DateExtract] 'more' button not found. Listing all tp-yt-paper-button texts:")
+                        btns = await page.query_selector_all('tp-yt-paper-button')
+                        for i, btn in enumerate(btns):
+                            btn_text = (await btn.text_content() or '').strip()
+                            print(f"  [Button {i+1}] {btn_text}")
+                except Exception as e:
+                    print(f"[DateExtract] Could not click 'more' button: {e}")
+                # Wait for the expanded date string to appear (up to 10s)
+                date_text = await self.waits.text(
+                    page, 'span.yt-formatted-string', '(Streamed live on|Premiered on|Published on) ', timeout=10)
+                if date_text:
+                    print(f"[DateExtract] Found date string: {date_text}")
+                    match = re.search(r'(Streamed live on|Premiered on|Published on) (.+)', date_text)
+                    if match:
+                        date_part = match.group(2)
+                        try:
+                            dt = dateparse(date_part)
+                            result = dt.strftime('%Y-%m-%d')
+                            print(f"[DateExtract] Parsed upload date: {result}")
+                            return result
+                        except Exception as e:
+                            print(f"[DateExtract] Failed to parse date: {e}")
+                else:
+                    print("[DateExtract] No upload date string found on video page after clicking 'more'. Printing all candidate texts:")
+                    candidates = await extract_all(page, 'span.yt-formatted-string', {"text": ""})
+                    for i, span in enumerate(candidates):
+                        print(f"  [Candidate {i+1}] {(span['text'] or '').strip()}")
+                return None
+            except Exception as e:
+                self.metrics.count("errors")
+                print(f"[DateExtract] Error visiting video page: {e}")
+                return None
+
+    async def scrape(self):
+        """Yield channel videos in the date range as their upload dates are resolved."""
+        print(f"\nScraping YouTube Live Meetings from {self.base_url}")
+        found = 0
+        seen_urls = set()
+        page = await self.context.new_page()
+        try:
+            print(f"Navigating to: {self.base_url}")
+            await self.metrics.goto(page, self.base_url, wait_until='domcontentloaded', timeout=60000)
+
+            # Incremental scroll to load all videos
+            video_items = await self.scroll_to_load_all_youtube_videos(page)
+            print(f"[Main] Found {len(video_items)} video items. Beginning extraction...")
+            for idx, item in enumerate(video_items):
+                print(f"[Main] Processing video {idx+1}/{len(video_items)}...")
+                href = item["href"]
+                title = (item["title"] or 'YouTube Video').strip()
+                if not href:
+                    print(f"[Main] Skipping video {idx+1}: No href found.")
+                    continue
+                full_url = urljoin(self.base_url, href)
+                if full_url in seen_urls:
+                    print(f"[Main] Skipping video {idx+1}: Duplicate URL.")
+                    continue
+                seen_urls.add(full_url)
+                estimate = estimate_date(item["metadata"])
+                if before_start(estimate, self.start_date):
+                    # The feed is newest first, so every later item is older too
+                    self.metrics.count("items_filtered")
+                    print(f"[Main] Stopping: '{item['metadata'].strip()}' is before start date {self.start_date.strftime('%Y-%m-%d')}")
+                    break
+                if self.checkpoint.is_done('details', full_url):
+                    # Already resolved by an interrupted earlier run
+                    continue
+                if self.dedup.is_known(full_url):
+                    print(f"[Main] Skipping video {idx+1}: Already ingested by an earlier run.")
+                    continue
+                # Visit the video page and extract the upload date
+                with self.metrics.timer("item_extract_seconds"):
+                    upload_date = await self.extract_upload_date_from_video(full_url)
+                dt = None
+                if upload_date:
+                    try:
+                        dt = dateparse(upload_date)
+                        if dt.tzinfo is None:
+                            dt = dt.replace(tzinfo=UTC)
+                    except Exception:
+                        print(f"[Main] Could not parse upload date: {upload_date}")
+                # Filter by date range
+                add_media = True
+                if self.start_date and self.end_date and dt:
+                    if dt < self.start_date:
+                        self.metrics.count("items_filtered")
+                        print(f"[Main] Stopping: found date {dt.strftime('%Y-%m-%d')} before start date {self.start_date.strftime('%Y-%m-%d')}")
+                        break
+                    if not (self.start_date <= dt <= self.end_date):
+                        self.metrics.count("items_filtered")
+                        print(f"[Main] Skipping (out of range): {title} | {upload_date}")
+                        add_media = False
+                if add_media:
+                    found += 1
+                    self.metrics.count("items_found")
+                    print(f"[Main] ✓ Added: {title} | {full_url} | {upload_date}")
+                    yield {
+                        "url": full_url,
+                        "title": title,
+                        "date": upload_date,
+                        "source_type": "video"
+                    }
+                self.checkpoint.mark_done('details', full_url)
+        finally:
+            await page.close()
+        print(f"\n[Main] Total YouTube Live Meetings found: {found}")
+
+    async def scrape_youtube_live_meetings(self):
+        return [media async for media in self.scrape()]
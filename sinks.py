@@ -0,0 +1,69 @@
+import json
+
+
+class GroupedJsonSink:
+    """Buffer every media and write the grouped output.json shape on close."""
+
+    def __init__(self, path, base_urls):
+        self.path = path
+        self._groups = {base_url: [] for base_url in base_urls}
+
+    def write(self, base_url, media):
+        self._groups.setdefault(base_url, []).append(media)
+
+    def results(self):
+        return [{"base_url": base_url, "medias": medias} for base_url, medias in self._groups.items()]
+
+    def close(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.results(), f, indent=2, ensure_ascii=False)
+        print(f"Results written to {self.path}")
+
+
+class JsonlSink:
+    """Append one JSON line per media as soon as a scraper yields it.
+
+    Each line is the media dict plus its `base_url`, and is flushed right away
+    so a crash keeps everything written so far and other processes can tail
+    the file while the crawl is still running.
+    """
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, base_url, media):
+        record = {"base_url": base_url}
+        record.update(media)
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+        print(f"Results streamed to {self.path}")
+
+
+def read_jsonl(path):
+    """Yield records from a JSONL results file, skipping a torn last line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Skipping malformed line in {path}: {line[:80]}")
+
+
+def compact_jsonl(jsonl_path, output_path, base_urls=()):
+    """Rebuild the grouped output.json shape from a JSONL results file.
+
+    Groups follow `base_urls` order (so every input site is present even with
+    no medias), followed by any other base_url found in the file.
+    """
+    sink = GroupedJsonSink(output_path, base_urls)
+    for record in read_jsonl(jsonl_path):
+        base_url = record.pop("base_url", None)
+        sink.write(base_url, record)
+    sink.close()
@@ -0,0 +1,16 @@
+from scrapers.blocking import get_profile
+
+
+def test_feed_sites_keep_their_stylesheets():
+    for site in ("youtube", "facebook"):
+        profile = get_profile(site)
+        assert not profile.should_block("https://www.youtube.com/s/desktop/1/cssbin/www-main.css", "stylesheet")
+        assert profile.should_block("https://i.ytimg.com/vi/abc/hqdefault.jpg", "image")
+        assert profile.should_block("https://www.googletagmanager.com/gtag/js", "script")
+    assert not get_profile("youtube").should_block("https://www.youtube.com/youtubei/v1/browse", "fetch")
+
+
+def test_other_sites_drop_stylesheets():
+    assert get_profile("lansdale").should_block("https://www.lansdale.org/site.css", "stylesheet")
+    assert get_profile("unknown").name == "default"
+    assert get_profile(None) is None
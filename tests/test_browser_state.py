@@ -0,0 +1,29 @@
+import asyncio
+from scrapers.browser_state import BrowserStateStore
+
+
+class FakeContext:
+    def __init__(self, state):
+        self.state = state
+
+    async def storage_state(self):
+        return self.state
+
+
+def test_state_is_shared_by_every_store_on_the_root(tmp_path):
+    state = {"cookies": [{"name": "consent", "value": "1", "expires": -1}], "origins": []}
+    asyncio.run(BrowserStateStore(str(tmp_path)).save_state("example.org", FakeContext(state)))
+    # Another worker process builds its own store on the same root
+    assert BrowserStateStore(str(tmp_path)).load_state("example.org") == state
+
+
+def test_busy_profile_slots_are_skipped_until_released(tmp_path):
+    first, second = BrowserStateStore(str(tmp_path)), BrowserStateStore(str(tmp_path))
+    lock_a, dir_a = first._acquire_profile("example.org")
+    lock_b, dir_b = second._acquire_profile("example.org")
+    assert dir_a != dir_b
+    lock_a.close()
+    lock_c, dir_c = second._acquire_profile("example.org")
+    assert dir_c == dir_a
+    lock_b.close()
+    lock_c.close()
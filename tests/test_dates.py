@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta
+from dateutil.tz import UTC
+from scrapers.dates import before_start, estimate_date
+
+NOW = datetime(2024, 3, 31, 12, tzinfo=UTC)
+
+
+def test_relative_phrases():
+    assert estimate_date("Streamed 3 weeks ago", NOW) == NOW - timedelta(weeks=3)
+    assert estimate_date("an hour ago", NOW) == NOW - timedelta(hours=1)
+    assert estimate_date("1.2K views · 2 days ago", NOW) == NOW - timedelta(days=2)
+    assert estimate_date("Yesterday", NOW) == NOW - timedelta(days=1)
+    assert estimate_date("Streamed just now", NOW) == NOW
+    assert estimate_date("Council meeting", NOW) is None
+    assert estimate_date("", NOW) is None
+
+
+def test_months_and_years_are_lower_bounds():
+    # February 2024 has 29 days: "1 month ago" may be as recent as 4 weeks back
+    one_month = estimate_date("1 month ago", NOW)
+    assert one_month == NOW - timedelta(weeks=4)
+    assert one_month >= datetime(2024, 2, 29, 12, tzinfo=UTC)
+    assert estimate_date("a year ago", NOW) == NOW - timedelta(days=365)
+
+
+def test_before_start():
+    start = datetime(2024, 3, 1, tzinfo=UTC)
+    assert before_start(datetime(2024, 2, 28, tzinfo=UTC), start)
+    assert not before_start(start, start)
+    assert not before_start(None, start)
+    assert not before_start(datetime(2024, 2, 28, tzinfo=UTC), None)
@@ -0,0 +1,26 @@
+from scrapers.dedup import DedupIndex, identity_keys
+
+
+def test_tenant_ids_are_scoped_by_host():
+    keys = identity_keys("https://charlestonwv.api.civicclerk.com/v1/Meetings/GetMeetingFileStream(fileId=7420,plainText=false)")
+    assert "civicclerk:charlestonwv.api.civicclerk.com:7420" in keys
+    assert "civicclerk:7420" not in keys
+
+
+def test_youtube_ids_stay_global():
+    assert "youtube:dQw4w9WgXcQ" in identity_keys("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    assert "youtube:dQw4w9WgXcQ" in identity_keys("https://youtu.be/dQw4w9WgXcQ")
+
+
+def test_two_tenants_sharing_an_id_are_both_new(tmp_path):
+    index = DedupIndex(str(tmp_path / "seen.sqlite"))
+    try:
+        index.remember("https://charlestonwv.portal.civicclerk.com/",
+                       "https://charlestonwv.api.civicclerk.com/v1/Meetings/GetMeetingFileStream(fileId=7420)")
+        index.remember("https://winchesterva.civicweb.net", "https://winchesterva.civicweb.net/document/123")
+        assert not index.is_known("https://other.api.civicclerk.com/v1/Meetings/GetMeetingFileStream(fileId=7420)")
+        assert not index.is_known("https://fooville.civicweb.net/document/123")
+        # Same tenant, different URL form: still recognized by its id
+        assert index.is_known("https://winchesterva.civicweb.net/document/123?splitter=1")
+    finally:
+        index.close()
@@ -0,0 +1,53 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from dateutil.tz import UTC
+from scrapers.detroit import DetroitScraper
+
+PER_PAGE = 20
+NEWEST = datetime(2024, 12, 31, tzinfo=UTC)
+
+
+class FakePool:
+    max_pages = 4
+
+    @asynccontextmanager
+    async def page(self):
+        yield None
+
+
+class StubGallery(DetroitScraper):
+    """500 meetings, one a day and newest first, 20 per gallery page; `undated` pages have no dates in their titles."""
+
+    def __init__(self, start_date, end_date, undated=()):
+        super().__init__(None, start_date, end_date, ["https://tv.example.gov/CablecastPublicSite"],
+                         page_pool=FakePool())
+        self.undated = set(undated)
+        self.loads = 0
+
+    async def read_gallery_page(self, page, base_url, page_number):
+        self.loads += 1
+        items = []
+        for i in range((page_number - 1) * PER_PAGE, min(page_number * PER_PAGE, 500)):
+            day = NEWEST - timedelta(days=i)
+            title = "Council Meeting" if page_number in self.undated else f"Council Meeting {day:%m-%d-%Y}"
+            items.append((title, f"{base_url}/show/{i}", None if page_number in self.undated else day))
+        return items
+
+
+def _scrape(scraper):
+    async def collect():
+        return [media async for media in scraper.scrape_gallery()]
+    return asyncio.run(collect())
+
+
+def test_undated_page_does_not_end_the_search():
+    # 2024-06 is on gallery pages 10-12
+    found = _scrape(StubGallery("2024-06-01", "2024-06-30", undated=[3]))
+    assert len(found) == 30
+
+
+def test_dated_gallery_finds_the_window():
+    scraper = StubGallery("2024-06-01", "2024-06-30")
+    assert len(_scrape(scraper)) == 30
+    assert scraper.loads < 25
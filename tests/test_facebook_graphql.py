@@ -0,0 +1,24 @@
+import json
+from scrapers.facebook_graphql import GraphqlVideos
+
+
+def test_video_is_held_back_until_complete():
+    videos = GraphqlVideos("https://www.facebook.com/X/videos")
+    videos.add_payload(json.dumps({"data": {"node": {"__typename": "Video", "id": "12"}}}))
+    assert videos.take_new() == []
+    videos.add_payload(json.dumps({"data": {"video": {
+        "__typename": "Video", "id": "12", "title": {"text": "Budget hearing"},
+        "url": "https://www.facebook.com/X/videos/12/", "creation_time": 1690000000}}}))
+    (media, created), = videos.take_new()
+    assert media["title"] == "Budget hearing"
+    assert media["date"] == "2023-07-22"
+    assert videos.take_new() == []
+
+
+def test_final_flush_hands_out_incomplete_videos():
+    videos = GraphqlVideos("https://www.facebook.com/X/videos")
+    videos.add_payload("for (;;);" + json.dumps({"data": {"__typename": "Video", "id": "7"}}))
+    assert videos.take_new() == []
+    (media, created), = videos.take_new(final=True)
+    assert media["url"] == "https://www.facebook.com/X/videos/7/"
+    assert created is None
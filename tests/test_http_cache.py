@@ -0,0 +1,32 @@
+import json
+from scrapers.http_cache import HttpCache, request_key
+
+
+def test_json_results_are_caller_owned(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store("GET", "http://example.test/shows", 200, {"Content-Type": "application/json"}, b'{"shows": [{"vods": [1]}]}')
+    first = cache.lookup("GET", "http://example.test/shows").json()
+    first["shows"][0]["vods"] = [{"id": 1}]
+    second = cache.lookup("GET", "http://example.test/shows").json()
+    assert second == {"shows": [{"vods": [1]}]}
+
+
+def test_form_data_dicts_key_like_their_encoding():
+    form = {"__EVENTTARGET": "pager$2", "__VIEWSTATE": "abc="}
+    assert request_key("POST", "http://example.test/", form) == \
+        request_key("POST", "http://example.test/", "__EVENTTARGET=pager%242&__VIEWSTATE=abc%3D")
+    assert request_key("POST", "http://example.test/", form) != \
+        request_key("POST", "http://example.test/", {"__EVENTTARGET": "pager$3", "__VIEWSTATE": "abc="})
+
+
+def test_json_is_parsed_once_per_body(tmp_path, monkeypatch):
+    cache = HttpCache(str(tmp_path))
+    cache.store("GET", "http://example.test/a", 200, {}, b'{"id": 1}')
+    cache.store("GET", "http://example.test/b", 200, {}, b'{"id": 1}')
+    first, second = cache.lookup("GET", "http://example.test/a"), cache.lookup("GET", "http://example.test/b")
+    loads = []
+    real_loads = json.loads
+    monkeypatch.setattr("scrapers.http_cache.json.loads", lambda body: loads.append(body) or real_loads(body))
+    assert first.json() == {"id": 1}
+    assert second.json() == {"id": 1}
+    assert loads == [b'{"id": 1}']
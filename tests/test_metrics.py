@@ -0,0 +1,22 @@
+from scrapers.metrics import MetricsRegistry, SiteMetrics, site_label
+
+
+def test_tenants_of_one_module_get_their_own_label():
+    detroit = site_label("scrapers.detroit", "https://detroit-vod.cablecast.tv/CablecastPublicSite")
+    other = site_label("scrapers.detroit", "https://TV.Example.gov/CablecastPublicSite")
+    assert detroit == "detroit:detroit-vod.cablecast.tv"
+    assert other == "detroit:tv.example.gov"
+
+
+def test_label_without_base_url_is_the_module():
+    assert site_label("scrapers.civicclerk") == "civicclerk"
+
+
+def test_every_prometheus_family_has_help_and_type():
+    registry = MetricsRegistry()
+    SiteMetrics("detroit:tv.example.gov", registry).count("items_found")
+    text = registry.to_prometheus()
+    for name in {line.split("{")[0].split(" ")[0] for line in text.splitlines() if not line.startswith("#")}:
+        assert f"# HELP {name} " in text
+        assert f"# TYPE {name} " in text
+    assert "# TYPE scraper_last_run_timestamp_seconds gauge" in text
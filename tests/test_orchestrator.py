@@ -0,0 +1,78 @@
+import asyncio
+from orchestrator import LazyBrowser, ScrapeOrchestrator
+from scrapers.registry import ScraperSpec
+
+
+class ListSink:
+    def __init__(self):
+        self.medias = []
+
+    def write(self, base_url, media):
+        self.medias.append(media)
+
+
+class FakeContext:
+    async def new_page(self):
+        return "page"
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeBrowserType:
+    def __init__(self):
+        self.launches = 0
+
+    async def launch(self, **options):
+        self.launches += 1
+        return self
+
+    async def new_context(self, **options):
+        return FakeContext()
+
+    async def close(self):
+        pass
+
+
+class HttpOnlyScraper:
+    def __init__(self, context, base_url, start_date=None, end_date=None):
+        self.base_url = base_url
+
+    async def scrape(self):
+        yield {"url": f"{self.base_url}/1", "title": "Meeting", "date": "2024-01-02", "source_type": "video"}
+
+
+class BrowserScraper(HttpOnlyScraper):
+    def __init__(self, context, base_url, start_date=None, end_date=None):
+        super().__init__(context, base_url)
+        self.context = context
+
+    async def scrape(self):
+        assert await self.context.new_page() == "page"
+        async for media in super().scrape():
+            yield media
+
+
+def _run(scraper_cls, monkeypatch):
+    spec = ScraperSpec(r"example\.gov", "unused", scraper_cls.__name__)
+    spec._cls = scraper_cls
+    monkeypatch.setattr("orchestrator.resolve", lambda base_url: spec)
+    browser_type = FakeBrowserType()
+    sink = ListSink()
+
+    async def run():
+        orchestrator = ScrapeOrchestrator(LazyBrowser(browser_type), None, None, sink)
+        return await orchestrator.run(["https://www.example.gov/media"])
+    summaries = asyncio.run(run())
+    return browser_type.launches, summaries[0]["count"]
+
+
+def test_http_only_scraper_never_launches_the_browser(monkeypatch):
+    assert _run(HttpOnlyScraper, monkeypatch) == (0, 1)
+
+
+def test_first_context_call_launches_the_browser(monkeypatch):
+    assert _run(BrowserScraper, monkeypatch) == (1, 1)
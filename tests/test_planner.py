@@ -0,0 +1,29 @@
+from planner import calendar_windows, plan_jobs, split_date_range
+
+DETROIT = "https://detroit-vod.cablecast.tv/CablecastPublicSite"
+LANSDALE = "https://www.lansdale.org/CivicMedia?CID=2024-Council-Meetings-26"
+
+
+def test_calendar_windows_share_boundary_days():
+    assert calendar_windows("2024-01-15", "2024-03-10") == [
+        ("2024-01-15", "2024-02-01"), ("2024-02-01", "2024-03-01"), ("2024-03-01", "2024-03-10")]
+    # 2024-01-01 is a Monday
+    assert calendar_windows("2024-01-03", "2024-01-10", "week") == [("2024-01-03", "2024-01-08"), ("2024-01-08", "2024-01-10")]
+
+
+def test_split_date_range_is_contiguous():
+    windows = split_date_range("2024-01-01", "2024-01-31", 3)
+    assert windows[0][0] == "2024-01-01" and windows[-1][1] == "2024-01-31"
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+    assert len(split_date_range("2024-01-01", "2024-01-02", 5)) == 1
+
+
+def test_only_windowed_scrapers_are_split():
+    jobs = plan_jobs([DETROIT, LANSDALE], "2024-01-15", "2024-03-10", window="month")
+    assert jobs.count((LANSDALE, "2024-01-15", "2024-03-10")) == 1
+    assert [job for job in jobs if job[0] == DETROIT] == [
+        (DETROIT, "2024-01-15", "2024-02-01"), (DETROIT, "2024-02-01", "2024-03-01"), (DETROIT, "2024-03-01", "2024-03-10")]
+
+
+def test_open_ranges_stay_single_jobs():
+    assert plan_jobs([DETROIT], None, None, window="month") == [(DETROIT, None, None)]
@@ -0,0 +1,58 @@
+import asyncio
+from scrapers.metrics import MetricsRegistry, SiteMetrics
+from scrapers.scroll import InfiniteScroll
+
+
+class FakeRequest:
+    def __init__(self, resource_type):
+        self.resource_type = resource_type
+
+
+class FakeResponse:
+    def __init__(self, url, resource_type, status=429):
+        self.url = url
+        self.request = FakeRequest(resource_type)
+        self.status = status
+
+
+class ThrottledPage:
+    """A page whose every scroll gets `response` back and renders nothing new."""
+
+    def __init__(self, response):
+        self.response = response
+        self.listeners = {}
+
+    def on(self, event, listener):
+        self.listeners[event] = listener
+
+    def remove_listener(self, event, listener):
+        del self.listeners[event]
+
+    async def evaluate(self, script, *args):
+        if script == "count":
+            return 0
+        self.listeners["response"](self.response)
+
+
+async def _scroll(page):
+    scroll = InfiniteScroll(page, "count", None, SiteMetrics("test", MetricsRegistry()),
+                            idle_limit=3, backoff=0, feed_url="/api/graphql/", scroll_js="scroll")
+    async with scroll:
+        # Every step scrolls and renders nothing
+        scroll._step = lambda: page.evaluate("scroll")
+        async for _ in scroll.counts():
+            pass
+    return scroll
+
+
+def test_throttled_side_assets_do_not_hold_off_idle(monkeypatch):
+    monkeypatch.setattr("scrapers.scroll.count", lambda page, selector: page.evaluate(selector))
+    scroll = asyncio.run(_scroll(ThrottledPage(FakeResponse("https://cdn.example/pixel.gif", "image"))))
+    assert (scroll.scrolls, scroll.backoffs) == (3, 0)
+
+
+def test_throttled_feed_stops_after_max_backoffs(monkeypatch):
+    monkeypatch.setattr("scrapers.scroll.count", lambda page, selector: page.evaluate(selector))
+    scroll = asyncio.run(_scroll(ThrottledPage(FakeResponse("https://www.facebook.com/api/graphql/", "xhr"))))
+    assert scroll.backoffs == scroll.max_backoffs
+    assert scroll.scrolls == scroll.max_backoffs + 1
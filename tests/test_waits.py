@@ -0,0 +1,32 @@
+import asyncio
+from scrapers.metrics import SiteMetrics, MetricsRegistry
+from scrapers.waits import Waits
+
+
+class FakePage:
+    """Records the timeout each evaluate was given and never satisfies the condition."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    async def evaluate(self, script, args):
+        self.timeouts.append(args[1])
+        return None
+
+
+def test_spent_budget_only_skips_optional_waits():
+    waits = Waits(SiteMetrics("test", MetricsRegistry()), budget=5)
+    waits.spent = 5
+    page = FakePage()
+    assert asyncio.run(waits.count_above(page, ".item", 3, timeout=2, optional=True)) is None
+    assert asyncio.run(waits.count_above(page, ".item", 3, timeout=2)) is None
+    assert page.timeouts == [1, 2000]
+
+
+def test_only_optional_timeouts_are_charged():
+    waits = Waits(SiteMetrics("test", MetricsRegistry()), budget=5)
+    page = FakePage()
+    asyncio.run(waits.until(page, "return null;", timeout=1))
+    assert waits.spent == 0
+    asyncio.run(waits.until(page, "return null;", timeout=1, optional=True))
+    assert waits.spent > 0
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+from selenium.common.exceptions import WebDriverException
+from scrapers import winchester
+from scrapers.winchester import WinchesterVAScraper
+
+
+class HangingDriver:
+    """A WebDriver whose page load never finishes until the driver is quit."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.quit_called = threading.Event()
+        self.get_returned = threading.Event()
+        HangingDriver.instances.append(self)
+
+    def get(self, url):
+        self.quit_called.wait(5)
+        self.get_returned.set()
+        raise WebDriverException("session deleted")
+
+    def quit(self):
+        self.quit_called.set()
+
+
+class FakeManager:
+    def install(self):
+        return "chromedriver"
+
+
+def test_timed_out_scrape_quits_its_driver(monkeypatch):
+    monkeypatch.setattr(winchester.webdriver, "Chrome", HangingDriver)
+    monkeypatch.setattr(winchester, "ChromeDriverManager", FakeManager)
+    monkeypatch.setattr(winchester, "Service", lambda path: None)
+    scraper = WinchesterVAScraper("2024-01-01", "2024-12-31", site_url="https://winchesterva.civicweb.net")
+    monkeypatch.setattr(scraper, "fetch_meetings", lambda start, end: [{"Id": 1}, {"Id": 2}])
+
+    async def consume():
+        return [media async for media in scraper.scrape()]
+
+    async def run():
+        try:
+            await asyncio.wait_for(consume(), timeout=0.5)
+        except asyncio.TimeoutError:
+            pass
+
+    asyncio.run(run())
+    driver, = HangingDriver.instances
+    assert driver.quit_called.wait(2)
+    assert driver.get_returned.wait(2)
+    assert scraper.cancelled.is_set()
@@ -0,0 +1,22 @@
+from workers import shard_jobs
+
+
+def _jobs(host, n):
+    return [(f"https://{host}/feed", f"2024-01-{day:02d}", f"2024-01-{day + 1:02d}") for day in range(1, n + 1)]
+
+
+def test_host_limit_holds_across_workers():
+    jobs = _jobs("a.example", 6) + _jobs("b.example", 2) + _jobs("c.example", 1)
+    shards = shard_jobs(jobs, workers=4, per_host_limit=2)
+    assert sorted(job for assigned, _ in shards for job in assigned) == sorted(jobs)
+    for host in ("a.example", "b.example", "c.example"):
+        holders = [limits[host] for assigned, limits in shards if host in limits]
+        assert len(holders) <= 2
+        assert sum(holders) <= 2
+        assert all(limit >= 1 for limit in holders)
+
+
+def test_idle_workers_get_no_shard():
+    shards = shard_jobs(_jobs("a.example", 3), workers=4, per_host_limit=1)
+    assert len(shards) == 1
+    assert shards[0][1] == {"a.example": 1}
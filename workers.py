@@ -0,0 +1,161 @@
+import asyncio
+import multiprocessing
+import queue
+from urllib.parse import urlparse
+from scrapers.checkpoints import media_key
+from scrapers.metrics import METRICS
+
+# Seconds between liveness checks while waiting on the result queue
+_POLL_INTERVAL = 1.0
+
+
+def shard_jobs(jobs, workers, per_host_limit):
+    """Assign (base_url, start, end) jobs to workers; returns [(jobs, host_limits)] per worker.
+
+    A host's jobs are spread over at most `per_host_limit` workers and each of
+    those workers gets a share of the limit, so the per-host cap still holds
+    across processes. Hosts are placed largest-first on the least loaded worker.
+    """
+    by_host = {}
+    for job in jobs:
+        by_host.setdefault(urlparse(job[0]).netloc.lower(), []).append(job)
+    shards = [([], {}) for _ in range(workers)]
+    for host, host_jobs in sorted(by_host.items(), key=lambda item: -len(item[1])):
+        spread = max(1, min(per_host_limit, len(host_jobs), workers))
+        targets = sorted(range(workers), key=lambda i: len(shards[i][0]))[:spread]
+        for n, index in enumerate(targets):
+            shards[index][0].extend(host_jobs[n::spread])
+            shards[index][1][host] = per_host_limit // spread + (1 if n < per_host_limit % spread else 0)
+    return [shard for shard in shards if shard[0]]
+
+
+class QueueSink:
+    """Sink used inside a worker: forwards every media to the parent process."""
+
+    def __init__(self, results):
+        self.results = results
+
+    def write(self, base_url, media):
+        self.results.put(("media", base_url, media))
+
+    def close(self):
+        pass
+
+
+async def _run_worker(worker_id, jobs, host_limits, options, results):
+    from playwright.async_api import async_playwright
+    from orchestrator import LazyBrowser, ScrapeOrchestrator
+    from scrapers.checkpoints import CheckpointStore
+    from scrapers.dedup import DedupIndex
+
+    checkpoint_path = options.pop("checkpoint", None)
+    checkpoints = CheckpointStore(checkpoint_path) if checkpoint_path else None
+    dedup_path = options.pop("dedup_index", None)
+    dedup = DedupIndex(dedup_path) if dedup_path else None
+    async with async_playwright() as p:
+        browser = LazyBrowser(p.chromium, headless=True)
+        orchestrator = ScrapeOrchestrator(browser, None, None, QueueSink(results),
+                                          checkpoints=checkpoints, dedup=dedup, host_limits=host_limits, **options)
+        try:
+            return await orchestrator.run(jobs)
+        finally:
+            if checkpoints:
+                checkpoints.close()
+            if dedup:
+                dedup.close()
+            if options.get("http_cache"):
+                options["http_cache"].report()
+            await browser.close()
+
+
+def _worker_main(worker_id, jobs, host_limits, options, results):
+    print(f"[Worker {worker_id}] {len(jobs)} jobs")
+    try:
+        summary = asyncio.run(_run_worker(worker_id, jobs, host_limits, options, results))
+        results.put(("done", worker_id, summary, METRICS.snapshot()))
+    except Exception as e:
+        results.put(("error", worker_id, repr(e)))
+
+
+class WorkerPool:
+    """Run scrape jobs in N worker processes, each with its own Playwright browser.
+
+    Workers stream medias back over a queue and the parent writes them to the
+    sink, so output files have a single writer. Medias repeated across date
+    windows of the same base_url are written once.
+
+    `options` are ScrapeOrchestrator keyword arguments plus `checkpoint` and
+    `dedup_index`, paths of the SQLite files each worker opens for itself.
+    An HttpCache or BrowserStateStore is only paths and settings, so it is
+    passed as is; workers share its files.
+    """
+
+    def __init__(self, workers, sink, per_host_limit, **options):
+        self.workers = workers
+        self.sink = sink
+        self.per_host_limit = per_host_limit
+        self.options = options
+        # Workers start from a fresh interpreter: no inherited browser handles or event loop
+        self._mp = multiprocessing.get_context("spawn")
+
+    def run(self, jobs):
+        """Scrape (base_url, start_date, end_date) jobs; returns per-job summaries from all workers."""
+        shards = shard_jobs(jobs, self.workers, self.per_host_limit)
+        results = self._mp.Queue()
+        processes = {}
+        for worker_id, (worker_jobs, host_limits) in enumerate(shards):
+            options = dict(self.options, per_host_limit=self.per_host_limit)
+            process = self._mp.Process(target=_worker_main, name=f"scrape-worker-{worker_id}",
+                                       args=(worker_id, worker_jobs, host_limits, options, results))
+            process.start()
+            processes[worker_id] = process
+        print(f"[WorkerPool] {len(jobs)} jobs on {len(processes)} workers")
+
+        seen = set()
+        summaries = []
+        pending = set(processes)
+        while pending:
+            try:
+                self._handle(results.get(timeout=_POLL_INTERVAL), seen, summaries, pending)
+                continue
+            except queue.Empty:
+                pass
+            # A worker that died without reporting (OOM kill, segfault) would otherwise hang the parent.
+            # Whatever a dead worker put on the queue is already in the pipe: take it all before giving up on it.
+            dead = [worker_id for worker_id in pending if not processes[worker_id].is_alive()]
+            while True:
+                try:
+                    self._handle(results.get_nowait(), seen, summaries, pending)
+                except queue.Empty:
+                    break
+            for worker_id in dead:
+                if worker_id not in pending:
+                    continue
+                exitcode = processes[worker_id].exitcode
+                if exitcode:
+                    print(f"[WorkerPool] Error: worker {worker_id} died with exit code {exitcode}; "
+                          f"its unfinished jobs have no summary")
+                else:
+                    print(f"[WorkerPool] Worker {worker_id} exited without reporting")
+                pending.discard(worker_id)
+        for process in processes.values():
+            process.join()
+        return summaries
+
+    def _handle(self, message, seen, summaries, pending):
+        kind = message[0]
+        if kind == "media":
+            _, base_url, media = message
+            key = (base_url, media_key(media))
+            if key in seen:
+                return
+            seen.add(key)
+            self.sink.write(base_url, media)
+        elif kind == "done":
+            summaries.extend(message[2])
+            # Metrics live in each worker's process; fold them into the parent's registry
+            METRICS.merge(message[3])
+            pending.discard(message[1])
+        elif kind == "error":
+            print(f"[WorkerPool] Worker {message[1]} failed: {message[2]}")
+            pending.discard(message[1])